@@ -0,0 +1,33 @@
+"""Add keyset pagination index on audit_logs
+
+Revision ID: add_audit_logs_keyset_index
+Revises: add_tenant_composite_indexes
+Create Date: 2025-09-23
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_audit_logs_keyset_index'
+down_revision = 'add_tenant_composite_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_tenant_created_id',
+            'audit_logs',
+            ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_audit_logs_tenant_created_id', table_name='audit_logs', postgresql_concurrently=True, if_exists=True)
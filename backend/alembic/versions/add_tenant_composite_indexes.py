@@ -0,0 +1,66 @@
+"""Add composite and partial indexes for tenant-scoped hot queries
+
+Revision ID: add_tenant_composite_indexes
+Revises: add_custom_fields
+Create Date: 2025-09-22
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_tenant_composite_indexes'
+down_revision = 'add_custom_fields'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Document list: active documents of a tenant, newest first
+        op.create_index(
+            'ix_documents_tenant_active_created',
+            'documents',
+            ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+        # Upload dedup by content hash
+        op.create_index(
+            'ix_documents_tenant_file_hash_active',
+            'documents',
+            ['tenant_id', 'file_hash'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+        # Permit list for operators/managers (own permits, newest first)
+        op.create_index(
+            'ix_work_permits_tenant_creator_created',
+            'work_permits',
+            ['tenant_id', 'created_by', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+        # Historical/similar permits lookup during analysis
+        op.create_index(
+            'ix_work_permits_tenant_type_status',
+            'work_permits',
+            ['tenant_id', 'work_type', 'status'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_work_permits_tenant_type_status', table_name='work_permits', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_work_permits_tenant_creator_created', table_name='work_permits', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_documents_tenant_file_hash_active', table_name='documents', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_documents_tenant_active_created', table_name='documents', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,34 @@
+"""Add keyset pagination index on work_permits
+
+Revision ID: add_work_permits_keyset_index
+Revises: partition_audit_logs_by_month
+Create Date: 2025-09-26
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_work_permits_keyset_index'
+down_revision = 'partition_audit_logs_by_month'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        # Permit list for admins (whole tenant, newest first)
+        op.create_index(
+            'ix_work_permits_tenant_created_id',
+            'work_permits',
+            ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_work_permits_tenant_created_id', table_name='work_permits', postgresql_concurrently=True, if_exists=True)
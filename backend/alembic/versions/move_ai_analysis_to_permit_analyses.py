@@ -0,0 +1,73 @@
+"""Move ai_analysis and action_items to versioned permit_analyses table
+
+Revision ID: move_ai_analysis_to_table
+Revises: add_audit_logs_keyset_index
+Create Date: 2025-09-24
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'move_ai_analysis_to_table'
+down_revision = 'add_audit_logs_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'permit_analyses',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('tenant_id', sa.Integer(), sa.ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('permit_id', sa.Integer(), sa.ForeignKey('work_permits.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        sa.Column('is_current', sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column('ai_version', sa.String(50), nullable=True),
+        sa.Column('analyzed_at', sa.DateTime(), nullable=True),
+        sa.Column('analysis', postgresql.JSONB(), nullable=True),
+        sa.Column('analysis_compressed', sa.LargeBinary(), nullable=True),
+        sa.Column('action_items', postgresql.JSONB(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('permit_id', 'version', name='_permit_analysis_version_uc')
+    )
+    op.create_index('ix_permit_analyses_id', 'permit_analyses', ['id'])
+    op.create_index('ix_permit_analyses_tenant_id', 'permit_analyses', ['tenant_id'])
+    op.create_index(
+        'ix_permit_analyses_current', 'permit_analyses', ['permit_id'],
+        unique=True, postgresql_where=sa.text('is_current')
+    )
+
+    # Copy existing results as version 1
+    op.execute("""
+        INSERT INTO permit_analyses
+            (tenant_id, permit_id, version, is_current, ai_version, analyzed_at, analysis, action_items)
+        SELECT tenant_id, id, 1, true, ai_version, analyzed_at,
+               ai_analysis::jsonb, COALESCE(action_items::jsonb, '[]'::jsonb)
+        FROM work_permits
+        WHERE ai_analysis IS NOT NULL AND ai_analysis::text NOT IN ('{}', 'null')
+    """)
+
+    op.drop_column('work_permits', 'action_items')
+    op.drop_column('work_permits', 'ai_analysis')
+
+
+def downgrade():
+    op.add_column('work_permits', sa.Column('ai_analysis', sa.JSON(), nullable=True))
+    op.add_column('work_permits', sa.Column('action_items', sa.JSON(), nullable=True))
+
+    # Restore current versions only (compressed payloads are not restorable in SQL)
+    op.execute("""
+        UPDATE work_permits wp
+        SET ai_analysis = pa.analysis::json,
+            action_items = pa.action_items::json
+        FROM permit_analyses pa
+        WHERE pa.permit_id = wp.id AND pa.is_current AND pa.analysis IS NOT NULL
+    """)
+
+    op.drop_index('ix_permit_analyses_current', table_name='permit_analyses')
+    op.drop_index('ix_permit_analyses_tenant_id', table_name='permit_analyses')
+    op.drop_index('ix_permit_analyses_id', table_name='permit_analyses')
+    op.drop_table('permit_analyses')
@@ -0,0 +1,140 @@
+"""Partition audit_logs by month on created_at
+
+Revision ID: partition_audit_logs_by_month
+Revises: move_ai_analysis_to_table
+Create Date: 2025-09-25
+
+"""
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'partition_audit_logs_by_month'
+down_revision = 'move_ai_analysis_to_table'
+branch_labels = None
+depends_on = None
+
+
+LEGACY_INDEXES = [
+    'ix_audit_logs_id',
+    'ix_audit_logs_action',
+    'ix_audit_logs_created_at',
+    'ix_audit_logs_tenant_id',
+    'ix_audit_logs_tenant_created_id',
+]
+
+COLUMNS = (
+    "id, tenant_id, user_id, username, session_id, action, resource_type, resource_id, "
+    "resource_name, old_values, new_values, extra_data, ip_address, user_agent, api_endpoint, "
+    "severity, category, created_at"
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade():
+    conn = op.get_bind()
+
+    # Keep the old table aside, freeing its index, constraint and sequence names
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_legacy")
+    op.execute("ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey")
+    for index_name in LEGACY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE")
+
+    # The partition key must be part of the primary key
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq'),
+            tenant_id INTEGER NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+            user_id INTEGER REFERENCES users(id),
+            username VARCHAR(100),
+            session_id VARCHAR(255),
+            action VARCHAR(100) NOT NULL,
+            resource_type VARCHAR(100) NOT NULL,
+            resource_id INTEGER,
+            resource_name VARCHAR(255),
+            old_values JSON,
+            new_values JSON,
+            extra_data JSON,
+            ip_address INET,
+            user_agent TEXT,
+            api_endpoint VARCHAR(255),
+            severity VARCHAR(20),
+            category VARCHAR(50),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    # Indexes on the parent are created on every partition, current and future
+    op.execute("CREATE INDEX ix_audit_logs_tenant_created_id ON audit_logs (tenant_id, created_at DESC, id DESC)")
+    op.execute("CREATE INDEX ix_audit_logs_tenant_action_created ON audit_logs (tenant_id, action, created_at DESC)")
+    op.execute("CREATE INDEX ix_audit_logs_tenant_user_created ON audit_logs (tenant_id, user_id, created_at DESC)")
+
+    # One partition per month from the oldest row to three months ahead
+    oldest = conn.execute(sa.text("SELECT MIN(created_at) FROM audit_logs_legacy")).scalar()
+    current_month = date.today().replace(day=1)
+    month = (oldest or datetime.utcnow()).date().replace(day=1)
+    last_month = _add_months(current_month, 3)
+    while month <= last_month:
+        next_month = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE audit_logs_p{month:%Y%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_legacy")
+    op.execute("DROP TABLE audit_logs_legacy")
+
+
+def downgrade():
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute("ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey")
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY NONE")
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_tenant_created_id")
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_tenant_action_created")
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_tenant_user_created")
+
+    op.execute("""
+        CREATE TABLE audit_logs (
+            id INTEGER NOT NULL DEFAULT nextval('audit_logs_id_seq') PRIMARY KEY,
+            tenant_id INTEGER NOT NULL REFERENCES tenants(id) ON DELETE CASCADE,
+            user_id INTEGER REFERENCES users(id),
+            username VARCHAR(100),
+            session_id VARCHAR(255),
+            action VARCHAR(100) NOT NULL,
+            resource_type VARCHAR(100) NOT NULL,
+            resource_id INTEGER,
+            resource_name VARCHAR(255),
+            old_values JSON,
+            new_values JSON,
+            extra_data JSON,
+            ip_address INET,
+            user_agent TEXT,
+            api_endpoint VARCHAR(255),
+            severity VARCHAR(20),
+            category VARCHAR(50),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW()
+        )
+    """)
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    op.execute(f"INSERT INTO audit_logs ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs_partitioned")
+    op.execute("DROP TABLE audit_logs_partitioned CASCADE")
+
+    op.create_index('ix_audit_logs_id', 'audit_logs', ['id'])
+    op.create_index('ix_audit_logs_action', 'audit_logs', ['action'])
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'])
+    op.create_index('ix_audit_logs_tenant_id', 'audit_logs', ['tenant_id'])
+    op.create_index(
+        'ix_audit_logs_tenant_created_id',
+        'audit_logs',
+        ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
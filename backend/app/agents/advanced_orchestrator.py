@@ -5,10 +5,20 @@ Direct orchestrator with risk analysis and specialist coordination
 
 import asyncio
 from typing import Dict, Any, List, Optional
+import logging
 import time
 from datetime import datetime
 
-from .specialists import get_all_specialists
+from app.config.settings import settings
+from app.core.metrics import (
+    ORCHESTRATOR_STEP_DURATION, SPECIALIST_DURATION, SPECIALIST_ERRORS, SPECULATION_OUTCOMES, tenant_label
+)
+from app.core.profiling import annotate_profile
+from app.core.tracing import span, traced
+from .specialists import get_shared_specialists
+
+
+logger = logging.getLogger(__name__)
 
 
 class AdvancedHSEOrchestrator:
@@ -24,24 +34,13 @@ class AdvancedHSEOrchestrator:
         vector_service=None
     ):
         self.user_context = user_context or {}
+        # Handed to the specialists through the analysis context, never set on them
         self.vector_service = vector_service
-        self.specialists = get_all_specialists()
-        print(f"[AdvancedOrchestrator] Available specialists: {list(self.specialists.keys())}")
-        
+        # Shared, frozen instances: construction costs nothing per request
+        self.specialists = get_shared_specialists()
         self.unified_risk_classifier = self.specialists.get("unified_risk_classifier")
-        print(f"[AdvancedOrchestrator] Unified Risk Classifier initialized: {self.unified_risk_classifier is not None}")
-        if self.unified_risk_classifier:
-            print(f"[AdvancedOrchestrator] Unified Risk Classifier type: {type(self.unified_risk_classifier)}")
-        
-        
-        # Inject vector service into all specialists
-        if vector_service:
-            for specialist in self.specialists.values():
-                specialist.vector_service = vector_service
-            print(f"[AdvancedOrchestrator] Injected vector service into {len(self.specialists)} specialists")
-        
-        print(f"[AdvancedOrchestrator] Initialized with simplified 2-step process")
     
+    @traced("orchestrator.analyze_permit_advanced")
     async def analyze_permit_advanced(
         self, 
         permit_data: Dict[str, Any], 
@@ -64,12 +63,18 @@ class AdvancedHSEOrchestrator:
         
         # Initialize step timing tracking
         step_timings = {}
+        # Shared dict: a profiled request stores the timings with its profile, even partial ones
+        annotate_profile(step_timings=step_timings)
+        tenant = tenant_label(self.user_context.get("tenant_id"))
+        # Step 2 work started while the classifier runs (settings.analysis_speculation)
+        speculation = {"mode": settings.analysis_speculation, "documents": {}, "analyses": {}}
         
         try:
-            print(f"\n[AdvancedOrchestrator] Starting simplified 2-step analysis for permit {permit_data.get('id')}")
+            self._start_speculation(speculation, permit_data, permit_metadata, context_documents)
+            logger.debug("Starting simplified 2-step analysis for permit %s", permit_data.get('id'))
 
             # STEP 1: Work permit risk analysis with unified risk classifier
-            print("[AdvancedOrchestrator] STEP 1: Work permit risk analysis with unified risk classifier")
+            logger.debug("STEP 1: Work permit risk analysis with unified risk classifier")
             step1_start = time.time()
             classification_result = await self._step1_risk_analysis(
                 permit_data, 
@@ -77,29 +82,33 @@ class AdvancedHSEOrchestrator:
                 context_documents
             )
             step_timings["step1_risk_analysis"] = round(time.time() - step1_start, 2)
-            print(f"[AdvancedOrchestrator] STEP 1 completed in {step_timings['step1_risk_analysis']}s")
+            ORCHESTRATOR_STEP_DURATION.labels("step1_risk_analysis", tenant).observe(time.time() - step1_start)
+            logger.info("STEP 1 completed in %ss", step_timings['step1_risk_analysis'])
             
             if not classification_result.get("classification_complete"):
                 return self._create_error_result("Step 1 - Risk analysis failed", start_time)
             
             # STEP 2: Specialist agent selection and interaction
-            print("[AdvancedOrchestrator] STEP 2: Specialist agent selection and interaction")
+            logger.debug("STEP 2: Specialist agent selection and interaction")
             step2_start = time.time()
             specialists_to_run = classification_result.get("specialists_to_activate", [])
-            print(f"  Selected specialists: {specialists_to_run}")
+            logger.debug("Selected specialists: %s", specialists_to_run)
+            self._settle_speculation(speculation, specialists_to_run)
             
             specialist_results = await self._step2_specialist_interaction(
                 permit_data,
                 permit_metadata,
                 classification_result,
                 specialists_to_run,
-                context_documents
+                context_documents,
+                speculation
             )
             step_timings["step2_specialist_analysis"] = round(time.time() - step2_start, 2)
-            print(f"[AdvancedOrchestrator] STEP 2 completed in {step_timings['step2_specialist_analysis']}s")
+            ORCHESTRATOR_STEP_DURATION.labels("step2_specialist_analysis", tenant).observe(time.time() - step2_start)
+            logger.info("STEP 2 completed in %ss", step_timings['step2_specialist_analysis'])
             
             # STEP 2 COMPLETE: Build final result directly from specialist results
-            print("[AdvancedOrchestrator] Building final result directly from specialist results")
+            logger.debug("Building final result directly from specialist results")
             step4_start = time.time()
             final_result = self._build_final_result(
                 permit_data,
@@ -112,23 +121,99 @@ class AdvancedHSEOrchestrator:
                 step_timings
             )
             step_timings["final_output_generation"] = round(time.time() - step4_start, 2)
-            print(f"[AdvancedOrchestrator] Final output generation completed in {step_timings['final_output_generation']}s")
+            ORCHESTRATOR_STEP_DURATION.labels("final_output_generation", tenant).observe(time.time() - step4_start)
+            ORCHESTRATOR_STEP_DURATION.labels("total", tenant).observe(time.time() - start_time)
+            logger.info("Final output generation completed in %ss", step_timings['final_output_generation'])
 
             total_time = round(time.time() - start_time, 2)
-            print(f"[AdvancedOrchestrator] Simplified 2-step analysis completed in {total_time}s")
-            print(f"[AdvancedOrchestrator] Step breakdown: {step_timings}")
+            logger.info("Simplified 2-step analysis completed in %ss", total_time)
+            logger.debug("Step breakdown: %s", step_timings)
             
             return final_result
             
         except Exception as e:
-            print(f"[AdvancedOrchestrator] Error during simplified analysis: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error during simplified analysis: %s", e)
 
             # Enhanced error tracking to identify which step failed
             error_context = f"Error in permit {permit_data.get('id', 'unknown')}: {str(e)}"
             return self._create_error_result(error_context, start_time)
+        
+        finally:
+            # Step 1 failed or returned early: drop whatever is still speculating
+            for task in [*speculation["documents"].values(), *speculation["analyses"].values()]:
+                if not task.done():
+                    task.cancel()
+    
+    def _start_speculation(
+        self,
+        speculation: Dict[str, Any],
+        permit_data: Dict[str, Any],
+        permit_metadata: Dict[str, Any],
+        context_documents: List[Dict[str, Any]]
+    ):
+        """
+        Start step 2 work for the specialists whose keyword prior reaches
+        analysis_speculation_min_prior, in parallel with the classifier:
+        - "documents": their document searches (consumed via the "document_prefetch" context)
+        - "full": their whole analysis; risk specialists do not read the
+          classification, so the speculative result is the one step 2 would produce
+        The DPI evaluator needs the classification but is always activated:
+        only its document search is prefetched, in both modes.
+        Tasks are registered in speculation as they start, so the caller can
+        cancel them even if this raises halfway.
+        """
+        mode = speculation["mode"]
+        if mode not in ("documents", "full") or not self.unified_risk_classifier:
+            return
+        
+        priors = self.unified_risk_classifier.keyword_priors(permit_data)
+        predicted = [name for name, prior in priors.items() if prior >= settings.analysis_speculation_min_prior]
+        document_context = {"user_context": self.user_context, "vector_service": self.vector_service}
+        
+        for name in predicted + ["dpi_evaluator"]:
+            specialist = self.specialists.get(name)
+            if specialist is None:
+                continue
+            if mode == "full" and name != "dpi_evaluator":
+                speculation["analyses"][name] = asyncio.create_task(
+                    self._run_specialist_with_document_control(
+                        specialist, permit_data, permit_metadata, {}, context_documents
+                    ),
+                    name=f"speculative-{name}"
+                )
+            else:
+                speculation["documents"][name] = asyncio.create_task(
+                    specialist.fetch_specialized_documents(permit_data, document_context),
+                    name=f"prefetch-{name}"
+                )
+        
+        logger.debug("Speculation (%s) started for %s, priors %s", mode, predicted, priors)
     
+    def _settle_speculation(self, speculation: Dict[str, Any], specialists_to_run: List[str]):
+        """Cancel the speculations the classifier rejected and count the outcomes"""
+        mode = speculation["mode"]
+        if mode not in ("documents", "full"):
+            return
+        
+        activated = {name.replace("_specialist", "") for name in specialists_to_run}
+        outcome = {"used": [], "discarded": [], "missed": []}
+        for kind in ("documents", "analyses"):
+            for name, task in list(speculation[kind].items()):
+                if name in activated:
+                    outcome["used"].append(name)
+                else:
+                    task.cancel()
+                    del speculation[kind][name]
+                    outcome["discarded"].append(name)
+        outcome["missed"] = sorted(activated - set(outcome["used"]))
+        
+        for result, names in outcome.items():
+            for name in names:
+                SPECULATION_OUTCOMES.labels(mode, name, result).inc()
+        annotate_profile(speculation=outcome)
+        logger.info("Speculation (%s): used %s, discarded %s, missed %s", mode, outcome["used"], outcome["discarded"], outcome["missed"])
+    
+    @traced("orchestrator.step1_risk_analysis")
     async def _step1_risk_analysis(
         self,
         permit_data: Dict[str, Any],
@@ -140,19 +225,20 @@ class AdvancedHSEOrchestrator:
         Read all permit fields, identify declared and undeclared risks using risk classifier
         """
 
-        print(f"[AdvancedOrchestrator] Starting risk analysis for permit {permit_data.get('id')}")
+        logger.debug("Starting risk analysis for permit %s", permit_data.get('id'))
 
         # Validate permit data before analysis
         try:
             self._validate_permit_data(permit_data)
         except Exception as e:
-            print(f"[AdvancedOrchestrator] Permit data validation failed: {e}")
+            logger.warning("Permit data validation failed: %s", e)
             raise ValueError(f"Invalid permit data for permit {permit_data.get('id', 'unknown')}: {e}")
 
         # Build enhanced context with full permit analysis
         enhanced_context = {
             "documents": context_documents,
             "user_context": self.user_context,
+            "vector_service": self.vector_service,
             "permit_metadata": permit_metadata,
             "historical_risks": permit_metadata.get("historical_risks", []),
             "previous_incidents": permit_metadata.get("previous_incidents", []),
@@ -161,41 +247,40 @@ class AdvancedHSEOrchestrator:
         }
         
         # COMPREHENSIVE PERMIT ANALYSIS - Read all fields
-        print(f"[AdvancedOrchestrator] Reading all permit fields for comprehensive analysis:")
-        print(f"  - Title: {permit_data.get('title', 'N/A')}")
-        print(f"  - Description: {permit_data.get('description', 'N/A')}")
-        print(f"  - Work Type: {permit_data.get('work_type', 'N/A')}")
-        print(f"  - Location: {permit_data.get('location', 'N/A')}")
-        print(f"  - Existing DPI: {permit_data.get('dpi_required', [])}")
-        print(f"  - Existing Actions: {permit_data.get('risk_mitigation_actions', [])}")
-        print(f"  - Custom Fields: {permit_data.get('custom_fields', {})}")
+        logger.debug(
+            "Reading all permit fields for comprehensive analysis: title=%r work_type=%r location=%r "
+            "description=%r existing_dpi=%s existing_actions=%s custom_fields=%s",
+            permit_data.get('title', 'N/A'), permit_data.get('work_type', 'N/A'), permit_data.get('location', 'N/A'),
+            permit_data.get('description', 'N/A'), permit_data.get('dpi_required', []),
+            permit_data.get('risk_mitigation_actions', []), permit_data.get('custom_fields', {})
+        )
         
         # Use Unified Risk Classifier for intelligent risk detection and specialist activation
         unified_analysis_result = None
-        print(f"[AdvancedOrchestrator] DEBUG: unified_risk_classifier is {type(self.unified_risk_classifier) if self.unified_risk_classifier else 'None'}")
+        logger.debug("unified_risk_classifier is %s", type(self.unified_risk_classifier) if self.unified_risk_classifier else 'None')
         if self.unified_risk_classifier:
-            print(f"[AdvancedOrchestrator] Using Unified Risk Classifier for intelligent risk detection and specialist activation")
+            logger.debug("Using Unified Risk Classifier for intelligent risk detection and specialist activation")
             unified_analysis_result = await self.unified_risk_classifier.analyze(permit_data, enhanced_context)
             
             # Extract risk information from unified analysis result
             detected_risks = unified_analysis_result.get("detected_risks", {})
             identified_risks = unified_analysis_result.get("identified_risks_for_specialists", [])
             
-            print(f"  [UnifiedRiskClassifier] Detected {len(detected_risks)} risks: {list(detected_risks.keys())}")
-            print(f"  [UnifiedRiskClassifier] {len(identified_risks)} risks for specialists")
+            logger.debug("[UnifiedRiskClassifier] Detected %s risks: %s", len(detected_risks), list(detected_risks.keys()))
+            logger.debug("[UnifiedRiskClassifier] %s risks for specialists", len(identified_risks))
             
             # Log risk combinations if any
             risk_combinations = unified_analysis_result.get("risk_combinations", [])
             if risk_combinations:
-                print(f"  [UnifiedRiskClassifier] Found {len(risk_combinations)} critical risk combinations")
+                logger.debug("[UnifiedRiskClassifier] Found %s critical risk combinations", len(risk_combinations))
                 for combo in risk_combinations:
-                    print(f"    - {combo.get('severity', '').upper()}: {combo.get('description', '')}")
+                    logger.debug("Critical combination %s: %s", combo.get('severity', '').upper(), combo.get('description', ''))
         else:
-            print("[AdvancedOrchestrator] ERROR: Unified Risk Classifier not available")
+            logger.error("Unified Risk Classifier not available")
             return {"classification_complete": False, "error": "Unified Risk Classifier not initialized"}
         
         # Build classification result using Unified Risk Classifier results
-        print(f"[AdvancedOrchestrator] STEP 1: Building classification from Unified Risk Classifier")
+        logger.debug("STEP 1: Building classification from Unified Risk Classifier")
         
         # Add evaluation of existing DPI and mitigation actions
         existing_dpi = permit_data.get('dpi_required', [])
@@ -203,7 +288,7 @@ class AdvancedHSEOrchestrator:
         
         # COMPLETENESS EVALUATION
         completeness_score = self._evaluate_permit_completeness(permit_data)
-        print(f"[AdvancedOrchestrator] Permit completeness score: {completeness_score}/10")
+        logger.debug("Permit completeness score: %s/10", completeness_score)
         
         classification = {
             "permit_completeness": {
@@ -214,7 +299,7 @@ class AdvancedHSEOrchestrator:
         }
         
         if existing_dpi or existing_actions:
-            print(f"[AdvancedOrchestrator] Found existing DPI: {len(existing_dpi)} items, Actions: {len(existing_actions)} items")
+            logger.debug("Found existing DPI: %s items, Actions: %s items", len(existing_dpi), len(existing_actions))
             classification["existing_measures"] = {
                 "dpi_provided": existing_dpi,
                 "actions_provided": existing_actions,
@@ -224,9 +309,9 @@ class AdvancedHSEOrchestrator:
         # Get specialists to activate from Unified Risk Classifier results
         if unified_analysis_result and unified_analysis_result.get("specialists_to_activate"):
             specialists_to_activate = unified_analysis_result["specialists_to_activate"]
-            print(f"[AdvancedOrchestrator] Unified Risk Classifier recommends {len(specialists_to_activate)} specialists: {specialists_to_activate}")
+            logger.debug("Unified Risk Classifier recommends %s specialists: %s", len(specialists_to_activate), specialists_to_activate)
         else:
-            print("[AdvancedOrchestrator] Warning: No Unified Risk Classifier results, using mechanical and DPI evaluator")
+            logger.warning("No Unified Risk Classifier results, using mechanical and DPI evaluator")
             specialists_to_activate = ["mechanical", "dpi_evaluator"]
         
         total_risks = 0
@@ -234,7 +319,7 @@ class AdvancedHSEOrchestrator:
             detected_risks = unified_analysis_result.get("detected_risks", {})
             total_risks = len(detected_risks)
         
-        print(f"[AdvancedOrchestrator] STEP 1 Complete - Identified {total_risks} risk types, activating {len(specialists_to_activate)} specialists")
+        logger.info("STEP 1 Complete - Identified %s risk types, activating %s specialists", total_risks, len(specialists_to_activate))
         
         classification["specialists_to_activate"] = specialists_to_activate
         classification["classification_complete"] = True
@@ -258,13 +343,15 @@ class AdvancedHSEOrchestrator:
         
         return classification
     
+    @traced("orchestrator.step2_specialist_interaction")
     async def _step2_specialist_interaction(
         self,
         permit_data: Dict[str, Any],
         permit_metadata: Dict[str, Any],
         classification: Dict[str, Any],
         specialists_to_run: List[str],
-        context_documents: List[Dict[str, Any]]
+        context_documents: List[Dict[str, Any]],
+        speculation: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         STEP 2: Specialist agent selection and interaction
@@ -275,6 +362,7 @@ class AdvancedHSEOrchestrator:
         
         results = {}
         tasks = []
+        speculation = speculation or {"documents": {}, "analyses": {}}
         
         # Map available specialist types according to requirements
         specialist_mapping = {
@@ -293,20 +381,26 @@ class AdvancedHSEOrchestrator:
             
             specialist = self.specialists.get(clean_name)
             if specialist and specialist.name != "Risk_Classifier":
-                # All specialists use standard document control - DPI gets risk info from classification
-                task = self._run_specialist_with_document_control(
-                    specialist,
-                    permit_data,
-                    permit_metadata,
-                    classification,
-                    context_documents
-                )
+                if clean_name in speculation["analyses"]:
+                    # Already running since step 1
+                    task = speculation["analyses"][clean_name]
+                else:
+                    # All specialists use standard document control - DPI gets risk info from classification
+                    prefetch = speculation["documents"].get(clean_name)
+                    task = self._run_specialist_with_document_control(
+                        specialist,
+                        permit_data,
+                        permit_metadata,
+                        classification,
+                        context_documents,
+                        document_prefetch={specialist.name: prefetch} if prefetch else None
+                    )
                 tasks.append((specialist.name, task))
-                print(f"  Activating: {specialist_mapping.get(clean_name, specialist.name)}")
+                logger.debug("Activating: %s", specialist_mapping.get(clean_name, specialist.name))
         
         # Execute specialists with interaction capability
         if tasks:
-            print(f"  Running {len(tasks)} specialists with document control and interaction...")
+            logger.debug("Running %s specialists with document control and interaction...", len(tasks))
             specialist_outputs = await asyncio.gather(
                 *[task for _, task in tasks],
                 return_exceptions=True
@@ -315,12 +409,12 @@ class AdvancedHSEOrchestrator:
             for i, (name, _) in enumerate(tasks):
                 if not isinstance(specialist_outputs[i], Exception):
                     results[name] = specialist_outputs[i]
-                    print(f"    ✓ {name} completed with document verification")
+                    logger.debug("✓ %s completed with document verification", name)
                 else:
-                    print(f"    ✗ {name} failed: {specialist_outputs[i]}")
+                    logger.warning("✗ %s failed: %s", name, specialist_outputs[i])
                     results[name] = {"error": str(specialist_outputs[i])}
             
-        print(f"[AdvancedOrchestrator] STEP 2 Complete - {len(results)} specialists provided analysis")
+        logger.info("STEP 2 Complete - %s specialists provided analysis", len(results))
         return results
     
     async def _run_specialist_with_document_control(
@@ -329,7 +423,8 @@ class AdvancedHSEOrchestrator:
         permit_data: Dict[str, Any],
         permit_metadata: Dict[str, Any],
         classification: Dict[str, Any],
-        context_documents: List[Dict[str, Any]]
+        context_documents: List[Dict[str, Any]],
+        document_prefetch: Optional[Dict[str, asyncio.Task]] = None
     ) -> Dict[str, Any]:
         """
         Run specialist with mandatory document control and external API access
@@ -342,6 +437,8 @@ class AdvancedHSEOrchestrator:
         context = {
             "classification": classification,
             "user_context": self.user_context,
+            "vector_service": self.vector_service,
+            "document_prefetch": document_prefetch or {},
             "documents": context_documents,
             "permit_metadata": permit_metadata,
             "equipment_list": permit_metadata.get("equipment_list", []),
@@ -358,11 +455,18 @@ class AdvancedHSEOrchestrator:
         }
         
         # Run specialist analysis with enhanced context
+        specialist_start = time.time()
         try:
-            result = await specialist.analyze(permit_data, context)
+            with span("specialist.analyze", specialist=specialist.name):
+                result = await specialist.analyze(permit_data, context)
+            outcome = "error" if result.get("error") else "success"
+            if result.get("error"):
+                SPECIALIST_ERRORS.labels(specialist.name, result.get("error_category") or result.get("error_type") or "error").inc()
         except Exception as e:
+            outcome = "exception"
+            SPECIALIST_ERRORS.labels(specialist.name, type(e).__name__).inc()
             error_msg = f"Specialist {specialist.name} analysis failed: {str(e)}"
-            print(f"[AdvancedOrchestrator] {error_msg}")
+            logger.warning(error_msg)
             
             # Return structured error response with actual error details
             result = {
@@ -375,11 +479,12 @@ class AdvancedHSEOrchestrator:
                 "dpi_requirements": [],
                 "ai_analysis_used": False
             }
+        SPECIALIST_DURATION.labels(specialist.name, outcome).observe(time.time() - specialist_start)
         
         # Verify document citations are present - MANDATORY for all specialists
         if not result.get("citations") and not result.get("error"):
             result["warning"] = "Specialist did not provide required document citations"
-            print(f"[{self.__class__.__name__}] WARNING: {specialist.name} did not provide citations for document traceability")
+            logger.warning("%s did not provide citations for document traceability", specialist.name)
 
         # Validate Weaviate usage - MANDATORY for all specialists before suggesting actions
         elif result.get("citations") and not result.get("error"):
@@ -389,9 +494,9 @@ class AdvancedHSEOrchestrator:
 
                 if weaviate_validation["compliance"] == "NON_COMPLIANT":
                     result["warning"] = weaviate_validation["warning"]
-                    print(f"[{self.__class__.__name__}] WEAVIATE WARNING: {specialist.name} - {weaviate_validation['warning']}")
+                    logger.warning("WEAVIATE WARNING: %s - %s", specialist.name, weaviate_validation['warning'])
                 else:
-                    print(f"[{self.__class__.__name__}] WEAVIATE ✅: {specialist.name} used {weaviate_validation['weaviate_count']} Weaviate documents")
+                    logger.debug("WEAVIATE ✅: %s used %s Weaviate documents", specialist.name, weaviate_validation['weaviate_count'])
         
         # Add metadata enhancements
         if permit_metadata.get("site_specific_controls"):
@@ -569,7 +674,7 @@ class AdvancedHSEOrchestrator:
     
     def _create_citations(self, context_documents: List[Dict[str, Any]], permit_metadata: Dict[str, Any]) -> Dict[str, List]:
         """Create comprehensive citations from context documents"""
-        print(f"[AdvancedOrchestrator] Creating citations from {len(context_documents)} documents")
+        logger.debug("Creating citations from %s documents", len(context_documents))
         
         normative_citations = []
         internal_citations = []
@@ -615,7 +720,7 @@ class AdvancedHSEOrchestrator:
             historical_count = len(permit_metadata["previous_permits"])
             is_recurrent = historical_count >= 2
             
-            print(f"[AdvancedOrchestrator] Found {historical_count} historical permits - Work is {'RECURRENT' if is_recurrent else 'NON-RECURRENT'}")
+            logger.debug("Found %s historical permits - Work is %s", historical_count, 'RECURRENT' if is_recurrent else 'NON-RECURRENT')
             
             # Add recurrence analysis to permit metadata
             permit_metadata["recurrence_analysis"] = {
@@ -658,8 +763,8 @@ class AdvancedHSEOrchestrator:
         # Count sources for logging
         weaviate_count = sum(1 for docs in [normative_citations, internal_citations] for doc in docs if doc["document_info"]["source"] == "Weaviate")
 
-        print(f"[AdvancedOrchestrator] Generated citations: {len(result['normative'])} normative, {len(result['internal'])} internal, {len(result['metadata'])} metadata")
-        print(f"[AdvancedOrchestrator] Source distribution: {weaviate_count} Weaviate documents")
+        logger.debug("Generated citations: %s normative, %s internal, %s metadata", len(result['normative']), len(result['internal']), len(result['metadata']))
+        logger.debug("Source distribution: %s Weaviate documents", weaviate_count)
         return result
     
     
@@ -740,7 +845,7 @@ class AdvancedHSEOrchestrator:
             except (ValueError, TypeError):
                 raise ValueError(f"workers_count must be a valid number, got: {permit_data['workers_count']}")
 
-        print(f"[AdvancedOrchestrator] Permit data validation passed for permit {permit_data['id']}")
+        logger.debug("Permit data validation passed for permit %s", permit_data['id'])
 
 
 
@@ -757,7 +862,7 @@ class AdvancedHSEOrchestrator:
     ) -> Dict[str, Any]:
         """Build final result from specialist and DPI results"""
 
-        print("[AdvancedOrchestrator] Building final result from specialists and DPI")
+        logger.debug("Building final result from specialists and DPI")
 
         # Extract actions directly from specialists
         all_actions = []
@@ -767,7 +872,7 @@ class AdvancedHSEOrchestrator:
         for specialist_name, result in specialist_results.items():
             if "error" not in result:
                 recommended_actions = result.get("recommended_actions", [])
-                print(f"[AdvancedOrchestrator] {specialist_name}: {len(recommended_actions)} actions")
+                logger.debug("%s: %s actions", specialist_name, len(recommended_actions))
 
                 for action in recommended_actions:
                     if isinstance(action, dict):
@@ -853,7 +958,7 @@ class AdvancedHSEOrchestrator:
             "ai_version": "Advanced-Final-1.0"
         }
 
-        print(f"[AdvancedOrchestrator] Final result: {total_actions} actions, {total_dpi} DPI from {len(specialist_results)} specialists")
+        logger.debug("Final result: %s actions, %s DPI from %s specialists", total_actions, total_dpi, len(specialist_results))
         return final_result
     
     def _calculate_ai_usage_statistics(self, specialist_results: Dict[str, Any]) -> Dict[str, Any]:
@@ -3,8 +3,10 @@ AI-Powered Work Analysis Agent
 Uses AI to recognize work types, generate searches, and suggest PPE/actions
 """
 from typing import Dict, Any, List, Optional
-import google.generativeai as genai
 from app.config.settings import settings
+from app.core.lazy import lazy_import
+
+genai = lazy_import("google.generativeai")
 
 
 class AIWorkAnalyzer:
@@ -3,19 +3,43 @@ Base Agent Class for HSE Analysis System
 """
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
-import google.generativeai as genai
-from app.config.settings import settings
+import logging
+import re
+import time
+from app.core.metrics import LLM_CALL_DURATION, record_llm_usage
+from app.core.tracing import span
+from app.services.llm_provider import get_llm_provider
+
+
+logger = logging.getLogger(__name__)
+
+# [FONTE: Documento Aziendale] Nome Documento
+CITATION_PATTERN = re.compile(r'\[FONTE:\s*Documento\s+Aziendale\]\s*([^\n\.,]+)', re.IGNORECASE)
 
 
 class BaseHSEAgent(ABC):
-    """Base class for all HSE specialist agents"""
+    """
+    Base class for all HSE specialist agents.
+    Instances are shared across requests (see specialists.get_shared_specialists):
+    per-request state such as the vector service travels in the analysis context.
+    """
     
     def __init__(self, name: str, specialization: str, activation_keywords: list = None):
         self.name = name
         self.specialization = specialization
         self.activation_keywords = activation_keywords or []
         self.system_message = self._get_system_message()
-        self.vector_service = None  # Will be injected by orchestrator
+    
+    def freeze(self):
+        """Reject attribute assignment from now on (shared instance)"""
+        object.__setattr__(self, "_frozen", True)
+    
+    def __setattr__(self, name: str, value: Any):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                f"{self.name} is shared across requests: pass '{name}' through the analysis context"
+            )
+        super().__setattr__(name, value)
         
     @abstractmethod
     def _get_system_message(self) -> str:
@@ -41,8 +65,9 @@ class BaseHSEAgent(ABC):
         return self.specialization.lower() in [d.lower() for d in risk_domains.keys()]
     
     async def get_gemini_response(self, prompt: str, context_documents: list = None) -> str:
-        """Get response from Gemini API with optional document context"""
-        if not settings.gemini_api_key:
+        """Get response from the configured LLM provider with optional document context"""
+        provider = get_llm_provider()
+        if not provider.available:
             return f"[{self.name}] Error: No Gemini API key configured"
         
         # Add limit instruction to the prompt for specialists and agents
@@ -50,9 +75,6 @@ class BaseHSEAgent(ABC):
             prompt += f"\n\nIMPORTANTE: Limita ogni categoria di raccomandazioni a MASSIMO 10 elementi. Sii conciso e prioritizza le azioni più critiche."
             
         try:
-            genai.configure(api_key=settings.gemini_api_key)
-            model = genai.GenerativeModel(settings.gemini_model)
-            
             # Add document context if available
             docs_context = ""
             if context_documents:
@@ -80,7 +102,15 @@ Rispondi utilizzando la tua expertise specifica in {self.specialization}.
 Se utilizzi informazioni dai documenti aziendali, CITALE SEMPRE come '[FONTE: Documento Aziendale] Nome Documento'.
 """
             
-            response = model.generate_content(full_prompt)
+            llm_start = time.time()
+            try:
+                with span("llm.generate_content", model=provider.model_name, agent=self.name, prompt_chars=len(full_prompt)):
+                    response = await provider.generate_content(full_prompt, caller=self.name)
+            except Exception:
+                LLM_CALL_DURATION.labels(provider.model_name, self.name, "error").observe(time.time() - llm_start)
+                raise
+            LLM_CALL_DURATION.labels(provider.model_name, self.name, "success").observe(time.time() - llm_start)
+            record_llm_usage(provider.model_name, response)
             return response.text
             
         except Exception as e:
@@ -125,52 +155,71 @@ Se utilizzi informazioni dai documenti aziendali, CITALE SEMPRE come '[FONTE: Do
             "raw_ai_response": f"ERROR: {error_type}"
         }
     
-    async def search_specialized_documents(self, query: str, tenant_id: int, limit: int = 5) -> list:
-        """Search for documents specific to this specialist's domain"""
-        if not self.vector_service:
-            print(f"[{self.name}] WARNING: Weaviate vector service unavailable - proceeding without document context")
-            return []  # Return empty list instead of crashing
-        
-        try:
-            # Create specialized query combining domain keywords with permit query
-            specialized_query = f"{self.specialization} {' '.join(self.activation_keywords[:5])} {query}"
+    document_search_limit = 3
+    
+    def document_query(self, permit_data: Dict[str, Any]) -> str:
+        """Query for this specialist's domain documents (also used for speculative prefetch)"""
+        return f"{permit_data.get('title', '')} {permit_data.get('description', '')}"
+    
+    async def fetch_specialized_documents(self, permit_data: Dict[str, Any], context: Dict[str, Any]) -> list:
+        """
+        Domain documents for this analysis: the orchestrator's speculative
+        prefetch when one was started, otherwise a fresh search
+        """
+        prefetch = context.get("document_prefetch", {}).get(self.name)
+        if prefetch is not None:
+            return await prefetch
+        return await self.search_specialized_documents(
+            query=self.document_query(permit_data),
+            tenant_id=context.get("user_context", {}).get("tenant_id", 1),
+            vector_service=context.get("vector_service"),
+            limit=self.document_search_limit
+        )
+    
+    async def search_specialized_documents(self, query: str, tenant_id: int, limit: int = 5, vector_service=None) -> list:
+        """Search for documents specific to this specialist's domain (vector_service from the analysis context)"""
+        with span("specialist.search_documents", specialist=self.name, tenant_id=tenant_id, limit=limit):
+            if not vector_service:
+                logger.warning("[%s] Weaviate vector service unavailable - proceeding without document context", self.name)
+                return []  # Return empty list instead of crashing
             
-            # Use optimized semantic search with native multi-tenancy for better performance
-            if hasattr(self.vector_service, 'fast_semantic_search'):
-                # Use optimized native multi-tenancy search (3-5x faster)
-                specialized_docs = await self.vector_service.fast_semantic_search(
-                    query=specialized_query,
-                    tenant_id=tenant_id,
-                    document_types=["procedura_sicurezza", "istruzione_operativa", "manuale", "procedura"],
-                    limit=limit
-                )
-            else:
-                # Fallback to standard semantic search
-                specialized_docs = await self.vector_service.semantic_search(
-                    query=specialized_query,
-                    tenant_id=tenant_id,
-                    document_types=["procedura_sicurezza", "istruzione_operativa", "manuale", "procedura"],
-                    limit=limit
-                )
+            try:
+                # Create specialized query combining domain keywords with permit query
+                specialized_query = f"{self.specialization} {' '.join(self.activation_keywords[:5])} {query}"
             
-            print(f"[{self.name}] Autonomous search found {len(specialized_docs)} specialized documents")
-            return specialized_docs
+                # Use optimized semantic search with native multi-tenancy for better performance
+                if hasattr(vector_service, 'fast_semantic_search'):
+                    # Use optimized native multi-tenancy search (3-5x faster)
+                    specialized_docs = await vector_service.fast_semantic_search(
+                        query=specialized_query,
+                        tenant_id=tenant_id,
+                        document_types=["procedura_sicurezza", "istruzione_operativa", "manuale", "procedura"],
+                        limit=limit
+                    )
+                else:
+                    # Fallback to standard semantic search
+                    specialized_docs = await vector_service.semantic_search(
+                        query=specialized_query,
+                        tenant_id=tenant_id,
+                        document_types=["procedura_sicurezza", "istruzione_operativa", "manuale", "procedura"],
+                        limit=limit
+                    )
             
-        except Exception as e:
-            print(f"[{self.name}] WARNING: Weaviate search failed - {str(e)} - proceeding without documents")
-            return []  # Return empty list instead of crashing
+                logger.debug("[%s] Autonomous search found %s specialized documents", self.name, len(specialized_docs))
+                return specialized_docs
+            
+            except Exception as e:
+                logger.warning("[%s] Weaviate search failed - %s - proceeding without documents", self.name, e)
+                return []  # Return empty list instead of crashing
     
 
     def extract_citations_from_response(self, ai_response: str, context_documents: list = None) -> list:
         """Extract citations from AI response and create structured citation data"""
-        import re
-
         citations = []
         context_documents = context_documents or []
 
         # Find citation patterns in AI response: [FONTE: Documento Aziendale] Nome Documento
-        citation_pattern = r'\[FONTE:\s*Documento\s+Aziendale\]\s*([^\n\.,]+)'
-        matches = re.findall(citation_pattern, ai_response, re.IGNORECASE)
+        matches = CITATION_PATTERN.findall(ai_response)
 
         # Create structured citations for each match
         for i, cited_doc_name in enumerate(matches):
@@ -210,7 +259,7 @@ Se utilizzi informazioni dai documenti aziendali, CITALE SEMPRE come '[FONTE: Do
 
         # If AI didn't use proper citation format, create implicit citations from context documents
         if not citations and context_documents:
-            print(f"[{self.name}] No formal citations found, using context documents as implicit citations")
+            logger.debug("[%s] No formal citations found, using context documents as implicit citations", self.name)
             for i, doc in enumerate(context_documents[:3]):  # Max 3 implicit citations
                 # All context documents are from Weaviate
                 data_source = "WEAVIATE"
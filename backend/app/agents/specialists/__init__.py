@@ -1,7 +1,11 @@
 """
 HSE Specialist Agents Module
 """
+from types import MappingProxyType
+from typing import Mapping, Optional
+import threading
 
+from ..base_agent import BaseHSEAgent
 from .unified_risk_classifier import UnifiedRiskClassifierAgent
 from .hot_work_agent import HotWorkSpecialist
 from .confined_space_agent import ConfinedSpaceSpecialist
@@ -23,6 +27,9 @@ SPECIALIST_REGISTRY = {
     "dpi_evaluator": DPIEvaluatorAgent,
 }
 
+_shared_specialists: Optional[Mapping[str, BaseHSEAgent]] = None
+_shared_lock = threading.Lock()
+
 def get_specialist(name: str):
     """Get a specialist agent by name"""
     specialist_class = SPECIALIST_REGISTRY.get(name)
@@ -31,9 +38,24 @@ def get_specialist(name: str):
     return None
 
 def get_all_specialists():
-    """Get instances of all registered specialists"""
+    """Get new instances of all registered specialists"""
     return {name: cls() for name, cls in SPECIALIST_REGISTRY.items()}
 
+def get_shared_specialists() -> Mapping[str, BaseHSEAgent]:
+    """
+    Process-wide frozen instances of all registered specialists, built once
+    (system messages included). Per-call state goes in the analysis context.
+    """
+    global _shared_specialists
+    if _shared_specialists is None:
+        with _shared_lock:
+            if _shared_specialists is None:
+                specialists = get_all_specialists()
+                for specialist in specialists.values():
+                    specialist.freeze()
+                _shared_specialists = MappingProxyType(specialists)
+    return _shared_specialists
+
 __all__ = [
     "UnifiedRiskClassifierAgent",
     "HotWorkSpecialist", 
@@ -45,5 +67,6 @@ __all__ = [
     "DPIEvaluatorAgent",
     "get_specialist",
     "get_all_specialists",
+    "get_shared_specialists",
     "SPECIALIST_REGISTRY"
 ]
\ No newline at end of file
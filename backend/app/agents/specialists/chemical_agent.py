@@ -2,9 +2,13 @@
 Chemical and ATEX Specialist Agent - AI-powered chemical risk analysis
 """
 from typing import Dict, Any
+import logging
 from ..base_agent import BaseHSEAgent
 
 
+logger = logging.getLogger(__name__)
+
+
 class ChemicalSpecialist(BaseHSEAgent):
     """AI-powered specialist for chemical hazards and explosive atmospheres"""
     
@@ -111,24 +115,23 @@ STRUMENTAZIONE CHIMICA SPECIFICA:
 - Sistemi di allarme per superamento TLV
 """
     
+    document_search_limit = 5
+
+    def document_query(self, permit_data: Dict[str, Any]) -> str:
+        return f"chimico ATEX sicurezza sostanze SDS {permit_data.get('title', '')} {permit_data.get('description', '')}"
+
     async def analyze(self, permit_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """AI-powered chemical and ATEX risk analysis"""
         
         # Get available documents for context
         available_docs = context.get("documents", [])
-        user_context = context.get('user_context', {})
         
         # Search for chemical/ATEX-specific documents
         try:
-            tenant_id = user_context.get("tenant_id", 1)
-            chemical_docs = await self.search_specialized_documents(
-                query=f"chimico ATEX sicurezza sostanze SDS {permit_data.get('title', '')} {permit_data.get('description', '')}",
-                tenant_id=tenant_id,
-                limit=5
-            )
+            chemical_docs = await self.fetch_specialized_documents(permit_data, context)
             all_docs = available_docs + chemical_docs
         except Exception as e:
-            print(f"[{self.name}] Document search failed: {e}")
+            logger.warning("Document search failed: %s", e)
             all_docs = available_docs
         
         # Create comprehensive AI analysis prompt
@@ -249,14 +252,14 @@ EVITA ASSOLUTAMENTE:
                 ai_analysis = json.loads(json_match.group())
             else:
                 # No valid JSON found - return error, don't use hardcoded fallback
-                print(f"[{self.name}] No valid JSON response from AI")
+                logger.warning("No valid JSON response from AI")
                 return self.create_error_response("AI did not provide valid JSON analysis")
 
             # Extract citations from AI response for document traceability
             citations = self.extract_citations_from_response(ai_response, all_docs)
 
         except Exception as e:
-            print(f"[{self.name}] AI analysis failed: {e}")
+            logger.warning("AI analysis failed: %s", e)
             # Return error - no hardcoded fallback
             return self.create_error_response(str(e))
         
@@ -2,9 +2,13 @@
 Confined Space Specialist Agent - AI-powered confined space analysis
 """
 from typing import Dict, Any, List
+import logging
 from ..base_agent import BaseHSEAgent
 
 
+logger = logging.getLogger(__name__)
+
+
 class ConfinedSpaceSpecialist(BaseHSEAgent):
     """AI-powered specialist for confined space entry operations"""
 
@@ -89,27 +93,26 @@ SISTEMI E ATTREZZATURE CRITICHE:
 - Sistemi di isolamento energetico (LOTO)
 """
 
+    document_search_limit = 5
+
+    def document_query(self, permit_data: Dict[str, Any]) -> str:
+        return f"spazi confinati DPR 177 confined space {permit_data.get('title', '')} {permit_data.get('description', '')}"
+
     async def analyze(self, permit_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """AI-powered confined space risk analysis"""
 
         # Get available documents for context
         available_docs = context.get("documents", [])
-        user_context = context.get('user_context', {})
 
         # Get existing actions from permit
         existing_actions = permit_data.get('risk_mitigation_actions', [])
 
         # Search for confined space-specific documents
         try:
-            tenant_id = user_context.get("tenant_id", 1)
-            confined_docs = await self.search_specialized_documents(
-                query=f"spazi confinati DPR 177 confined space {permit_data.get('title', '')} {permit_data.get('description', '')}",
-                tenant_id=tenant_id,
-                limit=5
-            )
+            confined_docs = await self.fetch_specialized_documents(permit_data, context)
             all_docs = available_docs + confined_docs
         except Exception as e:
-            print(f"[{self.name}] Document search failed: {e}")
+            logger.warning("Document search failed: %s", e)
             all_docs = available_docs
 
         # Create comprehensive AI analysis prompt
@@ -220,14 +223,14 @@ IMPORTANTE: Tutte le azioni devono essere implementate PRIMA dell'inizio lavori.
                 ai_analysis = json.loads(json_match.group())
             else:
                 # No valid JSON found - return error, don't use hardcoded fallback
-                print(f"[{self.name}] No valid JSON response from AI")
+                logger.warning("No valid JSON response from AI")
                 return self.create_error_response("AI did not provide valid JSON analysis")
 
             # Extract citations from AI response for document traceability
             citations = self.extract_citations_from_response(ai_response, all_docs)
 
         except Exception as e:
-            print(f"[{self.name}] Analysis failed: {e}")
+            logger.warning("Analysis failed: %s", e)
             # Use standardized error response with confined space specific fields
             error_response = self.create_error_response(e)
             error_response.update({
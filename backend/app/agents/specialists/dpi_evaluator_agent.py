@@ -2,9 +2,13 @@
 DPI Evaluator Agent - Specialista nella valutazione e raccomandazione DPI
 """
 from typing import Dict, Any, List
+import logging
 from ..base_agent import BaseHSEAgent
 
 
+logger = logging.getLogger(__name__)
+
+
 class DPIEvaluatorAgent(BaseHSEAgent):
     """AI-powered specialist agent for PPE evaluation and recommendations based on identified risks"""
     
@@ -107,6 +111,9 @@ OUTPUT STRUTTURATO:
         """DPI Evaluator should always activate after risk identification"""
         return True  # Always evaluate DPI after risks are identified
     
+    def document_query(self, permit_data: Dict[str, Any]) -> str:
+        return f"DPI dispositivi protezione {permit_data.get('title', '')} {permit_data.get('description', '')}"
+
     async def analyze(self, permit_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """AI-powered PPE evaluation based on comprehensive risk analysis"""
         
@@ -134,15 +141,10 @@ OUTPUT STRUTTURATO:
         
         # Search for DPI-specific documents
         try:
-            tenant_id = context.get("user_context", {}).get("tenant_id", 1)
-            dpi_docs = await self.search_specialized_documents(
-                query=f"DPI dispositivi protezione {permit_data.get('title', '')} {permit_data.get('description', '')}",
-                tenant_id=tenant_id,
-                limit=3
-            )
+            dpi_docs = await self.fetch_specialized_documents(permit_data, context)
             all_docs = available_docs + dpi_docs
         except Exception as e:
-            print(f"[{self.name}] Document search failed: {e}")
+            logger.warning("Document search failed: %s", e)
             all_docs = available_docs
         
         # Create comprehensive AI analysis prompt with risk-based electrical analysis
@@ -393,7 +395,7 @@ NON AGGIUNGERE TESTO PRIMA O DOPO IL JSON.
             # Parse JSON response with robust error handling
             ai_analysis = self._parse_ai_json_response(ai_response)
             if ai_analysis is None:
-                print(f"[{self.name}] Failed to parse AI JSON response")
+                logger.warning("Failed to parse AI JSON response")
                 return self.create_error_response("AI did not provide valid JSON analysis")
 
             # Extract citations from AI response for document traceability
@@ -402,16 +404,16 @@ NON AGGIUNGERE TESTO PRIMA O DOPO IL JSON.
             # Validate response schema
             validation_result = self._validate_dpi_response_schema(ai_analysis)
             if not validation_result["valid"]:
-                print(f"[{self.name}] AI response failed schema validation: {validation_result['errors']}")
+                logger.warning("AI response failed schema validation: %s", validation_result['errors'])
                 # Try to use auto-fixed version if available
                 if validation_result.get("auto_fixed"):
                     ai_analysis = validation_result["auto_fixed"]
-                    print(f"[{self.name}] Using auto-fixed AI response")
+                    logger.debug("Using auto-fixed AI response")
                 else:
                     return self.create_error_response(f"AI response schema validation failed: {validation_result['errors']}")
                 
         except Exception as e:
-            print(f"[{self.name}] AI analysis failed: {e}")
+            logger.warning("AI analysis failed: %s", e)
             # Return error - no hardcoded fallback
             return self.create_error_response(str(e))
         
@@ -700,9 +702,9 @@ NON AGGIUNGERE TESTO PRIMA O DOPO IL JSON.
                 return json.loads(json_content)
                 
         except json.JSONDecodeError as e:
-            print(f"[{self.name}] JSON parsing failed: {e}")
+            logger.warning("JSON parsing failed: %s", e)
         except Exception as e:
-            print(f"[{self.name}] Unexpected parsing error: {e}")
+            logger.warning("Unexpected parsing error: %s", e)
         
         return None
     
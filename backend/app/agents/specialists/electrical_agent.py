@@ -2,9 +2,13 @@
 Electrical Safety Specialist Agent - AI-powered electrical risk analysis
 """
 from typing import Dict, Any, List
+import logging
 from ..base_agent import BaseHSEAgent
 
 
+logger = logging.getLogger(__name__)
+
+
 class ElectricalSpecialist(BaseHSEAgent):
     """AI-powered specialist for electrical safety and hazards"""
     
@@ -88,28 +92,27 @@ REQUISITI QUALIFICAZIONE:
 ✓ Aggiornamento quinquennale
 """
     
+    document_search_limit = 5
+
+    def document_query(self, permit_data: Dict[str, Any]) -> str:
+        return f"elettrico sicurezza CEI tensione {permit_data.get('title', '')} {permit_data.get('description', '')}"
+
     async def analyze(self, permit_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """AI-powered electrical risk analysis"""
         
         # Get available documents for context
         available_docs = context.get("documents", [])
-        user_context = context.get('user_context', {})
         
         # Get existing actions from permit
         existing_actions = permit_data.get('risk_mitigation_actions', [])
         
         # Search for electrical-specific documents
         try:
-            tenant_id = user_context.get("tenant_id", 1)
-            electrical_docs = await self.search_specialized_documents(
-                query=f"elettrico sicurezza CEI tensione {permit_data.get('title', '')} {permit_data.get('description', '')}",
-                tenant_id=tenant_id,
-                limit=5
-            )
+            electrical_docs = await self.fetch_specialized_documents(permit_data, context)
             # Deduplicate documents before feeding to AI
             all_docs = self._deduplicate_documents(available_docs + electrical_docs)
         except Exception as e:
-            print(f"[{self.name}] Document search failed: {e}")
+            logger.warning("Document search failed: %s", e)
             all_docs = available_docs
         
         # Get existing actions to check for gaps
@@ -178,20 +181,20 @@ CRITICALITY: alta=pericolo vita, media=infortunio grave, bassa=procedure incompl
             # Extract and parse JSON from AI response with robust error handling
             ai_analysis = self._parse_ai_json_response(ai_response)
             if ai_analysis is None:
-                print(f"[{self.name}] Failed to parse AI JSON response")
+                logger.warning("Failed to parse AI JSON response")
                 return self.create_error_response("AI did not provide valid JSON analysis")
             
             # Validate AI response against expected schema (with auto-fixes)
             validation_result = self._validate_ai_response_schema(ai_analysis)
             if not validation_result["valid"]:
-                print(f"[{self.name}] AI response failed schema validation after auto-fixes: {validation_result['errors']}")
+                logger.warning("AI response failed schema validation after auto-fixes: %s", validation_result['errors'])
                 return self.create_error_response(f"AI response schema validation failed: {validation_result['errors']}")
 
             # Extract citations from AI response for document traceability
             citations = self.extract_citations_from_response(ai_response, all_docs)
 
         except Exception as e:
-            print(f"[{self.name}] Analysis failed: {e}")
+            logger.warning("Analysis failed: %s", e)
             # Use standardized error response
             return self.create_error_response(e)
         
@@ -378,9 +381,9 @@ CRITICALITY: alta=pericolo vita, media=infortunio grave, bassa=procedure incompl
                 seen_content.add(content_hash)
                 unique_docs.append(doc)
             else:
-                print(f"[{self.name}] Skipped duplicate document: {title[:50]}...")
+                logger.debug("Skipped duplicate document: %s...", title[:50])
         
-        print(f"[{self.name}] Document deduplication: {len(documents)} -> {len(unique_docs)}")
+        logger.debug("Document deduplication: %s -> %s", len(documents), len(unique_docs))
         return unique_docs
     
     def _validate_ai_response_schema(self, ai_response: Dict[str, Any]) -> Dict[str, Any]:
@@ -515,8 +518,8 @@ CRITICALITY: alta=pericolo vita, media=infortunio grave, bassa=procedure incompl
         try:
             return json.loads(cleaned_response)
         except json.JSONDecodeError as e:
-            print(f"[{self.name}] JSON parse error: {e}")
-            print(f"[{self.name}] Problematic response: {ai_response[:200]}...")
+            logger.warning("JSON parse error: %s", e)
+            logger.debug("Problematic response: %s...", ai_response[:200])
             
         # Strategy 3: Try to fix common JSON issues
         try:
@@ -2,9 +2,13 @@
 Height Work Specialist Agent
 """
 from typing import Dict, Any
+import logging
 from ..base_agent import BaseHSEAgent
 
 
+logger = logging.getLogger(__name__)
+
+
 class HeightWorkSpecialist(BaseHSEAgent):
     """Specialist for work at height operations"""
     
@@ -111,15 +115,10 @@ SISTEMI TECNICI LAVORI IN QUOTA:
         
         # Search for height work specific documents
         try:
-            tenant_id = context.get("user_context", {}).get("tenant_id", 1)
-            specialized_docs = await self.search_specialized_documents(
-                query=f"{permit_data.get('title', '')} {permit_data.get('description', '')}",
-                tenant_id=tenant_id,
-                limit=3
-            )
+            specialized_docs = await self.fetch_specialized_documents(permit_data, context)
             all_docs = available_docs + specialized_docs
         except Exception as e:
-            print(f"[{self.name}] Document search failed: {e}")
+            logger.warning("Document search failed: %s", e)
             all_docs = available_docs
         
         # Simplified AI analysis prompt maintaining all essential functionality
@@ -181,11 +180,11 @@ CRITICALITY: alta=pericolo vita, media=infortunio grave, bassa=procedure incompl
                 ai_analysis = json.loads(json_match.group())
             else:
                 # No valid JSON found - return error, don't use hardcoded fallback
-                print(f"[{self.name}] No valid JSON response from AI")
+                logger.warning("No valid JSON response from AI")
                 return self.create_error_response("AI did not provide valid JSON analysis")
                 
         except Exception as e:
-            print(f"[{self.name}] AI analysis failed: {e}")
+            logger.warning("AI analysis failed: %s", e)
             # Return error - no hardcoded fallback
             return self.create_error_response(str(e))
         
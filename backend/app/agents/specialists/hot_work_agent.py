@@ -2,9 +2,13 @@
 Hot Work Specialist Agent - AI-powered hot work risk analysis
 """
 from typing import Dict, Any, List
+import logging
 from ..base_agent import BaseHSEAgent
 
 
+logger = logging.getLogger(__name__)
+
+
 class HotWorkSpecialist(BaseHSEAgent):
     """AI-powered specialist for hot work operations (welding, cutting, brazing, etc.)"""
 
@@ -103,6 +107,9 @@ CRITERI STOP LAVORI CALDI:
 ✗ Condizioni meteo avverse (vento forte)
 """
 
+    def document_query(self, permit_data: Dict[str, Any]) -> str:
+        return f"lavori caldo saldatura taglio fire hot work {permit_data.get('title', '')} {permit_data.get('description', '')}"
+
     async def analyze(self, permit_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """AI-powered hot work risk analysis"""
 
@@ -114,15 +121,10 @@ CRITERI STOP LAVORI CALDI:
 
         # Search for hot work specific documents
         try:
-            tenant_id = context.get("user_context", {}).get("tenant_id", 1)
-            hot_work_docs = await self.search_specialized_documents(
-                query=f"lavori caldo saldatura taglio fire hot work {permit_data.get('title', '')} {permit_data.get('description', '')}",
-                tenant_id=tenant_id,
-                limit=3
-            )
+            hot_work_docs = await self.fetch_specialized_documents(permit_data, context)
             all_docs = available_docs + hot_work_docs
         except Exception as e:
-            print(f"[{self.name}] Document search failed: {e}")
+            logger.warning("Document search failed: %s", e)
             all_docs = available_docs
 
         # Simplified AI analysis prompt maintaining all essential functionality
@@ -186,14 +188,14 @@ IMPORTANTE: Tutte le azioni devono essere implementate PRIMA dell'inizio lavori.
                 ai_analysis = json.loads(json_match.group())
             else:
                 # No valid JSON found - return error, don't use hardcoded fallback
-                print(f"[{self.name}] No valid JSON response from AI")
+                logger.warning("No valid JSON response from AI")
                 return self.create_error_response("AI did not provide valid JSON analysis")
 
             # Extract citations from AI response for document traceability
             citations = self.extract_citations_from_response(ai_response, all_docs)
 
         except Exception as e:
-            print(f"[{self.name}] AI analysis failed: {e}")
+            logger.warning("AI analysis failed: %s", e)
             # Return error - no hardcoded fallback
             return self.create_error_response(str(e))
 
@@ -2,9 +2,13 @@
 Mechanical Specialist Agent - Handles mechanical hazards
 """
 from typing import Dict, Any, List
+import logging
 from ..base_agent import BaseHSEAgent
 
 
+logger = logging.getLogger(__name__)
+
+
 class MechanicalSpecialist(BaseHSEAgent):
     """Specialist agent for mechanical hazards and risks"""
     
@@ -116,15 +120,10 @@ Analisi dettagliata dei rischi meccanici con:
         
         # Search for mechanical safety documents
         try:
-            tenant_id = context.get("user_context", {}).get("tenant_id", 1)
-            specialized_docs = await self.search_specialized_documents(
-                query=f"{permit_data.get('title', '')} {permit_data.get('description', '')}",
-                tenant_id=tenant_id,
-                limit=3
-            )
+            specialized_docs = await self.fetch_specialized_documents(permit_data, context)
             all_docs = available_docs + specialized_docs
         except Exception as e:
-            print(f"[{self.name}] Document search failed: {e}")
+            logger.warning("Document search failed: %s", e)
             all_docs = available_docs
         
         # Simplified AI analysis prompt maintaining all essential functionality
@@ -209,7 +208,7 @@ IMPORTANTE: Tutte le azioni devono essere implementate PRIMA dell'inizio lavori.
             citations = self.extract_citations_from_response(ai_response, all_docs)
 
         except Exception as e:
-            print(f"[{self.name}] Analysis failed: {e}")
+            logger.warning("Analysis failed: %s", e)
             # Use standardized error response
             return self.create_error_response(e)
         
@@ -6,6 +6,10 @@ from typing import Dict, Any, List, Set, Tuple
 from ..base_agent import BaseHSEAgent
 import re
 import json
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class UnifiedRiskClassifierAgent(BaseHSEAgent):
@@ -299,11 +303,22 @@ FORNISCI ANALISI STRUTTURATA IN FORMATO JSON:
                 return ai_analysis
                 
         except Exception as e:
-            print(f"[UnifiedRiskClassifier] AI analysis failed: {e}")
+            logger.warning("AI analysis failed: %s", e)
             
         # Fallback analysis if AI fails
         return self._fallback_risk_analysis(permit_content, work_type)
     
+    def keyword_priors(self, permit_data: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Keyword-based activation prior per specialist, available before the AI
+        classification (same scoring as the fallback: 0.2 per keyword, max 1.0)
+        """
+        content_lower = self._extract_permit_content(permit_data).lower()
+        return {
+            config["specialist"]: min(1.0, 0.2 * sum(1 for keyword in config["keywords"] if keyword.lower() in content_lower))
+            for config in self.risk_categories.values()
+        }
+    
     def _fallback_risk_analysis(self, permit_content: str, work_type: str) -> Dict[str, Any]:
         """Fallback risk analysis using keyword matching if AI fails"""
         content_lower = permit_content.lower()
@@ -426,9 +441,9 @@ FORNISCI ANALISI STRUTTURATA IN FORMATO JSON:
             activation_details.append("dpi_evaluator: Always included for DPI evaluation")
         
         # Log activation decisions
-        print(f"[UnifiedRiskClassifier] Specialist activation decisions:")
+        logger.debug("Specialist activation decisions:")
         for detail in activation_details:
-            print(f"  {detail}")
+            logger.debug("%s", detail)
         
         return specialists_to_activate
     
@@ -445,8 +460,8 @@ FORNISCI ANALISI STRUTTURATA IN FORMATO JSON:
         permit_content = self._extract_permit_content(permit_data)
         work_type = permit_data.get('work_type', '')
         
-        print(f"[UnifiedRiskClassifier] Analyzing permit content ({len(permit_content)} chars)")
-        print(f"[UnifiedRiskClassifier] Work type: '{work_type}'")
+        logger.debug("Analyzing permit content (%s chars)", len(permit_content))
+        logger.debug("Work type: '%s'", work_type)
         
         # Perform AI comprehensive risk analysis
         ai_analysis = await self._ai_comprehensive_risk_analysis(permit_content, work_type)
@@ -480,11 +495,10 @@ FORNISCI ANALISI STRUTTURATA IN FORMATO JSON:
         if critical_combinations:
             overall_risk_level = "CRITICAL"
         
-        print(f"[UnifiedRiskClassifier] Analysis complete:")
-        print(f"  - Detected risks: {len(identified_risks)}")
-        print(f"  - Specialists to activate: {len(specialists_to_activate)} - {specialists_to_activate}")
-        print(f"  - Overall risk level: {overall_risk_level}")
-        print(f"  - Critical combinations: {len(critical_combinations)}")
+        logger.debug(
+            "Analysis complete: %s risks, specialists %s, overall risk level %s, %s critical combinations",
+            len(identified_risks), specialists_to_activate, overall_risk_level, len(critical_combinations)
+        )
         
         return {
             # Primary outputs for orchestrator
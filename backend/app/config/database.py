@@ -1,14 +1,17 @@
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import contextmanager, asynccontextmanager
+from typing import AsyncGenerator, Generator
 
 from .settings import settings
 
 
 # Create engine with connection pooling
+# The sync engine is kept for scripts, migrations and background jobs;
+# request handlers should use the async engine below.
 engine = create_engine(
     settings.database_url,
     poolclass=QueuePool,
@@ -21,6 +24,24 @@ engine = create_engine(
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) used by the request path so queries never block the event loop
+async_engine = create_async_engine(
+    settings.get_async_database_url(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    echo=settings.debug
+)
+
+# Async session factory - objects stay usable after commit since
+# async sessions cannot lazy-load expired attributes
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -36,6 +57,14 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 @contextmanager
 def get_db_context():
     """
@@ -52,6 +81,20 @@ def get_db_context():
         db.close()
 
 
+@asynccontextmanager
+async def get_async_db_context():
+    """
+    Async context manager for database session
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
 # Multi-tenant row-level security
 # Note: Bulk operation events will be implemented when needed
 # @event.listens_for(Session, "after_bulk_insert")
@@ -12,9 +12,16 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str
+    async_database_url: str = ""  # Derived from database_url when empty
     db_pool_size: int = 20
     db_max_overflow: int = 40
     
+    # Dedicated tenant databases (ON_PREMISE / HYBRID)
+    tenant_db_pool_size: int = 2  # overridable per tenant with settings["db_pool_size"]
+    tenant_db_max_overflow: int = 3  # overridable per tenant with settings["db_max_overflow"]
+    tenant_engine_cache_size: int = 50
+    tenant_engine_idle_seconds: int = 900
+    
     # Redis
     redis_url: str
     redis_password: str = ""
@@ -34,9 +41,13 @@ class Settings(BaseSettings):
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 720  # 30 days
+    bcrypt_rounds: int = 12  # hashes with other rounds are rehashed on login
+    password_rehash_on_login: bool = True
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
     
     # AI Provider Configuration
-    ai_provider: str = "gemini"  # "openai" or "gemini"
+    ai_provider: str = "gemini"  # "openai", "gemini" or "standin" (offline load testing)
     
     # OpenAI (fallback)
     openai_api_key: str = ""
@@ -46,6 +57,18 @@ class Settings(BaseSettings):
     gemini_api_key: str = ""
     gemini_model: str = "gemini-1.5-pro"
     
+    # Offline stand-ins (ai_provider / vector_provider = "standin")
+    llm_standin_url: str = ""  # empty: in-process; otherwise scripts/run_llm_standin.py
+    llm_standin_latency: str = "lognormal"  # "fixed", "uniform" or "lognormal"
+    llm_standin_latency_ms: float = 1500.0  # fixed value, mean (uniform) or median (lognormal)
+    llm_standin_latency_sigma: float = 0.5
+    llm_standin_error_rate: float = 0.0
+    llm_standin_rate_limit_rate: float = 0.0  # share of calls answered with 429
+    llm_standin_seed: int = 42
+    vector_provider: str = "weaviate"  # "weaviate" or "standin"
+    vector_standin_latency_ms: float = 20.0
+    vector_standin_documents: int = 200  # synthetic chunks per tenant
+    
     # CORS
     cors_origins: List[str] = [
         "http://localhost:3006"
@@ -54,6 +77,9 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = 60
     rate_limit_per_hour: int = 1000
+    rate_limit_user_per_minute: int = 120
+    rate_limit_tenant_per_minute: int = 1200
+    rate_limit_local_fraction: float = 0.1  # share of a limit a worker may grant without Redis
     
     # File Upload
     max_file_size_mb: int = 50
@@ -63,10 +89,71 @@ class Settings(BaseSettings):
     max_tenants: int = 1000
     default_tenant_user_limit: int = 100
     default_tenant_document_limit: int = 1000
+    tenant_cache_ttl_seconds: int = 60
+    user_cache_ttl_seconds: int = 30
+    
+    # Audit pipeline
+    audit_queue_size: int = 10000
+    audit_batch_size: int = 500
+    audit_flush_interval_seconds: float = 1.0
+    audit_overflow_policy: str = "spill"  # "spill", "drop_oldest" or "drop_newest"
+    audit_spill_path: str = "/tmp/hse_audit_spill.jsonl"
+    audit_body_capture_bytes: int = 16384  # head of JSON request bodies kept in audit records
+    audit_partition_months_ahead: int = 3
+    audit_partition_maintenance_interval_hours: float = 24.0
+    
+    # Metrics
+    metrics_enabled: bool = True
+    metrics_tenant_labels: bool = True
+    metrics_max_tenant_labels: int = 50  # further tenants are labelled "other"
+    metrics_token: str = ""  # when set, /metrics requires "Authorization: Bearer <token>"
+    metrics_allowed_networks: List[str] = ["127.0.0.0/8", "10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16", "::1/128"]  # scrapers allowed without a token
+    
+    # Logging
+    log_level: str = "INFO"  # root level; debug=True forces DEBUG
+    log_json: bool = False  # JSON lines via python-json-logger
+    log_module_levels: str = ""  # e.g. "app.agents=DEBUG,app.routers.permits=WARNING"
+    
+    # Tracing (requires opentelemetry-sdk)
+    tracing_enabled: bool = False
+    tracing_exporter: str = "otlp"  # "otlp", "file" or "console"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_file_path: str = "/tmp/hse_traces.jsonl"
+    tracing_sample_ratio: float = 1.0
+    tracing_service_name: str = "hse-backend"
+    
+    # Profiling (requires pyinstrument; X-Profile header from admins or targets set via the admin API)
+    profiling_enabled: bool = True
+    profiling_interval_seconds: float = 0.001
+    profiling_dir: str = "/tmp/hse_profiles"
+    profiling_max_profiles: int = 200
+    
+    # Startup (external connections warm up in the background; see /health/ready)
+    startup_budget_seconds: float = 0.5  # warning when import + lifespan startup exceeds it
+    startup_warmup_timeout_seconds: float = 30.0
+    readiness_requires_warmup: bool = False  # True: not ready until MinIO/Weaviate/agents are warm
+    
+    # Permit analyses
+    analysis_compression_min_bytes: int = 0  # 0 stores plain JSONB; otherwise zlib above this size
+    # Speculative step 2 while the risk classifier runs: "off", "documents"
+    # (prefetch specialist document searches) or "full" (also run the specialist LLM calls)
+    analysis_speculation: str = "off"
+    analysis_speculation_min_prior: float = 0.4  # keyword prior (0.2 per keyword) needed to speculate
     
     class Config:
         env_file = ".env"
         case_sensitive = False
+    
+    def get_async_database_url(self) -> str:
+        """Return the asyncpg URL for the async engine"""
+        if self.async_database_url:
+            return self.async_database_url
+        
+        url = self.database_url
+        for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+            if url.startswith(prefix):
+                return "postgresql+asyncpg://" + url[len(prefix):]
+        return url
 
 
 settings = Settings()
\ No newline at end of file
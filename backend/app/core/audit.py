@@ -1,19 +1,25 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 from fastapi import Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.audit import AuditLog
 from app.models.user import User
+from app.core.audit_writer import audit_writer, build_audit_row
 
 
 class AuditService:
     """
     Service for comprehensive audit logging
+    Records go through the batched audit writer; the session is only used
+    when the writer is not running (scripts, tests)
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Union[Session, AsyncSession]):
         self.db = db
+        self._is_async = isinstance(db, AsyncSession)
     
     async def log_action(
         self,
@@ -30,16 +36,42 @@ class AuditService:
         user_agent: Optional[str] = None,
         api_endpoint: Optional[str] = None,
         severity: str = "info",
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        username: Optional[str] = None
     ):
         """
         Log an action to the audit trail
         """
+        if audit_writer.running:
+            # Username is resolved per batch by the writer
+            audit_writer.enqueue(build_audit_row(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                username=username,
+                action=action,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                resource_name=resource_name,
+                old_values=old_values or {},
+                new_values=new_values or {},
+                extra_data=extra_data or {},
+                ip_address=ip_address,
+                user_agent=user_agent,
+                api_endpoint=api_endpoint,
+                severity=severity,
+                category=category
+            ))
+            return None
+        
         # Get username if user_id provided
-        username = None
-        if user_id:
-            user = self.db.query(User).filter(User.id == user_id).first()
-            username = user.username if user else f"user_id_{user_id}"
+        if user_id and not username:
+            if self._is_async:
+                result = await self.db.execute(select(User.username).where(User.id == user_id))
+                username = result.scalar()
+            else:
+                user = self.db.query(User).filter(User.id == user_id).first()
+                username = user.username if user else None
+            username = username or f"user_id_{user_id}"
         
         audit_log = AuditLog(
             tenant_id=tenant_id,
@@ -60,7 +92,10 @@ class AuditService:
         )
         
         self.db.add(audit_log)
-        self.db.commit()
+        if self._is_async:
+            await self.db.commit()
+        else:
+            self.db.commit()
         
         return audit_log
     
@@ -91,7 +126,8 @@ class AuditService:
             ip_address=ip_address,
             user_agent=user_agent,
             severity="warning" if not success else "info",
-            category="authentication"
+            category="authentication",
+            username=username
         )
     
     async def log_data_access(
@@ -117,7 +153,8 @@ class AuditService:
     
     async def log_ai_analysis(
         self,
-        user: User,
+        user_id: int,
+        tenant_id: int,
         permit_id: int,
         analysis_results: Dict[str, Any],
         processing_time: float
@@ -132,8 +169,8 @@ class AuditService:
         }
         
         await self.log_action(
-            user_id=user.id,
-            tenant_id=user.tenant_id,
+            user_id=user_id,
+            tenant_id=tenant_id,
             action="ai.analysis_completed",
             resource_type="work_permit",
             resource_id=permit_id,
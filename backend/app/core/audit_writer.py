@@ -0,0 +1,356 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import asyncio
+import ipaddress
+import json
+import logging
+import os
+import threading
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import InterfaceError, OperationalError, StatementError
+
+from app.config.settings import settings
+from app.models.audit import AuditLog
+from app.models.user import User
+
+
+logger = logging.getLogger(__name__)
+
+AUDIT_COLUMNS = {column.key for column in AuditLog.__table__.columns} - {"id"}
+
+
+def build_audit_row(**values) -> Dict[str, Any]:
+    """
+    Normalize an audit record into an insertable audit_logs row
+    """
+    # Every row carries every column so executemany sees a uniform parameter set
+    row = {key: values.get(key) for key in AUDIT_COLUMNS}
+    row["created_at"] = row["created_at"] or datetime.utcnow()
+    row["extra_data"] = row["extra_data"] or {}
+    row["severity"] = row["severity"] or "info"
+
+    # INET column: drop values such as "unknown" instead of failing the whole batch
+    ip_address = row.get("ip_address")
+    if ip_address is not None:
+        try:
+            row["ip_address"] = str(ipaddress.ip_address(str(ip_address)))
+        except ValueError:
+            row["ip_address"] = None
+
+    if row.get("user_id") is not None:
+        try:
+            row["user_id"] = int(row["user_id"])
+        except (TypeError, ValueError):
+            row["user_id"] = None
+
+    return row
+
+
+class AuditWriter:
+    """
+    Bounded in-process queue of audit rows flushed in batches by a background
+    task with executemany inserts. When the queue is full the overflow policy
+    applies (spill, drop_oldest, drop_newest); batches that cannot be written
+    are appended to a JSON-lines spill file and replayed on the next flush.
+    Spill file I/O runs in a worker thread, never on the event loop.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow_policy: str,
+        spill_path: str
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.spill_path = spill_path
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._spill_buffer: List[Dict[str, Any]] = []
+        self._spill_task: Optional[asyncio.Task] = None
+        self._spill_lock = threading.Lock()
+        # Rows the flusher had taken from the queue when it was cancelled
+        self._unflushed: List[Dict[str, Any]] = []
+        self.stats = {"enqueued": 0, "written": 0, "dropped": 0, "spilled": 0, "failed_batches": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """
+        Non-blocking enqueue; returns False if the row was dropped
+        """
+        if self._queue is None or not self.running:
+            # Not started or stopping: nobody drains the queue
+            self._spill_later([row])
+            return True
+
+        try:
+            self._queue.put_nowait(row)
+            self.stats["enqueued"] += 1
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == "drop_oldest":
+            try:
+                self._queue.get_nowait()
+                self._queue.put_nowait(row)
+            except (asyncio.QueueEmpty, asyncio.QueueFull):
+                pass
+            self.stats["dropped"] += 1
+            return True
+        if self.overflow_policy == "drop_newest":
+            self.stats["dropped"] += 1
+            return False
+
+        # Default: spill to disk, never lose the record
+        self._spill_later([row])
+        return True
+
+    async def start(self):
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run(), name="audit-writer")
+        logger.info(f"Audit writer started (batch={self.batch_size}, queue={self.max_queue_size}, policy={self.overflow_policy})")
+
+    async def stop(self):
+        """
+        Stop the flusher and write whatever is still queued
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._queue is not None:
+            remaining, self._unflushed = self._unflushed, []
+            while not self._queue.empty():
+                remaining.append(self._queue.get_nowait())
+            for start in range(0, len(remaining), self.batch_size):
+                batch = remaining[start:start + self.batch_size]
+                try:
+                    await self._write_batch(batch)
+                except Exception as e:
+                    logger.error(f"Final audit batch failed, spilling to disk: {e}")
+                    await self._spill(batch)
+            self._queue = None
+
+        if self._spill_task is not None:
+            await self._spill_task
+        logger.info(f"Audit writer stopped: {self.stats}")
+
+    async def _run(self):
+        await self._safe_replay_spill()
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = asyncio.get_running_loop().time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - asyncio.get_running_loop().time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # No error may end the flusher: the queue would fill up undrained
+                try:
+                    written = await self._write_batch(batch)
+                except Exception as e:
+                    logger.exception(f"Unexpected error writing {len(batch)} audit rows, spilling to disk: {e}")
+                    self.stats["failed_batches"] += 1
+                    await self._spill(batch)
+                    continue
+                batch = []
+
+                if written and self._has_spill():
+                    await self._safe_replay_spill()
+            except asyncio.CancelledError:
+                # stop() writes these with the rest of the queue (a cancelled
+                # insert rolls back, so the rows are not lost)
+                self._unflushed.extend(batch)
+                raise
+
+    async def _safe_replay_spill(self):
+        try:
+            await self._replay_spill()
+        except Exception as e:
+            logger.exception(f"Audit spill replay failed: {e}")
+
+    async def _write_batch(self, rows: List[Dict[str, Any]]) -> bool:
+        from app.config.database import async_engine
+
+        # audit_logs.tenant_id is NOT NULL: requests without a tenant cannot be stored
+        valid_rows = [row for row in rows if row.get("tenant_id") is not None]
+        self.stats["dropped"] += len(rows) - len(valid_rows)
+        if not valid_rows:
+            return True
+
+        try:
+            async with async_engine.begin() as conn:
+                await self._fill_usernames(conn, valid_rows)
+                await conn.execute(insert(AuditLog.__table__), valid_rows)
+            self.stats["written"] += len(valid_rows)
+            return True
+        except (OperationalError, InterfaceError, OSError) as e:
+            # Database unreachable (OSError: asyncpg refused at connect): keep the rows on disk for a later replay
+            logger.error(f"Audit batch of {len(valid_rows)} rows failed, spilling to disk: {e}")
+            self.stats["failed_batches"] += 1
+            await self._spill(valid_rows)
+            return False
+        except StatementError as e:
+            # A bad row (rejected by the database or not serializable) fails the
+            # whole batch: retry one by one and drop the offenders
+            logger.error(f"Audit batch rejected, retrying rows individually: {e}")
+            self.stats["failed_batches"] += 1
+            for row in valid_rows:
+                try:
+                    async with async_engine.begin() as conn:
+                        await conn.execute(insert(AuditLog.__table__), [row])
+                    self.stats["written"] += 1
+                except (OperationalError, InterfaceError, OSError):
+                    await self._spill([row])
+                except StatementError as row_error:
+                    self.stats["dropped"] += 1
+                    logger.error(f"Dropping invalid audit row {row.get('action')}: {row_error}")
+            return True
+
+    async def _fill_usernames(self, conn, rows: List[Dict[str, Any]]):
+        """
+        One users query per batch instead of one per audit call
+        """
+        user_ids = {row["user_id"] for row in rows if row.get("user_id") and not row.get("username")}
+        if not user_ids:
+            return
+        result = await conn.execute(select(User.id, User.username).where(User.id.in_(user_ids)))
+        usernames = {user_id: username for user_id, username in result}
+        for row in rows:
+            if row.get("user_id") and not row.get("username"):
+                row["username"] = usernames.get(row["user_id"]) or f"user_id_{row['user_id']}"
+
+    async def _spill(self, rows: List[Dict[str, Any]]):
+        if rows:
+            await asyncio.to_thread(self._write_spill, rows)
+
+    def _spill_later(self, rows: List[Dict[str, Any]]):
+        """
+        Spill from the request path without blocking: rows are buffered and
+        written by a single background task
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts): nothing to block
+            self._write_spill(rows)
+            return
+        self._spill_buffer.extend(rows)
+        if self._spill_task is None or self._spill_task.done():
+            self._spill_task = loop.create_task(self._drain_spill_buffer(), name="audit-spill")
+
+    async def _drain_spill_buffer(self):
+        while self._spill_buffer:
+            rows, self._spill_buffer = self._spill_buffer, []
+            await self._spill(rows)
+
+    def _write_spill(self, rows: List[Dict[str, Any]]):
+        try:
+            with self._spill_lock:
+                os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+                with open(self.spill_path, "a", encoding="utf-8") as spill_file:
+                    for row in rows:
+                        spill_file.write(json.dumps(row, default=str) + "\n")
+            self.stats["spilled"] += len(rows)
+        except OSError as e:
+            self.stats["dropped"] += len(rows)
+            logger.error(f"Could not spill {len(rows)} audit rows to {self.spill_path}: {e}")
+
+    @property
+    def _replay_path(self) -> str:
+        return f"{self.spill_path}.replay"
+
+    def _has_spill(self) -> bool:
+        return os.path.exists(self.spill_path) or os.path.exists(self._replay_path)
+
+    def _take_spill_file(self) -> List[Dict[str, Any]]:
+        """
+        Rows of the replay file, parsed line by line. A leftover replay file
+        (interrupted replay) is taken before the spill file and never
+        overwritten; unreadable lines are moved to <spill>.corrupt
+        """
+        with self._spill_lock:
+            if not os.path.exists(self._replay_path):
+                os.replace(self.spill_path, self._replay_path)
+
+        rows = []
+        corrupt_lines = []
+        with open(self._replay_path, encoding="utf-8") as replay_file:
+            for line in replay_file:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    if isinstance(row.get("created_at"), str):
+                        row["created_at"] = datetime.fromisoformat(row["created_at"])
+                    rows.append(row)
+                except (ValueError, AttributeError):
+                    # e.g. a line torn by a crash in the middle of _write_spill
+                    corrupt_lines.append(line if line.endswith("\n") else line + "\n")
+
+        if corrupt_lines:
+            with open(f"{self.spill_path}.corrupt", "a", encoding="utf-8") as corrupt_file:
+                corrupt_file.writelines(corrupt_lines)
+            self.stats["dropped"] += len(corrupt_lines)
+            logger.error(f"Quarantined {len(corrupt_lines)} unreadable audit spill lines in {self.spill_path}.corrupt")
+        return rows
+
+    async def _replay_spill(self):
+        """
+        Re-insert rows spilled by earlier failures. The replay file is removed
+        only once every row is written or spilled again (at-least-once)
+        """
+        if not self._has_spill():
+            return
+        try:
+            rows = await asyncio.to_thread(self._take_spill_file)
+        except OSError as e:
+            logger.error(f"Could not read audit spill file: {e}")
+            return
+
+        logger.info(f"Replaying {len(rows)} spilled audit rows")
+        start = 0
+        try:
+            while start < len(rows):
+                if not await self._write_batch(rows[start:start + self.batch_size]):
+                    # Failed rows were spilled again; keep the rest for the next attempt
+                    await self._spill(rows[start + self.batch_size:])
+                    break
+                start += self.batch_size
+        except asyncio.CancelledError:
+            # Stopping mid-replay: stop() writes or spills what is left
+            self._unflushed.extend(rows[start:])
+            os.remove(self._replay_path)
+            raise
+        await asyncio.to_thread(os.remove, self._replay_path)
+
+
+# Global audit writer
+audit_writer = AuditWriter(
+    max_queue_size=settings.audit_queue_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+    overflow_policy=settings.audit_overflow_policy,
+    spill_path=settings.audit_spill_path
+)
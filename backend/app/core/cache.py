@@ -0,0 +1,119 @@
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import json
+import logging
+import threading
+import time
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+class InvalidatingTTLCache:
+    """
+    In-process TTL cache whose invalidations are broadcast on a Redis channel,
+    so every worker drops its copy. Subclasses decide which keys an
+    invalidation matches.
+    """
+
+    def __init__(self, channel: str, ttl_seconds: int, negative_ttl_seconds: int = 10):
+        self.channel = channel
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._redis: Optional[redis.Redis] = None
+        self._async_redis: Optional[aioredis.Redis] = None
+        self._listener = None
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value (None for a cached miss), or MISSING"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+            return MISSING
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        ttl = self.ttl_seconds if value is not None else self.negative_ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def matches(self, key: Hashable, value: Any, target: Any) -> bool:
+        """Whether an entry must be dropped when target is invalidated"""
+        raise NotImplementedError
+
+    def invalidate_local(self, target: Any = None):
+        """Drop the entries matching target; everything when target is None"""
+        with self._lock:
+            if target is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if self.matches(key, self._entries[key][1], target):
+                    del self._entries[key]
+
+    async def invalidate(self, target: Any = None):
+        """Invalidate locally and broadcast to the other workers"""
+        self.invalidate_local(target)
+        try:
+            await self._get_async_redis().publish(self.channel, json.dumps({"target": target}))
+        except redis.RedisError as e:
+            logger.warning(f"Could not publish invalidation on {self.channel}: {e}")
+
+    def start_listener(self) -> bool:
+        """
+        Subscribe to invalidations in a background thread; False when Redis is
+        unreachable (entries then expire by TTL only)
+        """
+        if self._listener is not None:
+            return True
+        try:
+            pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: self._on_message})
+            self._listener = pubsub.run_in_thread(sleep_time=1, daemon=True)
+            logger.info(f"Cache invalidation listener started on {self.channel}")
+            return True
+        except redis.RedisError as e:
+            logger.warning(f"Invalidation listener unavailable on {self.channel}, relying on TTL only: {e}")
+            return False
+
+    def stop_listener(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _on_message(self, message: dict):
+        try:
+            target = json.loads(message["data"]).get("target")
+        except (ValueError, TypeError, AttributeError):
+            target = None
+        self.invalidate_local(target)
+
+    def _get_redis(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+        return self._redis
+
+    def _get_async_redis(self) -> aioredis.Redis:
+        # Publishing happens in request handlers: never block the event loop
+        if self._async_redis is None:
+            self._async_redis = aioredis.Redis.from_url(settings.redis_url, decode_responses=True)
+        return self._async_redis
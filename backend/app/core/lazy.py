@@ -0,0 +1,69 @@
+from typing import Any, Optional, Tuple
+import importlib
+import importlib.util
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """
+    Stand-in for a heavy SDK module (weaviate, minio, google.generativeai, ...)
+    imported on first attribute access instead of at application import.
+    Truthiness tells whether the module is installed without importing it,
+    so "if genai:" checks keep working.
+    """
+
+    def __init__(self, name: str, *fallbacks: str):
+        self._names: Tuple[str, ...] = (name,) + fallbacks
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = self._import()
+        return self._module
+
+    def _import(self):
+        error: Optional[ImportError] = None
+        for name in self._names:
+            start_time = time.perf_counter()
+            try:
+                module = importlib.import_module(name)
+            except ImportError as e:
+                error = error or e
+                continue
+            logger.debug(f"Lazy import of {name} took {(time.perf_counter() - start_time) * 1000:.0f}ms")
+            return module
+        raise error
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __bool__(self) -> bool:
+        if self._module is not None:
+            return True
+        for name in self._names:
+            try:
+                if importlib.util.find_spec(name) is not None:
+                    return True
+            except (ImportError, ValueError):
+                pass
+        return False
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._names[0]!r}{' (loaded)' if self.loaded else ''}>"
+
+
+def lazy_import(name: str, *fallbacks: str) -> LazyModule:
+    """Module imported on first use; fallbacks are tried in order if name is missing"""
+    return LazyModule(name, *fallbacks)
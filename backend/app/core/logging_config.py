@@ -0,0 +1,93 @@
+from typing import Dict, Optional
+import atexit
+import copy
+import logging
+import logging.handlers
+import queue
+import sys
+
+from pythonjsonlogger import jsonlogger
+
+from app.config.settings import settings
+from app.core.tracing import TraceContextFilter
+
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [trace=%(trace_id)s] %(message)s"
+JSON_FORMAT = "%(asctime)s %(name)s %(levelname)s %(message)s %(trace_id)s %(span_id)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def parse_module_levels(value: str) -> Dict[str, int]:
+    """
+    "app.agents=INFO,app.routers.permits=DEBUG" -> {"app.agents": 20, ...}
+    """
+    levels = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        module, level = item.split("=", 1)
+        levels[module.strip()] = logging.getLevelName(level.strip().upper())
+    return {module: level for module, level in levels.items() if isinstance(level, int)}
+
+
+class DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler.prepare() formats the message in the emitting thread so the
+    record can be pickled; the queue here is in-process, so only copy the
+    record and leave msg % args and the traceback to the listener thread
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.log_json:
+        return jsonlogger.JsonFormatter(JSON_FORMAT, rename_fields={"asctime": "timestamp", "levelname": "level", "name": "logger"})
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def configure_logging():
+    """
+    Root logger -> QueueHandler -> background QueueListener -> stdout.
+
+    Request handlers only enqueue the record; formatting (JSON or text) and the
+    stream write happen on the listener thread. Records below the effective
+    level of their logger are discarded before any message formatting, so
+    lazy %-style debug calls cost one level check in production.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_build_formatter())
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = DeferredFormatQueueHandler(log_queue)
+    # trace ids live in contextvars of the emitting task: resolve them before enqueueing
+    queue_handler.addFilter(TraceContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(logging.DEBUG if settings.debug else logging.getLevelName(settings.log_level.upper()))
+
+    for module, level in parse_module_levels(settings.log_module_levels).items():
+        logging.getLogger(module).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """
+    Flush queued records and stop the listener thread
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
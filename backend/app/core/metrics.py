@@ -0,0 +1,231 @@
+from typing import Any, Callable, Optional, Set
+from functools import wraps
+import hmac
+import ipaddress
+import os
+import threading
+import time
+
+from prometheus_client import (
+    CollectorRegistry, Counter, Gauge, Histogram, CONTENT_TYPE_LATEST, generate_latest
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from app.config.settings import settings
+from app.core.tracing import span
+
+
+# Analysis steps take seconds to minutes: buckets up to 3 minutes
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 90, 120, 180)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "hse_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status", "tenant"]
+)
+ORCHESTRATOR_STEP_DURATION = Histogram(
+    "hse_orchestrator_step_duration_seconds",
+    "Duration of each AdvancedHSEOrchestrator step",
+    ["step", "tenant"],
+    buckets=SLOW_BUCKETS
+)
+SPECIALIST_DURATION = Histogram(
+    "hse_specialist_duration_seconds",
+    "Specialist analysis latency",
+    ["specialist", "outcome"],
+    buckets=SLOW_BUCKETS
+)
+SPECULATION_OUTCOMES = Counter(
+    "hse_speculation_outcomes_total",
+    "Speculative specialist starts: used (classifier confirmed), discarded (rejected) or missed (activated without speculation)",
+    ["mode", "specialist", "outcome"]
+)
+SPECIALIST_ERRORS = Counter(
+    "hse_specialist_errors_total",
+    "Failed specialist analyses",
+    ["specialist", "error_type"]
+)
+LLM_CALL_DURATION = Histogram(
+    "hse_llm_call_duration_seconds",
+    "LLM call latency",
+    ["model", "caller", "outcome"],
+    buckets=SLOW_BUCKETS
+)
+LLM_TOKENS = Counter(
+    "hse_llm_tokens_total",
+    "LLM tokens by direction",
+    ["model", "direction"]
+)
+VECTOR_SEARCH_DURATION = Histogram(
+    "hse_vector_search_duration_seconds",
+    "Vector search latency by method",
+    ["method", "tenant"]
+)
+DOCUMENTS_INGESTED = Counter(
+    "hse_documents_ingested_total",
+    "Processed document uploads",
+    ["tenant", "outcome"]
+)
+INGESTION_BYTES = Counter(
+    "hse_ingested_bytes_total",
+    "Bytes of uploaded documents processed",
+    ["tenant"]
+)
+INGESTION_DURATION = Histogram(
+    "hse_ingestion_duration_seconds",
+    "Document processing time (extraction, chunking, vectorization)",
+    ["tenant"],
+    buckets=SLOW_BUCKETS
+)
+STARTUP_DURATION = Gauge(
+    "hse_startup_duration_seconds",
+    "Process startup phases (import, lifespan, total until serving, warmup)",
+    ["phase"]
+)
+WARMUP_COMPONENT_READY = Gauge(
+    "hse_warmup_component_ready",
+    "1 once a background warm-up component is available",
+    ["component"]
+)
+
+
+_tenant_labels: Set[str] = set()
+_tenant_labels_lock = threading.Lock()
+
+
+def tenant_label(tenant_id: Any) -> str:
+    """
+    Cardinality control: only the first metrics_max_tenant_labels tenants get
+    their own label value, later ones are reported as "other"
+    """
+    if tenant_id is None:
+        return "none"
+    if not settings.metrics_tenant_labels:
+        return "all"
+    value = str(tenant_id)
+    if value in _tenant_labels:
+        return value
+    with _tenant_labels_lock:
+        if len(_tenant_labels) < settings.metrics_max_tenant_labels:
+            _tenant_labels.add(value)
+            return value
+    return "other"
+
+
+def observe_vector_search(method: str):
+    """
+    Decorator timing (and tracing) an async vector search; the tenant comes from
+    the tenant_id argument or filters["tenant_id"]
+    """
+    def decorator(func: Callable):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            filters = kwargs.get("filters") or {}
+            tenant_id = kwargs.get("tenant_id", filters.get("tenant_id"))
+            start = time.perf_counter()
+            try:
+                with span(f"vector.{method}", tenant_id=tenant_id):
+                    return await func(*args, **kwargs)
+            finally:
+                VECTOR_SEARCH_DURATION.labels(method, tenant_label(tenant_id)).observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def record_llm_usage(model: str, response: Any):
+    """
+    Count prompt/completion tokens when the response exposes usage metadata
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_token_count", 0) or 0
+    completion_tokens = getattr(usage, "candidates_token_count", 0) or 0
+    if prompt_tokens:
+        LLM_TOKENS.labels(model, "prompt").inc(prompt_tokens)
+    if completion_tokens:
+        LLM_TOKENS.labels(model, "completion").inc(completion_tokens)
+
+
+class DatabasePoolCollector:
+    """
+    Pool utilisation read at scrape time: the shared sync and async engines
+    plus every cached dedicated-tenant engine. Pools are per process, so in
+    multiprocess mode the series carry the pid of the worker that answered
+    the scrape.
+    """
+
+    def __init__(self, pid: Optional[int] = None):
+        self.pid = pid
+
+    def collect(self):
+        from app.config.database import engine, async_engine
+        from app.services.tenant_database_service import tenant_db_service
+
+        labels = ["pool"] if self.pid is None else ["pool", "pid"]
+        size = GaugeMetricFamily("hse_db_pool_size", "Configured pool size", labels=labels)
+        checked_out = GaugeMetricFamily("hse_db_pool_checked_out", "Connections in use", labels=labels)
+        checked_in = GaugeMetricFamily("hse_db_pool_checked_in", "Idle pooled connections", labels=labels)
+        overflow = GaugeMetricFamily("hse_db_pool_overflow", "Connections above pool_size", labels=labels)
+
+        values = {}
+        for name, pool in [("shared", engine.pool), ("shared_async", async_engine.sync_engine.pool)]:
+            values[name] = [pool.size(), pool.checkedout(), pool.checkedin(), pool.overflow()]
+
+        # Tenants folded into "other" are summed into one series
+        for tenant_pool in tenant_db_service.get_pool_metrics():
+            totals = values.setdefault(f"tenant:{tenant_label(tenant_pool['tenant_id'])}", [0, 0, 0, 0])
+            for i, key in enumerate(("pool_size", "checked_out", "checked_in", "overflow")):
+                totals[i] += tenant_pool[key]
+
+        for name, (pool_size, out, idle, over) in values.items():
+            label_values = [name] if self.pid is None else [name, str(self.pid)]
+            size.add_metric(label_values, pool_size)
+            checked_out.add_metric(label_values, out)
+            checked_in.add_metric(label_values, idle)
+            overflow.add_metric(label_values, over)
+
+        yield from (size, checked_out, checked_in, overflow)
+
+
+def render_metrics() -> tuple:
+    """
+    Exposition body and content type; aggregates all workers when
+    PROMETHEUS_MULTIPROC_DIR is set
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        # Custom collectors are not shared through the multiprocess files
+        registry.register(DatabasePoolCollector(pid=os.getpid()))
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    from prometheus_client import REGISTRY
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def metrics_access_allowed(client_host: Optional[str], authorization: Optional[str]) -> bool:
+    """
+    /metrics exposes tenant ids: with metrics_token set the bearer token is
+    required, otherwise only peers in metrics_allowed_networks may scrape
+    """
+    if settings.metrics_token:
+        expected = f"Bearer {settings.metrics_token}"
+        return hmac.compare_digest((authorization or "").encode(), expected.encode())
+    try:
+        address = ipaddress.ip_address(client_host or "")
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(network, strict=False) for network in settings.metrics_allowed_networks)
+
+
+_pool_collector: Optional[DatabasePoolCollector] = None
+
+
+def register_pool_collector():
+    """Idempotent: the lifespan may run more than once per process (tests)"""
+    global _pool_collector
+    if _pool_collector is None:
+        from prometheus_client import REGISTRY
+        _pool_collector = DatabasePoolCollector()
+        REGISTRY.register(_pool_collector)
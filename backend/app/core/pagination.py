@@ -0,0 +1,117 @@
+"""
+Keyset (cursor) pagination on (created_at, id) with optional total counts
+"""
+from typing import Dict, Optional, Tuple
+from datetime import datetime
+import base64
+import json
+import time
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, func, tuple_
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+
+COUNT_MODES = ("exact", "cached", "estimate", "none")
+COUNT_CACHE_TTL_SECONDS = 30
+COUNT_CACHE_MAX_ENTRIES = 1024
+
+# (compiled query, params) -> (expires_at, count)
+_count_cache: Dict[Tuple[str, Tuple], Tuple[float, int]] = {}
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode the last row of a page as an opaque cursor
+    """
+    payload = json.dumps([created_at.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+def apply_keyset(query: Select, model, cursor: Optional[str]) -> Select:
+    """
+    Order by (created_at, id) descending and seek past the cursor
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) < (created_at, row_id))
+    return query.order_by(model.created_at.desc(), model.id.desc())
+
+
+async def fetch_page(db: AsyncSession, query: Select, model, cursor: Optional[str], limit: int, offset: int = 0):
+    """
+    Return (rows, next_cursor) for one page; fetches limit + 1 rows to detect the next page.
+    offset is only meant for legacy page-number clients
+    """
+    result = await db.execute(apply_keyset(query, model, cursor).offset(offset).limit(limit + 1))
+    rows = result.scalars().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return rows, next_cursor
+
+
+async def count_rows(db: AsyncSession, query: Select, mode: str) -> Optional[int]:
+    """
+    Total rows for a filtered query according to the requested count mode:
+    exact (COUNT), cached (COUNT memoized for a few seconds),
+    estimate (planner row estimate), none (skip)
+    """
+    if mode == "none":
+        return None
+
+    if mode == "estimate":
+        if db.bind.dialect.name == "postgresql":
+            try:
+                # Bound dialect with inlined literals: expanding IN lists and
+                # dialect-specific constructs render as they would when executed
+                compiled = query.order_by(None).compile(
+                    dialect=db.bind.dialect,
+                    compile_kwargs={"literal_binds": True}
+                )
+            except (CompileError, NotImplementedError):
+                compiled = None
+            if compiled is not None:
+                # exec_driver_sql: no bind parsing of ":" inside literals
+                connection = await db.connection()
+                plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+        # No planner estimate (other backends, values without a literal form): exact count
+        mode = "exact"
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+
+    if mode == "cached":
+        compiled = count_query.compile(dialect=db.bind.dialect)
+        key = (str(compiled), tuple(sorted((k, str(v)) for k, v in compiled.params.items())))
+        cached = _count_cache.get(key)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+        total = await db.scalar(count_query)
+        if len(_count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+            _count_cache.clear()
+        _count_cache[key] = (now + COUNT_CACHE_TTL_SECONDS, total)
+        return total
+
+    return await db.scalar(count_query)
@@ -1,5 +1,5 @@
-from typing import List, Dict, Set
-from functools import wraps
+from typing import List, Dict, Set, FrozenSet, Tuple
+from functools import wraps, lru_cache
 from fastapi import HTTPException, status
 
 from app.models.user import User
@@ -61,28 +61,60 @@ def get_user_permissions(role: str, custom_permissions: List[str] = None) -> Set
     return permissions
 
 
+WILDCARD = "*"
+
+
+class CompiledPermissions:
+    """
+    Permission set compiled once per (role, custom permissions): exact grants in a
+    frozenset, wildcard grants ("tenant.*", "*") in a trie of dot-separated segments.
+    """
+    __slots__ = ("exact", "trie")
+
+    def __init__(self, permissions: Set[str]):
+        self.exact: FrozenSet[str] = frozenset(p for p in permissions if p != WILDCARD and not p.endswith(".*"))
+        self.trie: Dict[str, dict] = {}
+        for perm in permissions:
+            if perm == WILDCARD:
+                self.trie[WILDCARD] = True
+            elif perm.endswith(".*"):
+                node = self.trie
+                for segment in perm[:-2].split("."):
+                    node = node.setdefault(segment, {})
+                node[WILDCARD] = True
+
+    def allows(self, required_permission: str) -> bool:
+        if required_permission in self.exact:
+            return True
+        # A wildcard grants its own node and everything below it
+        node = self.trie
+        for segment in required_permission.split("."):
+            if WILDCARD in node:
+                return True
+            node = node.get(segment)
+            if node is None:
+                return False
+        return WILDCARD in node
+
+
+@lru_cache(maxsize=1024)
+def compile_permissions(role: str, custom_permissions: Tuple[str, ...] = ()) -> CompiledPermissions:
+    """
+    Cached per (role, custom permissions); a change to a user's permissions is a new key.
+    Call compile_permissions.cache_clear() if PERMISSION_LEVELS is modified at runtime.
+    """
+    return CompiledPermissions(get_user_permissions(role, list(custom_permissions)))
+
+
+def get_compiled_permissions(user: User) -> CompiledPermissions:
+    return compile_permissions(user.role, tuple(user.permissions or ()))
+
+
 def has_permission(user: User, required_permission: str) -> bool:
     """
     Check if user has required permission
     """
-    user_permissions = get_user_permissions(user.role, user.permissions or [])
-    
-    # Check for global wildcard (super admin)
-    if "*" in user_permissions:
-        return True
-    
-    # Check exact match
-    if required_permission in user_permissions:
-        return True
-    
-    # Check wildcard permissions
-    for perm in user_permissions:
-        if perm.endswith(".*"):
-            prefix = perm[:-2]
-            if required_permission.startswith(prefix):
-                return True
-    
-    return False
+    return get_compiled_permissions(user).allows(required_permission)
 
 
 def require_permission(permission: str):
@@ -0,0 +1,203 @@
+from typing import Any, Dict, List, Optional
+from contextvars import ContextVar
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+import uuid
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config.settings import settings
+
+try:
+    from pyinstrument import Profiler
+    from pyinstrument.renderers import SpeedscopeRenderer
+    PYINSTRUMENT_AVAILABLE = True
+except ImportError:
+    PYINSTRUMENT_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Extra data attached to the profile of the current request (step timings, ...)
+_profile_data: ContextVar[Optional[Dict[str, Any]]] = ContextVar("profile_data", default=None)
+
+
+def annotate_profile(**values):
+    """
+    Attach values to the profile of the current request; no-op when the
+    request is not being profiled
+    """
+    data = _profile_data.get()
+    if data is not None:
+        data.update(values)
+
+
+class ProfilingService:
+    """
+    On-demand request profiling with pyinstrument (wall-clock, async-aware).
+
+    A request is profiled when an admin sends the X-Profile header, or when it
+    matches a target set through the admin API (tenant and/or path prefix,
+    for the next N requests). Targets live in Redis so every worker honours
+    them. Profiles are written to profiling_dir keyed by request id: the
+    pyinstrument HTML flamegraph, a speedscope JSON and a metadata file.
+    """
+
+    TARGETS_KEY = "profiling:targets"
+    REMAINING_KEY = "profiling:remaining:{}"
+
+    def __init__(self, directory: str, max_profiles: int, redis_url: str, refresh_seconds: float = 2.0):
+        self.directory = directory
+        self.max_profiles = max_profiles
+        self.redis_url = redis_url
+        self.refresh_seconds = refresh_seconds
+        self._redis: Optional[aioredis.Redis] = None
+        self._targets: List[dict] = []
+        self._targets_loaded_at = 0.0
+
+    @property
+    def available(self) -> bool:
+        return settings.profiling_enabled and PYINSTRUMENT_AVAILABLE
+
+    def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = aioredis.Redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    # Targets
+
+    async def get_targets(self, refresh: bool = False) -> List[dict]:
+        now = time.monotonic()
+        if refresh or now - self._targets_loaded_at > self.refresh_seconds:
+            try:
+                raw = await self._get_redis().hgetall(self.TARGETS_KEY)
+                self._targets = [json.loads(value) for value in raw.values()]
+            except redis.RedisError as e:
+                logger.warning(f"Profiling targets unavailable: {e}")
+                self._targets = []
+            self._targets_loaded_at = now
+        return self._targets
+
+    async def add_target(self, tenant_id: Optional[int], path_prefix: Optional[str], count: int, ttl_minutes: int) -> dict:
+        target = {
+            "id": uuid.uuid4().hex[:12],
+            "tenant_id": tenant_id,
+            "path_prefix": path_prefix,
+            "count": count,
+            "expires_at": time.time() + ttl_minutes * 60,
+        }
+        client = self._get_redis()
+        await client.set(self.REMAINING_KEY.format(target["id"]), count, ex=ttl_minutes * 60)
+        await client.hset(self.TARGETS_KEY, target["id"], json.dumps(target))
+        await self.get_targets(refresh=True)
+        return target
+
+    async def remove_target(self, target_id: str) -> bool:
+        client = self._get_redis()
+        await client.delete(self.REMAINING_KEY.format(target_id))
+        removed = await client.hdel(self.TARGETS_KEY, target_id)
+        await self.get_targets(refresh=True)
+        return bool(removed)
+
+    async def claim(self, tenant_id: Optional[int], path: str) -> Optional[str]:
+        """
+        Id of a target matching the request with profiles left, consuming one
+        """
+        for target in await self.get_targets():
+            if target["tenant_id"] is not None and target["tenant_id"] != tenant_id:
+                continue
+            if target["path_prefix"] and not path.startswith(target["path_prefix"]):
+                continue
+            try:
+                remaining = await self._get_redis().decr(self.REMAINING_KEY.format(target["id"]))
+                if remaining >= 0:
+                    return target["id"]
+                # Used up or expired
+                await self.remove_target(target["id"])
+            except redis.RedisError as e:
+                logger.warning(f"Profiling target {target['id']} not claimed: {e}")
+        return None
+
+    # Profiles
+
+    def start(self) -> "Profiler":
+        profiler = Profiler(interval=settings.profiling_interval_seconds, async_mode="enabled")
+        profiler.start()
+        return profiler
+
+    def bind_request_data(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+        _profile_data.set(data)
+        return data
+
+    async def save(self, request_id: str, profiler: "Profiler", metadata: Dict[str, Any]):
+        await asyncio.to_thread(self._write, request_id, profiler, metadata)
+
+    def _write(self, request_id: str, profiler: "Profiler", metadata: Dict[str, Any]):
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, request_id)
+        with open(f"{base}.html", "w", encoding="utf-8") as html_file:
+            html_file.write(profiler.output_html())
+        with open(f"{base}.speedscope.json", "w", encoding="utf-8") as speedscope_file:
+            speedscope_file.write(profiler.output(SpeedscopeRenderer()))
+        with open(f"{base}.json", "w", encoding="utf-8") as metadata_file:
+            json.dump(metadata, metadata_file, default=str)
+        self._prune()
+
+    def _prune(self):
+        profiles = self._metadata_files()
+        for path in profiles[self.max_profiles:]:
+            stem = path[:-len(".json")]
+            for suffix in (".json", ".html", ".speedscope.json"):
+                try:
+                    os.remove(stem + suffix)
+                except OSError:
+                    pass
+
+    def _metadata_files(self) -> List[str]:
+        """Newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        paths = [
+            os.path.join(self.directory, name) for name in os.listdir(self.directory)
+            if name.endswith(".json") and not name.endswith(".speedscope.json")
+        ]
+        return sorted(paths, key=os.path.getmtime, reverse=True)
+
+    def list_profiles(self, limit: int = 50, tenant_id: Optional[int] = None) -> List[dict]:
+        profiles = []
+        for path in self._metadata_files():
+            with open(path, encoding="utf-8") as metadata_file:
+                metadata = json.load(metadata_file)
+            if tenant_id is None or metadata.get("tenant_id") == tenant_id:
+                profiles.append(metadata)
+            if len(profiles) >= limit:
+                break
+        return profiles
+
+    def get_profile_path(self, request_id: str, kind: str) -> Optional[str]:
+        """kind: "json" (metadata), "html" or "speedscope.json"; None if missing"""
+        if not REQUEST_ID.match(request_id):
+            return None
+        path = os.path.join(self.directory, f"{request_id}.{kind}")
+        return path if os.path.exists(path) else None
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+# Global profiling service
+profiling_service = ProfilingService(
+    directory=settings.profiling_dir,
+    max_profiles=settings.profiling_max_profiles,
+    redis_url=settings.redis_url
+)
@@ -0,0 +1,166 @@
+from typing import List, Optional, Tuple
+from collections import OrderedDict
+import logging
+import time
+
+import redis
+import redis.asyncio as aioredis
+
+from app.config.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+# (redis key, requests, window seconds)
+RateLimitRule = Tuple[str, int, int]
+
+# GCRA over several keys in one round trip. A request is admitted only if every
+# key admits it; requests already admitted locally (pending) are charged anyway.
+# Returns {allowed, retry_after_ms, remaining}.
+GCRA_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = now_parts[1] * 1000 + math.floor(now_parts[2] / 1000)
+local pending = tonumber(ARGV[1])
+local allowed = 1
+local retry_after = 0
+local remaining = -1
+local tats = {}
+
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[i * 2])
+    local window = tonumber(ARGV[i * 2 + 1])
+    local interval = window / limit
+    local tat = tonumber(redis.call('GET', key)) or now
+    if tat < now then
+        tat = now
+    end
+    tat = tat + pending * interval
+    tats[i] = {tat, interval, window}
+
+    local allow_at = tat + interval - window
+    if now < allow_at then
+        allowed = 0
+        retry_after = math.max(retry_after, allow_at - now)
+    else
+        local left = math.floor((now + window - tat - interval) / interval)
+        if remaining < 0 or left < remaining then
+            remaining = left
+        end
+    end
+end
+
+for i, key in ipairs(KEYS) do
+    local tat = tats[i][1]
+    if allowed == 1 then
+        tat = tat + tats[i][2]
+    end
+    if tat > now then
+        redis.call('SET', key, math.ceil(tat), 'PX', math.ceil(tat - now))
+    end
+end
+
+if allowed == 0 then
+    remaining = 0
+end
+return {allowed, math.ceil(retry_after), remaining}
+"""
+
+
+class _LocalBucket:
+    __slots__ = ("tokens", "pending", "expires_at", "blocked_until")
+
+    def __init__(self):
+        self.tokens = 0
+        self.pending = 0
+        self.expires_at = 0.0
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """
+    Atomic GCRA rate limiter backed by a Redis Lua script.
+
+    A small per-worker token bucket sits in front of Redis: after Redis admits a
+    request, the worker may admit up to local_fraction of the tightest limit on
+    its own and charges them to Redis with the next call. Clients blocked by
+    Redis are rejected locally until their retry time.
+    """
+
+    def __init__(self, redis_url: str, local_fraction: float, max_local_buckets: int = 10000):
+        self.redis_url = redis_url
+        self.local_fraction = local_fraction
+        self.max_local_buckets = max_local_buckets
+        self._redis: Optional[aioredis.Redis] = None
+        self._script = None
+        self._buckets: "OrderedDict[Tuple[str, ...], _LocalBucket]" = OrderedDict()
+        self._redis_down_until = 0.0
+
+    async def check(self, rules: List[RateLimitRule]) -> Tuple[bool, float]:
+        """
+        Returns (allowed, retry_after_seconds)
+        """
+        now = time.monotonic()
+        bucket = self._get_bucket(tuple(rule[0] for rule in rules))
+
+        if bucket.blocked_until > now:
+            return False, bucket.blocked_until - now
+
+        if bucket.tokens > 0 and bucket.expires_at > now:
+            bucket.tokens -= 1
+            bucket.pending += 1
+            return True, 0.0
+
+        if self._redis_down_until > now:
+            return True, 0.0
+
+        # Charge the locally admitted requests together with this one
+        pending, bucket.pending, bucket.tokens = bucket.pending, 0, 0
+        try:
+            allowed, retry_after_ms, remaining = await self._eval(rules, pending)
+        except redis.RedisError as e:
+            # Fail open, and leave Redis alone for a few seconds
+            logger.error(f"Redis error in rate limiting: {e}")
+            self._redis_down_until = now + 5
+            return True, 0.0
+
+        if not allowed:
+            bucket.blocked_until = now + retry_after_ms / 1000
+            return False, retry_after_ms / 1000
+
+        tightest = min(rules, key=lambda rule: rule[1] / rule[2])
+        local_budget = int(tightest[1] * self.local_fraction)
+        if local_budget > 0 and remaining > 0:
+            bucket.tokens = min(local_budget, remaining)
+            bucket.expires_at = now + tightest[2] * self.local_fraction
+        return True, 0.0
+
+    async def _eval(self, rules: List[RateLimitRule], pending: int) -> Tuple[int, int, int]:
+        if self._script is None:
+            self._redis = aioredis.Redis.from_url(self.redis_url, decode_responses=True)
+            self._script = self._redis.register_script(GCRA_SCRIPT)
+
+        args = [pending]
+        for _, requests, window in rules:
+            args.extend([requests, window * 1000])
+        allowed, retry_after_ms, remaining = await self._script(keys=[rule[0] for rule in rules], args=args)
+        return int(allowed), int(retry_after_ms), int(remaining)
+
+    def _get_bucket(self, key: Tuple[str, ...]) -> _LocalBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _LocalBucket()
+            if len(self._buckets) > self.max_local_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+            self._script = None
+
+
+# Global rate limiter
+rate_limiter = RateLimiter(settings.redis_url, local_fraction=settings.rate_limit_local_fraction)
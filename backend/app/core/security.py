@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Union, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
@@ -11,8 +13,18 @@ from app.config.settings import settings
 from app.config.database import get_db
 
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: hashes outside [min_rounds, max_rounds] need an update
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds
+)
+
+# bcrypt releases the GIL: run it on a few dedicated threads, off the event loop
+_password_executor = ThreadPoolExecutor(max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt")
+_password_slots = asyncio.Semaphore(settings.password_hash_max_pending)
 
 
 def create_access_token(
@@ -58,6 +70,36 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def _run_password_task(func, *args):
+    # Bounded queue: callers beyond max_pending wait here instead of piling up on the executor
+    async with _password_slots:
+        return await asyncio.get_running_loop().run_in_executor(_password_executor, func, *args)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify password against hash without blocking the event loop
+    """
+    return await _run_password_task(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify password and return a new hash when the stored one does not match
+    the configured work factor (None otherwise)
+    """
+    if not settings.password_rehash_on_login:
+        return await verify_password_async(plain_password, hashed_password), None
+    return await _run_password_task(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash password without blocking the event loop
+    """
+    return await _run_password_task(pwd_context.hash, password)
+
+
 def decode_token(token: str) -> dict:
     """
     Decode and validate JWT token
@@ -98,6 +140,34 @@ def decode_token(token: str) -> dict:
         )
 
 
+def get_request_token_payload(request: Request) -> Optional[dict]:
+    """
+    Decode the bearer token once per request.
+    The payload (or the validation error) is kept on request.state so the
+    middlewares and get_current_user share a single verification.
+    """
+    state = request.state
+    if hasattr(state, "token_payload"):
+        if state.token_error is not None:
+            raise state.token_error
+        return state.token_payload
+    
+    payload = None
+    error = None
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        try:
+            payload = decode_token(auth_header[len("Bearer "):])
+        except HTTPException as e:
+            error = e
+    
+    state.token_payload = payload
+    state.token_error = error
+    if error is not None:
+        raise error
+    return payload
+
+
 # HTTP Bearer security scheme
 security = HTTPBearer()
 
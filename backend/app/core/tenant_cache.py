@@ -0,0 +1,18 @@
+from typing import Any, Hashable
+
+from app.config.settings import settings
+from app.core.cache import InvalidatingTTLCache
+
+
+class TenantCache(InvalidatingTTLCache):
+    """
+    Detached Tenant rows keyed by ("id", id), ("domain", domain) and ("host", host).
+    Invalidating a tenant id also drops every cached miss.
+    """
+
+    def matches(self, key: Hashable, value: Any, target: Any) -> bool:
+        return value is None or value.id == target
+
+
+# Global tenant cache
+tenant_cache = TenantCache("tenant_cache:invalidate", ttl_seconds=settings.tenant_cache_ttl_seconds)
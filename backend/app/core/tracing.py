@@ -0,0 +1,177 @@
+from typing import Any, Callable, Iterable, Optional
+from contextlib import contextmanager
+from functools import wraps
+import logging
+
+from app.config.settings import settings
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor, SpanExporter, SpanExportResult
+    )
+    from opentelemetry.sdk.trace.sampling import ParentBasedTraceIdRatio
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+_tracer = None
+
+ATTRIBUTE_TYPES = (str, bool, int, float)
+
+
+if OTEL_AVAILABLE:
+    class FileSpanExporter(SpanExporter):
+        """
+        Writes finished spans as JSON lines (tests and local debugging)
+        """
+
+        def __init__(self, path: str):
+            self.path = path
+
+        def export(self, spans) -> "SpanExportResult":
+            try:
+                with open(self.path, "a", encoding="utf-8") as trace_file:
+                    for finished_span in spans:
+                        trace_file.write(finished_span.to_json(indent=None) + "\n")
+                return SpanExportResult.SUCCESS
+            except OSError as e:
+                logger.warning(f"Could not write spans to {self.path}: {e}")
+                return SpanExportResult.FAILURE
+
+        def shutdown(self):
+            pass
+
+
+class TraceContextFilter(logging.Filter):
+    """
+    Adds trace_id / span_id to every log record so log lines can be joined with traces
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.trace_id = current_trace_id() or "-"
+        record.span_id = current_span_id() or "-"
+        return True
+
+
+def configure_tracing():
+    """
+    Install the tracer provider and exporter selected by settings.tracing_exporter
+    ("otlp" to a local collector, "file", "console"). No-op when disabled or
+    when the OpenTelemetry SDK is not installed.
+    """
+    global _tracer
+    if _tracer is not None or not settings.tracing_enabled:
+        return
+    if not OTEL_AVAILABLE:
+        logger.warning("Tracing enabled but opentelemetry-sdk is not installed")
+        return
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.tracing_service_name, "service.version": settings.app_version}),
+        sampler=ParentBasedTraceIdRatio(settings.tracing_sample_ratio)
+    )
+    if settings.tracing_exporter == "file":
+        provider.add_span_processor(SimpleSpanProcessor(FileSpanExporter(settings.tracing_file_path)))
+    elif settings.tracing_exporter == "console":
+        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+    else:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)))
+
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer("hse")
+
+    from app.config.database import engine, async_engine
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+    logger.info(f"Tracing enabled ({settings.tracing_exporter} exporter)")
+
+
+def shutdown_tracing():
+    if _tracer is not None:
+        provider = trace.get_tracer_provider()
+        if hasattr(provider, "shutdown"):
+            provider.shutdown()
+
+
+def _clean_attributes(attributes: dict) -> dict:
+    return {key: value for key, value in attributes.items() if isinstance(value, ATTRIBUTE_TYPES)}
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Child span of the current one; yields None when tracing is off
+    """
+    if _tracer is None:
+        yield None
+        return
+    with _tracer.start_as_current_span(name, attributes=_clean_attributes(attributes)) as current:
+        yield current
+
+
+def traced(name: Optional[str] = None, attributes: Iterable[str] = ()):
+    """
+    Decorator wrapping an async function in a span; the keyword arguments
+    listed in attributes become span attributes
+    """
+    def decorator(func: Callable):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with span(span_name, **{key: kwargs.get(key) for key in attributes}):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_trace_id() -> Optional[str]:
+    if _tracer is None:
+        return None
+    context = trace.get_current_span().get_span_context()
+    return format(context.trace_id, "032x") if context.is_valid else None
+
+
+def current_span_id() -> Optional[str]:
+    if _tracer is None:
+        return None
+    context = trace.get_current_span().get_span_context()
+    return format(context.span_id, "016x") if context.is_valid else None
+
+
+def instrument_engine(target_engine: Any):
+    """
+    One span per statement through SQLAlchemy cursor events
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def _start_query_span(conn, cursor, statement, parameters, context, executemany):
+        if _tracer is not None:
+            context._trace_span = _tracer.start_span(
+                "db.query",
+                attributes={"db.system": target_engine.dialect.name, "db.statement": statement[:500]}
+            )
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _end_query_span(conn, cursor, statement, parameters, context, executemany):
+        query_span = getattr(context, "_trace_span", None)
+        if query_span is not None:
+            query_span.end()
+
+    @event.listens_for(target_engine, "handle_error")
+    def _fail_query_span(exception_context):
+        execution_context = exception_context.execution_context
+        query_span = getattr(execution_context, "_trace_span", None) if execution_context else None
+        if query_span is not None:
+            query_span.record_exception(exception_context.original_exception)
+            query_span.end()
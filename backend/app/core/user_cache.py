@@ -0,0 +1,31 @@
+from typing import Any, Hashable, Optional
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.config.settings import settings
+from app.core.cache import InvalidatingTTLCache, MISSING
+from app.models.user import User
+
+
+class UserCache(InvalidatingTTLCache):
+    """
+    Detached User snapshots keyed by (user_id, token iat).
+    Invalidate with the user id on password change, deactivation or update.
+    """
+
+    def matches(self, key: Hashable, value: Any, target: Any) -> bool:
+        return key[0] == target
+
+    def get_user(self, user_id: int, issued_at) -> Optional[User]:
+        user = self.get((user_id, issued_at))
+        return None if user is MISSING else user
+
+    def put_user(self, user: User, issued_at):
+        # Store a detached copy so the session-bound instance is never shared
+        snapshot = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+        make_transient_to_detached(snapshot)
+        self.set((user.id, issued_at), snapshot)
+
+
+# Global authenticated-user cache
+user_cache = UserCache("user_cache:invalidate", ttl_seconds=settings.user_cache_ttl_seconds)
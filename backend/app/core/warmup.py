@@ -0,0 +1,106 @@
+from typing import Callable, Dict, Optional
+import asyncio
+import logging
+import time
+
+from app.config.settings import settings
+from app.core.metrics import STARTUP_DURATION, WARMUP_COMPONENT_READY
+
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_listeners():
+    from app.core.tenant_cache import tenant_cache
+    from app.core.user_cache import user_cache
+    failed = [cache.channel for cache in (tenant_cache, user_cache) if not cache.start_listener()]
+    if failed:
+        raise RuntimeError(f"invalidation listener unavailable on {', '.join(failed)}")
+
+
+def _storage():
+    from app.services.storage_service import StorageService
+    StorageService()
+
+
+def _vector_service():
+    from app.services.service_factory import VectorServiceFactory
+    vector_service = VectorServiceFactory.get_vector_service()
+    service_info = VectorServiceFactory.get_service_info()
+    if vector_service is None:
+        raise RuntimeError("vector service unavailable - running in PostgreSQL-only mode")
+    logger.info(f"Vector Service initialized: {service_info['service_type']} ({service_info['performance_profile']})")
+
+
+def _agents():
+    # Import the specialist modules and build the shared instances before the first analysis
+    from app.agents.specialists import get_shared_specialists
+    get_shared_specialists()
+
+
+class StartupWarmup:
+    """
+    Connects to MinIO, Weaviate and Redis and preloads the agents in worker
+    threads after the application has started serving, instead of blocking
+    the lifespan. Failures are reported on /health/ready, not fatal.
+    """
+
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self.steps: Dict[str, Callable[[], None]] = {
+            "cache_listeners": _cache_listeners,
+            "storage": _storage,
+            "vector_service": _vector_service,
+            "agents": _agents,
+        }
+        self.components: Dict[str, dict] = {name: {"status": "pending"} for name in self.steps}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def done(self) -> bool:
+        return all(component["status"] != "pending" for component in self.components.values())
+
+    @property
+    def ready(self) -> bool:
+        return all(component["status"] == "ready" for component in self.components.values())
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="startup-warmup")
+
+    async def stop(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self):
+        start_time = time.perf_counter()
+        await asyncio.gather(*(self._run_step(name, step) for name, step in self.steps.items()))
+        duration = time.perf_counter() - start_time
+        STARTUP_DURATION.labels("warmup").set(duration)
+        logger.info(f"Warm-up finished in {duration:.2f}s: " + ", ".join(
+            f"{name}={component['status']}" for name, component in self.components.items()
+        ))
+
+    async def _run_step(self, name: str, step: Callable[[], None]):
+        start_time = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.to_thread(step), timeout=self.timeout_seconds)
+            self.components[name] = {"status": "ready"}
+            WARMUP_COMPONENT_READY.labels(name).set(1)
+        except asyncio.TimeoutError:
+            # The thread keeps running; a late success is picked up by the next request
+            self.components[name] = {"status": "timeout"}
+            logger.warning(f"Warm-up of {name} exceeded {self.timeout_seconds}s")
+        except Exception as e:
+            self.components[name] = {"status": "failed", "error": str(e)}
+            logger.warning(f"Warm-up of {name} failed: {e}")
+        self.components[name]["seconds"] = round(time.perf_counter() - start_time, 3)
+
+
+# Global startup warm-up
+startup_warmup = StartupWarmup(timeout_seconds=settings.startup_warmup_timeout_seconds)
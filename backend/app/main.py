@@ -1,68 +1,110 @@
+import time
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 import uvicorn
+import asyncio
 import logging
 from datetime import datetime
 
 from app.config.settings import settings
 from app.config.database import Base, engine
-from app.routers import auth, permits, documents, admin_tenants, public_tenants
+from app.routers import auth, permits, documents, admin_tenants, admin_profiling, public_tenants, audit_logs
 from app.middleware.security import SecurityMiddleware
 from app.middleware.tenant import TenantMiddleware
 from app.middleware.audit import AuditMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.core.tracing import configure_tracing, shutdown_tracing
+from app.core.logging_config import configure_logging
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO if not settings.debug else logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Configure logging (queue-based; the listener is flushed at interpreter exit)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
+def _record_startup_time(lifespan_started: float):
+    """
+    Import and lifespan phases against settings.startup_budget_seconds
+    (interpreter and uvicorn startup are measured by benchmarks/startup_time.py)
+    """
+    from app.core.metrics import STARTUP_DURATION
+    now = time.perf_counter()
+    phases = {
+        "import": lifespan_started - _import_started,
+        "lifespan": now - lifespan_started,
+        "total": now - _import_started,
+    }
+    for phase, seconds in phases.items():
+        STARTUP_DURATION.labels(phase).set(seconds)
+    
+    message = ", ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in phases.items())
+    if phases["total"] > settings.startup_budget_seconds:
+        logger.warning(f"Startup over budget ({settings.startup_budget_seconds * 1000:.0f}ms): {message}")
+    else:
+        logger.info(f"Startup: {message}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan events
     """
     # Startup
+    lifespan_started = time.perf_counter()
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Environment: {settings.environment}")
     
+    # Spans exported to a collector or file when tracing_enabled
+    configure_tracing()
+    
     # Skip database table creation - tables already exist
     logger.info("Skipping database table creation (tables already exist)")
     
-    # Verify external services connectivity
-    try:
-        # Test MinIO connection
-        from app.services.storage_service import StorageService
-        storage_service = StorageService()
-        logger.info("MinIO connection verified")
-        
-        # Initialize optimized vector service with native multi-tenancy
-        try:
-            from app.services.service_factory import VectorServiceFactory
-            vector_service = VectorServiceFactory.get_vector_service()
-            service_info = VectorServiceFactory.get_service_info()
-
-            if vector_service and vector_service.client:
-                logger.info(f"Vector Service initialized: {service_info['service_type']}")
-                logger.info(f"Performance: {service_info['performance_profile']}")
-                logger.info(f"Security: {service_info['security_level']}")
-            else:
-                logger.warning("Vector service unavailable - running in PostgreSQL-only mode")
-        except Exception as weaviate_error:
-            logger.warning(f"Vector service initialization failed: {weaviate_error}")
-        
-    except Exception as e:
-        logger.warning(f"External service connectivity issue: {e}")
-        # Don't fail startup, but log the warning
+    # MinIO, Weaviate, cache invalidation listeners and agents warm up in the
+    # background; /health/ready reports their state
+    from app.core.warmup import startup_warmup
+    startup_warmup.start()
+    
+    # Database pool gauges for /metrics
+    if settings.metrics_enabled:
+        from app.core.metrics import register_pool_collector
+        register_pool_collector()
+    
+    # Batched audit log writer
+    from app.core.audit_writer import audit_writer
+    await audit_writer.start()
+    
+    # Monthly audit_logs partitions and retention
+    from app.services.audit_partition_service import audit_partition_service
+    await audit_partition_service.start()
+    
+    # Dispose dedicated-tenant engines left idle
+    from app.services.tenant_database_service import tenant_db_service
+    await tenant_db_service.start()
+    
+    _record_startup_time(lifespan_started)
     
     yield
     
     # Shutdown
+    await startup_warmup.stop()
+    await audit_partition_service.stop()
+    await tenant_db_service.stop()
+    await audit_writer.stop()
+    from app.core.tenant_cache import tenant_cache
+    from app.core.user_cache import user_cache
+    tenant_cache.stop_listener()
+    user_cache.stop_listener()
+    from app.core.rate_limiter import rate_limiter
+    await rate_limiter.close()
+    from app.core.profiling import profiling_service
+    await profiling_service.close()
+    shutdown_tracing()
     logger.info(f"Shutting down {settings.app_name}")
 
 
@@ -115,7 +157,7 @@ def custom_openapi():
                 if any(tag in operation.get("tags", []) for tag in ["Authentication"]):
                     continue
                 # Skip specific public operations
-                if operation.get("operationId") in ["root", "health_check", "health_check_options", "system_info", "login"]:
+                if operation.get("operationId") in ["root", "health_check", "health_check_options", "liveness_check", "readiness_check", "system_info", "login"]:
                     continue
                 # Add security requirement
                 if "security" not in operation:
@@ -129,8 +171,12 @@ app.openapi = custom_openapi
 # Add custom middleware (order matters!)
 # These are added first so they execute after CORS
 app.add_middleware(AuditMiddleware)
+# Inside TenantMiddleware so profiles and targets know the tenant
+app.add_middleware(ProfilingMiddleware)
 app.add_middleware(TenantMiddleware)
 app.add_middleware(SecurityMiddleware)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
 
 # Add CORS middleware LAST so it runs FIRST
 # This ensures CORS headers are added before any other middleware runs
@@ -149,7 +195,9 @@ app.include_router(auth.router)
 app.include_router(permits.router)
 app.include_router(documents.router)
 app.include_router(admin_tenants.router)
+app.include_router(admin_profiling.router)
 app.include_router(public_tenants.router)
+app.include_router(audit_logs.router)
 
 
 @app.get("/")
@@ -221,6 +269,68 @@ async def health_check():
     return JSONResponse(content=health_status, status_code=status_code)
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """
+    Liveness probe: the process is up and the event loop responds.
+    No external dependency is checked, so a slow Weaviate never restarts the pod.
+    """
+    return {"status": "alive", "uptime_seconds": round(time.perf_counter() - _import_started, 1)}
+
+
+async def _ping_database():
+    from app.config.database import async_engine
+    from sqlalchemy import text
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: the database answers; background warm-up components are
+    reported and only required when settings.readiness_requires_warmup is set
+    """
+    from app.core.warmup import startup_warmup
+    
+    ready = True
+    checks = {}
+    try:
+        await asyncio.wait_for(_ping_database(), timeout=2.0)
+        checks["database"] = "connected"
+    except Exception as e:
+        checks["database"] = f"error: {str(e) or type(e).__name__}"
+        ready = False
+    
+    if settings.readiness_requires_warmup and not startup_warmup.ready:
+        ready = False
+    
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "checks": checks,
+            "warmup": startup_warmup.components
+        }
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """
+    Prometheus metrics (token or internal networks only)
+    """
+    if not settings.metrics_enabled:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    from app.core.metrics import metrics_access_allowed, render_metrics
+    # Direct peer, not X-Forwarded-For: the header is client-controlled
+    client_host = request.client.host if request.client else None
+    if not metrics_access_allowed(client_host, request.headers.get("Authorization")):
+        return JSONResponse(status_code=403, content={"detail": "Forbidden"})
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/api/v1/system/info")
 async def system_info():
     """
@@ -1,19 +1,22 @@
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.types import Message, Receive, Scope, Send
 import time
 import json
 import logging
+import re
 from datetime import datetime
 
-from app.config.database import SessionLocal
+from app.config.settings import settings
 from app.core.audit import get_client_ip, get_user_agent
+from app.core.audit_writer import audit_writer, build_audit_row
+from app.middleware.base import ASGIMiddleware
 
 
 logger = logging.getLogger(__name__)
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
+class AuditMiddleware(ASGIMiddleware):
     """
     Middleware for comprehensive audit logging of all API requests
     """
@@ -37,35 +40,55 @@ class AuditMiddleware(BaseHTTPMiddleware):
             ],
             "audit_methods": ["POST", "PUT", "DELETE", "PATCH"],
             "sensitive_headers": ["authorization", "cookie", "x-api-key"],
-            "sensitive_fields": ["password", "token", "secret", "key"]
+            "sensitive_fields": ["password", "token", "secret", "key"],
+            "max_body_bytes": settings.audit_body_capture_bytes
         }
+        
+        # "<sensitive key>": prefix, for bodies cut off before they parse as JSON
+        self._sensitive_json_key = re.compile(
+            r'"[^"]*(?:' + "|".join(self.audit_config["sensitive_fields"]) + r')[^"]*"\s*:\s*',
+            re.IGNORECASE
+        )
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def handle(self, request: Request, scope: Scope, receive: Receive, send: Send):
         start_time = time.time()
         
         # Check if this request should be audited
         should_audit = self._should_audit_request(request)
         
         if not should_audit:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+        
+        # Capture the head of JSON bodies while the application streams them
+        body_capture = None
+        if request.method in ["POST", "PUT", "PATCH"] and "application/json" in request.headers.get("content-type", ""):
+            body_capture, receive = self._tee_body(receive)
         
         # Prepare audit data
         audit_data = await self._prepare_audit_data(request, start_time)
         
+        response_start = {}
+        
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                response_start.update(message)
+            await send(message)
+        
         try:
             # Process request
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
             
-            # Complete audit data with response info
-            audit_data.update(await self._prepare_response_audit_data(response, start_time))
+            # Complete audit data with request body and response info
+            self._add_request_body(request, audit_data, body_capture)
+            audit_data.update(await self._prepare_response_audit_data(response_start, start_time))
             
             # Log audit record
             await self._log_audit_record(audit_data)
             
-            return response
-            
         except Exception as e:
             # Log failed request
+            self._add_request_body(request, audit_data, body_capture)
             audit_data.update({
                 "response_status": 500,
                 "error": str(e),
@@ -107,6 +130,48 @@ class AuditMiddleware(BaseHTTPMiddleware):
         
         return False
     
+    def _tee_body(self, receive: Receive):
+        """
+        Wrap receive so the application gets every chunk untouched while the
+        first max_body_bytes are kept for the audit record
+        """
+        capture = {"chunks": [], "captured": 0, "total": 0}
+        max_bytes = self.audit_config["max_body_bytes"]
+        
+        async def tee_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                capture["total"] += len(chunk)
+                if capture["captured"] < max_bytes and chunk:
+                    head = chunk[:max_bytes - capture["captured"]]
+                    capture["chunks"].append(head)
+                    capture["captured"] += len(head)
+            return message
+        
+        return capture, tee_receive
+    
+    def _add_request_body(self, request: Request, audit_data: dict, body_capture: dict = None):
+        """
+        Add the sanitized request body (or a sanitized prefix of it) to the audit data
+        """
+        if request.method not in ["POST", "PUT", "PATCH"] or "request_body" in audit_data:
+            return
+        try:
+            body = b"".join(body_capture["chunks"]) if body_capture else b""
+            if body_capture and body_capture["total"] > body_capture["captured"]:
+                audit_data["request_body"] = {
+                    "_truncated": True,
+                    "_size": body_capture["total"],
+                    "_head": self._sanitize_partial_json(body.decode("utf-8", errors="replace"))
+                }
+                return
+            parsed_body = self._extract_request_body(request, body)
+            if parsed_body:
+                audit_data["request_body"] = self._sanitize_body(parsed_body)
+        except Exception as e:
+            logger.warning(f"Failed to extract request body for audit: {e}")
+    
     async def _prepare_audit_data(self, request: Request, start_time: float) -> dict:
         """
         Prepare audit data from request
@@ -133,28 +198,20 @@ class AuditMiddleware(BaseHTTPMiddleware):
         if user_info:
             audit_data.update(user_info)
         
-        # Extract request body for certain endpoints (be careful with sensitive data)
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await self._extract_request_body(request)
-                if body:
-                    audit_data["request_body"] = self._sanitize_body(body)
-            except Exception as e:
-                logger.warning(f"Failed to extract request body for audit: {e}")
-        
         return audit_data
     
-    async def _prepare_response_audit_data(self, response: Response, start_time: float) -> dict:
+    async def _prepare_response_audit_data(self, response_start: Message, start_time: float) -> dict:
         """
-        Prepare audit data from response
+        Prepare audit data from the http.response.start message
         """
         processing_time = time.time() - start_time
+        status_code = response_start.get("status", 500)
         
         return {
-            "response_status": response.status_code,
+            "response_status": status_code,
             "processing_time": round(processing_time, 4),
-            "success": 200 <= response.status_code < 400,
-            "response_headers": self._sanitize_headers(dict(response.headers))
+            "success": 200 <= status_code < 400,
+            "response_headers": self._sanitize_headers(dict(Headers(raw=response_start.get("headers", []))))
         }
     
     async def _extract_user_info(self, request: Request) -> dict:
@@ -162,15 +219,11 @@ class AuditMiddleware(BaseHTTPMiddleware):
         Extract user information from JWT token
         """
         try:
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
+            from app.core.security import get_request_token_payload
+            payload = get_request_token_payload(request)
+            if not payload:
                 return {}
             
-            token = auth_header.replace("Bearer ", "")
-            
-            from app.core.security import decode_token
-            payload = decode_token(token)
-            
             return {
                 "user_id": payload.get("sub"),
                 "tenant_id": payload.get("tenant_id")
@@ -179,17 +232,14 @@ class AuditMiddleware(BaseHTTPMiddleware):
         except Exception:
             return {}
     
-    async def _extract_request_body(self, request: Request) -> dict:
+    def _extract_request_body(self, request: Request, body: bytes) -> dict:
         """
-        Extract and parse request body
+        Parse the captured request body
         """
         try:
             content_type = request.headers.get("content-type", "")
             
             if "application/json" in content_type:
-                # For JSON requests, we need to read the body carefully
-                # This is tricky because FastAPI will also try to read it
-                body = await request.body()
                 if body:
                     return json.loads(body.decode())
             
@@ -241,51 +291,88 @@ class AuditMiddleware(BaseHTTPMiddleware):
         
         return sanitized
     
+    def _sanitize_partial_json(self, text: str) -> str:
+        """
+        Redact sensitive values in a JSON prefix that cannot be parsed: strings,
+        scalars and whole arrays/objects, up to their end or the end of the text
+        """
+        parts = []
+        position = 0
+        while True:
+            match = self._sensitive_json_key.search(text, position)
+            if match is None:
+                break
+            parts.append(text[position:match.end()])
+            parts.append('"[REDACTED]"')
+            position = self._json_value_end(text, match.end())
+        parts.append(text[position:])
+        return "".join(parts)
+    
+    @staticmethod
+    def _json_value_end(text: str, start: int) -> int:
+        """
+        Index just past the JSON value starting at start (or len(text) if cut off)
+        """
+        depth = 0
+        in_string = False
+        index = start
+        while index < len(text):
+            char = text[index]
+            if in_string:
+                if char == "\\":
+                    index += 1
+                elif char == '"':
+                    in_string = False
+                    if depth == 0:
+                        return index + 1
+            elif char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                if depth == 0:
+                    return index
+                depth -= 1
+                if depth == 0:
+                    return index + 1
+            elif char == "," and depth == 0:
+                return index
+            index += 1
+        return len(text)
+    
     async def _log_audit_record(self, audit_data: dict):
         """
-        Log audit record to database
+        Queue audit record for the batched writer (no database round trip here)
         """
         try:
-            db = SessionLocal()
+            # Determine severity based on response
+            severity = "info"
+            if not audit_data.get("success", True):
+                severity = "error" if audit_data.get("response_status", 500) >= 500 else "warning"
             
-            try:
-                from app.models.audit import AuditLog
-                
-                # Determine severity based on response
-                severity = "info"
-                if not audit_data.get("success", True):
-                    severity = "error" if audit_data.get("response_status", 500) >= 500 else "warning"
-                
-                # Determine category
-                category = self._determine_category(audit_data["path"], audit_data["method"])
-                
-                # Create audit log entry
-                audit_log = AuditLog(
-                    tenant_id=audit_data.get("tenant_id"),
-                    user_id=audit_data.get("user_id"),
-                    username=audit_data.get("username"),
-                    action=f"{audit_data['method'].lower()}.{category}",
-                    resource_type="api_request",
-                    resource_name=audit_data["path"],
-                    extra_data={
-                        "query_params": audit_data.get("query_params", {}),
-                        "processing_time": audit_data.get("processing_time"),
-                        "response_status": audit_data.get("response_status"),
-                        "request_body": audit_data.get("request_body", {}),
-                        "headers": audit_data.get("headers", {})
-                    },
-                    ip_address=audit_data.get("ip_address"),
-                    user_agent=audit_data.get("user_agent"),
-                    api_endpoint=audit_data["path"],
-                    severity=severity,
-                    category=category
-                )
-                
-                db.add(audit_log)
-                db.commit()
-                
-            finally:
-                db.close()
+            # Determine category
+            category = self._determine_category(audit_data["path"], audit_data["method"])
+            
+            audit_writer.enqueue(build_audit_row(
+                tenant_id=audit_data.get("tenant_id"),
+                user_id=audit_data.get("user_id"),
+                username=audit_data.get("username"),
+                action=f"{audit_data['method'].lower()}.{category}",
+                resource_type="api_request",
+                resource_name=audit_data["path"],
+                extra_data={
+                    "query_params": audit_data.get("query_params", {}),
+                    "processing_time": audit_data.get("processing_time"),
+                    "response_status": audit_data.get("response_status"),
+                    "request_body": audit_data.get("request_body", {}),
+                    "headers": audit_data.get("headers", {})
+                },
+                ip_address=audit_data.get("ip_address"),
+                user_agent=audit_data.get("user_agent"),
+                api_endpoint=audit_data["path"],
+                severity=severity,
+                category=category
+            ))
                 
         except Exception as e:
             logger.error(f"Failed to log audit record: {e}")
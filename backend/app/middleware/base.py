@@ -0,0 +1,23 @@
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ASGIMiddleware:
+    """
+    Base class for pure ASGI middleware.
+    Non-HTTP scopes (lifespan, websocket) pass straight through; response
+    bodies are never buffered, so streaming responses keep streaming.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        await self.handle(Request(scope), scope, receive, send)
+
+    async def handle(self, request: Request, scope: Scope, receive: Receive, send: Send):
+        raise NotImplementedError
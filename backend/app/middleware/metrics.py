@@ -0,0 +1,55 @@
+from fastapi import Request
+from starlette.types import Message, Receive, Scope, Send
+import time
+
+from app.core.metrics import HTTP_REQUEST_DURATION, tenant_label
+from app.middleware.base import ASGIMiddleware
+
+
+class MetricsMiddleware(ASGIMiddleware):
+    """
+    Records request latency per route template (not raw path) and tenant
+    """
+    
+    def __init__(self, app):
+        super().__init__(app)
+        self._route_paths = {}
+    
+    async def handle(self, request: Request, scope: Scope, receive: Receive, send: Send):
+        if scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        status_code = 500
+        
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched endpoint and TenantMiddleware the tenant in the shared scope
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"],
+                self._get_route_path(scope),
+                str(status_code),
+                tenant_label(scope.get("state", {}).get("tenant_id"))
+            ).observe(time.perf_counter() - start_time)
+    
+    def _get_route_path(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            path = "unmatched"
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            self._route_paths[endpoint] = path
+        return path
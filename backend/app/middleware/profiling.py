@@ -0,0 +1,116 @@
+from fastapi import HTTPException, Request
+from starlette.types import Message, Receive, Scope, Send
+import asyncio
+import logging
+import time
+import uuid
+from typing import Optional
+
+from app.config.database import SessionLocal
+from app.core.profiling import REQUEST_ID, profiling_service
+from app.core.security import get_request_token_payload
+from app.core.tracing import current_trace_id
+from app.core.user_cache import user_cache
+from app.middleware.base import ASGIMiddleware
+from app.models.user import User
+
+
+logger = logging.getLogger(__name__)
+
+PROFILING_ROLES = ("super_admin", "admin")
+
+
+def _lookup_role(user_id: int) -> Optional[str]:
+    db = SessionLocal()
+    try:
+        return db.query(User.role).filter(User.id == user_id, User.is_active == True).scalar()
+    finally:
+        db.close()
+
+
+class ProfilingMiddleware(ASGIMiddleware):
+    """
+    Runs a request under the sampling profiler when an admin sends
+    X-Profile: 1 or when an admin profiling target matches it.
+    Every other request pays a settings check (and a cached target lookup).
+    """
+
+    async def handle(self, request: Request, scope: Scope, receive: Receive, send: Send):
+        if not profiling_service.available or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        trigger = await self._trigger(request)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Profile files are keyed by a server-side id: a client-supplied
+        # X-Request-ID could overwrite another request's profile
+        request_id = uuid.uuid4().hex
+        client_request_id = request.headers.get("X-Request-ID", "")
+        if not REQUEST_ID.match(client_request_id):
+            client_request_id = None
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", []).append((b"x-profile-id", request_id.encode("latin-1")))
+            await send(message)
+
+        data = profiling_service.bind_request_data()
+        profiler = profiling_service.start()
+        start_time = time.time()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.time() - start_time
+            profiler.stop()
+            metadata = {
+                "request_id": request_id,
+                "client_request_id": client_request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": round(duration * 1000, 2),
+                "started_at": start_time,
+                "tenant_id": getattr(request.state, "tenant_id", None),
+                "user_id": self._user_id(request),
+                "trigger": trigger,
+                "trace_id": current_trace_id(),
+                **data,
+            }
+            try:
+                await profiling_service.save(request_id, profiler, metadata)
+                logger.info(f"Profile {request_id} stored for {scope['method']} {scope['path']} ({metadata['duration_ms']}ms)")
+            except Exception as e:
+                logger.error(f"Failed to store profile {request_id}: {e}")
+
+    async def _trigger(self, request: Request) -> Optional[str]:
+        """"header", "target:<id>" or None"""
+        if request.headers.get("X-Profile", "").lower() in ("1", "true", "yes"):
+            if await self._is_admin(request):
+                return "header"
+            logger.warning(f"X-Profile header ignored for non-admin request to {request.url.path}")
+
+        target_id = await profiling_service.claim(getattr(request.state, "tenant_id", None), request.url.path)
+        return f"target:{target_id}" if target_id else None
+
+    async def _is_admin(self, request: Request) -> bool:
+        try:
+            payload = get_request_token_payload(request)
+        except HTTPException:
+            return False
+        if not payload or not payload.get("sub"):
+            return False
+
+        user_id = int(payload["sub"])
+        user = user_cache.get_user(user_id, payload.get("iat"))
+        role = user.role if user is not None else await asyncio.to_thread(_lookup_role, user_id)
+        return role in PROFILING_ROLES
+
+    def _user_id(self, request: Request) -> Optional[int]:
+        payload = getattr(request.state, "token_payload", None)
+        return int(payload["sub"]) if payload and payload.get("sub") else None
@@ -1,19 +1,21 @@
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Receive, Scope, Send
 import time
-import redis
-from typing import Dict, Any
+from typing import Dict, Any, List
 import logging
 
 from app.config.settings import settings
+from app.core.rate_limiter import rate_limiter, RateLimitRule
+from app.core.security import get_request_token_payload
+from app.middleware.base import ASGIMiddleware
 
 
 logger = logging.getLogger(__name__)
 
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+class SecurityMiddleware(ASGIMiddleware):
     """
     Security middleware for rate limiting, IP filtering, and security headers
     """
@@ -21,14 +23,9 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     def __init__(self, app):
         super().__init__(app)
         
-        # Initialize Redis for rate limiting
-        try:
-            self.redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
-            self.redis_client.ping()
-            self.rate_limiting_enabled = True
-        except Exception as e:
-            logger.warning(f"Redis not available for rate limiting: {e}")
-            self.rate_limiting_enabled = False
+        # Redis-backed rate limiting (fails open if Redis is unreachable)
+        self.rate_limiter = rate_limiter
+        self.rate_limiting_enabled = True
         
         # Rate limiting configuration
         self.rate_limits = {
@@ -36,14 +33,36 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             "login": {"requests": 5, "window": 300},  # 5 attempts per 5 minutes
             "analysis": {"requests": 10, "window": 60}  # 10 analysis per minute
         }
+        self.user_rate_limit = {"requests": settings.rate_limit_user_per_minute, "window": 60}
+        self.tenant_rate_limit = {"requests": settings.rate_limit_tenant_per_minute, "window": 60}
     
-    async def dispatch(self, request: Request, call_next) -> Response:
+    async def handle(self, request: Request, scope: Scope, receive: Receive, send: Send):
         start_time = time.time()
         
         # Skip middleware for health checks, docs, and OPTIONS requests
-        if request.url.path in ["/health", "/", "/api/docs", "/api/redoc"] or request.method == "OPTIONS":
-            response = await call_next(request)
-            return self._add_security_headers(response)
+        if request.url.path in ["/health", "/health/live", "/health/ready", "/", "/api/docs", "/api/redoc"] or request.method == "OPTIONS":
+            async def send_with_headers(message: Message):
+                if message["type"] == "http.response.start":
+                    self._add_security_headers(MutableHeaders(scope=message))
+                await send(message)
+            
+            await self.app(scope, receive, send_with_headers)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                
+                # 4. Add security headers
+                headers = MutableHeaders(scope=message)
+                self._add_security_headers(headers)
+                
+                # 5. Log timing
+                headers["X-Process-Time"] = str(time.time() - start_time)
+            await send(message)
         
         try:
             # 1. Rate limiting
@@ -54,66 +73,64 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             await self._validate_request_security(request)
             
             # 3. Process request
-            response = await call_next(request)
-            
-            # 4. Add security headers
-            response = self._add_security_headers(response)
-            
-            # 5. Log timing
-            process_time = time.time() - start_time
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            return response
+            await self.app(scope, receive, send_wrapper)
             
         except HTTPException as e:
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=e.status_code,
-                content={"error": e.detail}
+                content={"error": e.detail},
+                headers=e.headers
             )
+            await response(scope, receive, send)
         except Exception as e:
             logger.error(f"Security middleware error: {str(e)}")
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content={"error": "Internal security error"}
             )
+            await response(scope, receive, send)
     
     async def _check_rate_limits(self, request: Request):
         """
-        Check rate limits based on IP and endpoint
+        Check rate limits per IP and endpoint, per user and per tenant
         """
-        client_ip = self._get_client_ip(request)
         endpoint_type = self._get_endpoint_type(request.url.path)
+        rules = self._get_rate_limit_rules(request, endpoint_type)
         
-        # Get rate limit configuration
+        allowed, retry_after = await self.rate_limiter.check(rules)
+        if not allowed:
+            logger.warning(f"Rate limit exceeded for {', '.join(rule[0] for rule in rules)}")
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded. Try again later.",
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+            )
+    
+    def _get_rate_limit_rules(self, request: Request, endpoint_type: str) -> List[RateLimitRule]:
+        """
+        IP limit for the endpoint type, plus user and tenant limits for authenticated requests
+        """
+        client_ip = self._get_client_ip(request)
         rate_config = self.rate_limits.get(endpoint_type, self.rate_limits["default"])
-        
-        # Create Redis key
-        redis_key = f"rate_limit:{client_ip}:{endpoint_type}"
+        rules = [(f"rate_limit:{client_ip}:{endpoint_type}", rate_config["requests"], rate_config["window"])]
         
         try:
-            # Get current request count
-            current_requests = self.redis_client.get(redis_key)
-            
-            if current_requests is None:
-                # First request in window
-                self.redis_client.setex(redis_key, rate_config["window"], 1)
-            else:
-                current_requests = int(current_requests)
-                
-                if current_requests >= rate_config["requests"]:
-                    # Rate limit exceeded
-                    logger.warning(f"Rate limit exceeded for IP {client_ip} on endpoint {endpoint_type}")
-                    raise HTTPException(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        detail="Rate limit exceeded. Try again later."
-                    )
-                
-                # Increment counter
-                self.redis_client.incr(redis_key)
-                
-        except redis.RedisError as e:
-            logger.error(f"Redis error in rate limiting: {e}")
-            # Continue without rate limiting if Redis fails
+            payload = get_request_token_payload(request)
+        except HTTPException:
+            # Invalid tokens are rejected later by the auth dependency
+            payload = None
+        
+        if payload and payload.get("sub"):
+            user_config = self.user_rate_limit if endpoint_type == "default" else rate_config
+            rules.append((f"rate_limit:user:{payload['sub']}:{endpoint_type}", user_config["requests"], user_config["window"]))
+        if payload and payload.get("tenant_id"):
+            rules.append((f"rate_limit:tenant:{payload['tenant_id']}", self.tenant_rate_limit["requests"], self.tenant_rate_limit["window"]))
+        
+        return rules
     
     async def _validate_request_security(self, request: Request):
         """
@@ -155,7 +172,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
                     detail="Unsupported media type"
                 )
     
-    def _add_security_headers(self, response: Response) -> Response:
+    def _add_security_headers(self, headers: MutableHeaders) -> MutableHeaders:
         """
         Add security headers to response
         """
@@ -175,7 +192,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
             security_headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
         
         # Add CSP for HTML responses (disabled in development)
-        content_type = response.headers.get("content-type", "")
+        content_type = headers.get("content-type", "")
         if "text/html" in content_type and settings.environment == "production":
             security_headers["Content-Security-Policy"] = (
                 "default-src 'self'; "
@@ -188,9 +205,9 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         
         # Apply headers
         for header, value in security_headers.items():
-            response.headers[header] = value
+            headers[header] = value
         
-        return response
+        return headers
     
     def _get_client_ip(self, request: Request) -> str:
         """
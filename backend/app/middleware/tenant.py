@@ -1,50 +1,64 @@
 from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response, JSONResponse
+from starlette.responses import JSONResponse
+from starlette.types import Receive, Scope, Send
 import logging
 from typing import Optional
 
 from app.core.tenant import tenant_context, get_tenant_from_domain
+from app.core.tenant_cache import tenant_cache
 from app.config.database import SessionLocal
+from app.middleware.base import ASGIMiddleware
 from app.models.tenant import Tenant
 
 
 logger = logging.getLogger(__name__)
 
 
-class TenantMiddleware(BaseHTTPMiddleware):
+class _LazySession:
+    """
+    Opens a SessionLocal only when a tenant cache miss needs the database
+    """
+    
+    def __init__(self):
+        self._db = None
+    
+    def query(self, *entities, **kwargs):
+        if self._db is None:
+            self._db = SessionLocal()
+        return self._db.query(*entities, **kwargs)
+    
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class TenantMiddleware(ASGIMiddleware):
     """
     Enhanced middleware to manage tenant context throughout the request lifecycle
     """
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Skip tenant context for OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
-            response = await call_next(request)
-            return response
-            
-        # Skip tenant context for public endpoints
-        public_endpoints = [
-            "/", "/health", "/api/docs", "/api/redoc", "/api/openapi.json",
-            "/api/v1/system/info", "/api/v1/auth/login", "/api/v1/auth/register"
-        ]
-        
-        # Skip tenant context for public tenant endpoints
-        public_patterns = [
-            "/api/v1/public/",
-            "/api/v1/admin/",  # Admin endpoints handle their own tenant validation
-            "/api/v1/test/"   # Test endpoints bypass authentication
-        ]
-        
-        if request.url.path in public_endpoints:
-            response = await call_next(request)
-            return response
+    # Skip tenant context for public endpoints
+    public_endpoints = [
+        "/", "/health", "/health/live", "/health/ready", "/api/docs", "/api/redoc", "/api/openapi.json",
+        "/api/v1/system/info", "/api/v1/auth/login", "/api/v1/auth/register"
+    ]
+    
+    # Skip tenant context for public tenant endpoints
+    public_patterns = (
+        "/api/v1/public/",
+        "/api/v1/admin/",  # Admin endpoints handle their own tenant validation
+        "/api/v1/test/"   # Test endpoints bypass authentication
+    )
+    
+    async def handle(self, request: Request, scope: Scope, receive: Receive, send: Send):
+        path = scope["path"]
         
-        # Check if path matches public patterns
-        for pattern in public_patterns:
-            if request.url.path.startswith(pattern):
-                response = await call_next(request)
-                return response
+        # Skip tenant context for OPTIONS requests (CORS preflight) and public paths
+        if (scope["method"] == "OPTIONS" or path in self.public_endpoints
+                or path.startswith(self.public_patterns)):
+            await self.app(scope, receive, send)
+            return
         
         try:
             # Extract tenant information from request
@@ -53,10 +67,12 @@ class TenantMiddleware(BaseHTTPMiddleware):
             if tenant:
                 # Validate tenant is active
                 if not tenant.is_active:
-                    return JSONResponse(
+                    response = JSONResponse(
                         status_code=status.HTTP_403_FORBIDDEN,
                         content={"error": "Tenant is inactive"}
                     )
+                    await response(scope, receive, send)
+                    return
                 
                 # Set tenant context
                 tenant_context.set_tenant(tenant.id, tenant)
@@ -66,33 +82,37 @@ class TenantMiddleware(BaseHTTPMiddleware):
                 request.state.tenant = tenant
             else:
                 # For paths that require tenant context, return error
-                if request.url.path.startswith("/api/v1/") and not request.url.path.startswith("/api/v1/admin/"):
-                    return JSONResponse(
+                if path.startswith("/api/v1/") and not path.startswith("/api/v1/admin/"):
+                    response = JSONResponse(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         content={"error": "Tenant identification required"}
                     )
-            
-            # Process request
-            response = await call_next(request)
-            
-            return response
-            
+                    await response(scope, receive, send)
+                    return
+        
         except HTTPException as e:
-            # Re-raise HTTPExceptions (auth errors) to be handled by FastAPI
+            # Re-raise HTTPExceptions (auth errors) to be handled by the outer layers
             logger.error(f"Auth error in tenant middleware: {e.detail}")
+            tenant_context.clear()
             raise e
         except Exception as e:
             import traceback
             logger.error(f"Tenant middleware error: {str(e)}")
             logger.error(f"Exception type: {type(e).__name__}")
             logger.error(f"Traceback: {traceback.format_exc()}")
-            logger.error(f"Request path: {request.url.path}")
-            logger.error(f"Request method: {request.method}")
-            return JSONResponse(
+            logger.error(f"Request path: {path}")
+            logger.error(f"Request method: {scope['method']}")
+            tenant_context.clear()
+            response = JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={"error": f"Tenant middleware error: {str(e)}"}
             )
+            await response(scope, receive, send)
+            return
         
+        try:
+            # Process request
+            await self.app(scope, receive, send)
         finally:
             # Always clear tenant context after request
             tenant_context.clear()
@@ -103,8 +123,7 @@ class TenantMiddleware(BaseHTTPMiddleware):
         """
         db = None
         try:
-            db = SessionLocal()
-            logger.debug(f"Created database session for tenant extraction: {id(db)}")
+            db = _LazySession()
             
             # Method 1: From JWT token (most common)
             tenant = await self._extract_from_jwt(request, db)
@@ -137,7 +156,6 @@ class TenantMiddleware(BaseHTTPMiddleware):
             if db:
                 try:
                     db.close()
-                    logger.debug(f"Closed database session: {id(db)}")
                 except Exception as e:
                     logger.error(f"Error closing database session: {e}")
     
@@ -146,24 +164,23 @@ class TenantMiddleware(BaseHTTPMiddleware):
         Extract tenant from JWT token
         """
         try:
-            # Get Authorization header
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                return None
-            
-            token = auth_header.replace("Bearer ", "")
-            
-            # Decode token to get tenant_id
-            from app.core.security import decode_token
+            # Decode token to get tenant_id (shared with the rest of the request)
+            from app.core.security import get_request_token_payload
             from jose import JWTError
             from fastapi import HTTPException
             
             try:
-                payload = decode_token(token)
+                payload = get_request_token_payload(request)
+                if not payload:
+                    return None
+                
                 tenant_id = payload.get("tenant_id")
                 
                 if tenant_id:
-                    return db.query(Tenant).filter_by(id=tenant_id, is_active=True).first()
+                    return tenant_cache.get_or_load(
+                        ("id", tenant_id),
+                        lambda: db.query(Tenant).filter_by(id=tenant_id, is_active=True).first()
+                    )
                 
                 return None
                 
@@ -195,35 +212,38 @@ class TenantMiddleware(BaseHTTPMiddleware):
             if "localhost" in host or host.replace(".", "").replace(":", "").isdigit():
                 return None
             
-            # Look up tenant by exact domain match first
-            tenant = db.query(Tenant).filter(
-                Tenant.domain == host,
-                Tenant.is_active == True
-            ).first()
-            
-            if tenant:
-                return tenant
-            
-            # Extract subdomain and try partial match
-            parts = host.split(".")
-            if len(parts) >= 3:  # subdomain.domain.tld
-                subdomain = parts[0]
-                base_domain = ".".join(parts[1:])
-                
-                # Look for tenant with matching subdomain pattern
-                tenant = db.query(Tenant).filter(
-                    Tenant.domain.like(f"{subdomain}.%"),
-                    Tenant.is_active == True
-                ).first()
-                
-                return tenant
-            
-            return None
+            return tenant_cache.get_or_load(("host", host), lambda: self._lookup_host(host, db))
             
         except Exception as e:
             logger.error(f"Error extracting tenant from subdomain: {e}")
             return None
     
+    def _lookup_host(self, host: str, db) -> Optional[Tenant]:
+        """
+        Resolve a Host header by exact domain, then by subdomain pattern
+        """
+        # Look up tenant by exact domain match first
+        tenant = db.query(Tenant).filter(
+            Tenant.domain == host,
+            Tenant.is_active == True
+        ).first()
+        
+        if tenant:
+            return tenant
+        
+        # Extract subdomain and try partial match
+        parts = host.split(".")
+        if len(parts) >= 3:  # subdomain.domain.tld
+            subdomain = parts[0]
+            
+            # Look for tenant with matching subdomain pattern
+            return db.query(Tenant).filter(
+                Tenant.domain.like(f"{subdomain}.%"),
+                Tenant.is_active == True
+            ).first()
+        
+        return None
+    
     def _extract_from_header(self, request: Request, db) -> Optional[Tenant]:
         """
         Extract tenant from custom header (X-Tenant-ID or X-Tenant-Domain)
@@ -233,12 +253,18 @@ class TenantMiddleware(BaseHTTPMiddleware):
             tenant_id_header = request.headers.get("X-Tenant-ID")
             if tenant_id_header and tenant_id_header.isdigit():
                 tenant_id = int(tenant_id_header)
-                return db.query(Tenant).filter_by(id=tenant_id, is_active=True).first()
+                return tenant_cache.get_or_load(
+                    ("id", tenant_id),
+                    lambda: db.query(Tenant).filter_by(id=tenant_id, is_active=True).first()
+                )
             
             # Try tenant domain header
             tenant_domain_header = request.headers.get("X-Tenant-Domain")
             if tenant_domain_header:
-                return db.query(Tenant).filter_by(domain=tenant_domain_header, is_active=True).first()
+                return tenant_cache.get_or_load(
+                    ("domain", tenant_domain_header),
+                    lambda: db.query(Tenant).filter_by(domain=tenant_domain_header, is_active=True).first()
+                )
             
             return None
         except (ValueError, TypeError):
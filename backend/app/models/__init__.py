@@ -2,6 +2,7 @@ from .base import Base, TimestampMixin, TenantMixin
 from .tenant import Tenant
 from .user import User
 from .work_permit import WorkPermit
+from .permit_analysis import PermitAnalysis
 from .document import Document
 from .audit import AuditLog
 
@@ -12,6 +13,7 @@ __all__ = [
     "Tenant",
     "User",
     "WorkPermit",
+    "PermitAnalysis",
     "Document",
     "AuditLog"
 ]
\ No newline at end of file
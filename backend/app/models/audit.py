@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import INET
 from sqlalchemy.orm import relationship
 
@@ -7,9 +7,16 @@ from .base import TenantMixin
 
 
 class AuditLog(Base, TenantMixin):
+    """
+    Range partitioned by month on created_at (primary key (id, created_at) in the
+    database, see the partition_audit_logs_by_month migration). Partitions are
+    created and dropped by AuditPartitionService.
+    """
     __tablename__ = "audit_logs"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
+    # TenantMixin's single-column index is covered by the (tenant_id, ...) indexes below
+    tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=False)
     
     # Who & When
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -17,7 +24,7 @@ class AuditLog(Base, TenantMixin):
     session_id = Column(String(255))
     
     # What & Where
-    action = Column(String(100), nullable=False, index=True)
+    action = Column(String(100), nullable=False)
     resource_type = Column(String(100), nullable=False)
     resource_id = Column(Integer)
     resource_name = Column(String(255))
@@ -37,11 +44,18 @@ class AuditLog(Base, TenantMixin):
     category = Column(String(50))
     
     # Timestamp
-    created_at = Column(DateTime, server_default="NOW()", nullable=False, index=True)
+    created_at = Column(DateTime, server_default="NOW()", nullable=False)
     
     # Relationships
     tenant = relationship("Tenant", back_populates="audit_logs")
     user = relationship("User", back_populates="audit_logs")
     
+    # Tenant + time range indexes (keyset pagination, action and user filters)
+    __table_args__ = (
+        Index('ix_audit_logs_tenant_created_id', 'tenant_id', text('created_at DESC'), text('id DESC')),
+        Index('ix_audit_logs_tenant_action_created', 'tenant_id', 'action', text('created_at DESC')),
+        Index('ix_audit_logs_tenant_user_created', 'tenant_id', 'user_id', text('created_at DESC')),
+    )
+    
     def __repr__(self):
         return f"<AuditLog(id={self.id}, action='{self.action}', user='{self.username}')>"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, JSON, Float, Date, Boolean, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, JSON, Float, Date, Boolean, ForeignKey, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 
 from app.config.database import Base
@@ -48,9 +48,14 @@ class Document(Base, TimestampMixin, TenantMixin):
     uploader = relationship("User", back_populates="uploaded_documents")
     parent_document = relationship("Document", remote_side=[id])
     
-    # Unique constraints
+    # Unique constraints and composite indexes
+    # (tenant_id, document_code) lookups are served by the unique constraint
     __table_args__ = (
         UniqueConstraint('tenant_id', 'document_code', 'version', name='_tenant_document_version_uc'),
+        Index('ix_documents_tenant_active_created', 'tenant_id', text('created_at DESC'), text('id DESC'),
+              postgresql_where=text('is_active')),
+        Index('ix_documents_tenant_file_hash_active', 'tenant_id', 'file_hash',
+              postgresql_where=text('is_active')),
     )
     
     def __repr__(self):
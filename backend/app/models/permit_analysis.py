@@ -0,0 +1,63 @@
+from sqlalchemy import Column, Integer, String, Boolean, LargeBinary, DateTime, ForeignKey, Index, UniqueConstraint, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
+import json
+import zlib
+
+from app.config.database import Base
+from .base import TimestampMixin, TenantMixin
+
+
+# JSONB on PostgreSQL, plain JSON elsewhere (tests run on SQLite)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class PermitAnalysis(Base, TimestampMixin, TenantMixin):
+    """
+    Versioned AI analysis result of a work permit, kept out of the
+    work_permits row so list queries never carry the JSON payload
+    """
+    __tablename__ = "permit_analyses"
+
+    id = Column(Integer, primary_key=True, index=True)
+    permit_id = Column(Integer, ForeignKey("work_permits.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False, default=1)
+    is_current = Column(Boolean, nullable=False, default=True)
+
+    ai_version = Column(String(50))
+    analyzed_at = Column(DateTime)
+
+    # Payload: JSONB, or zlib-compressed JSON when above the configured size
+    analysis = Column(JSONType)
+    analysis_compressed = Column(LargeBinary)
+    action_items = Column(JSONType, default=[])
+
+    # Relationships
+    permit = relationship("WorkPermit", back_populates="analyses")
+
+    __table_args__ = (
+        UniqueConstraint('permit_id', 'version', name='_permit_analysis_version_uc'),
+        Index('ix_permit_analyses_current', 'permit_id', unique=True,
+              postgresql_where=text('is_current')),
+    )
+
+    def __repr__(self):
+        return f"<PermitAnalysis(permit_id={self.permit_id}, version={self.version})>"
+
+    @property
+    def result(self):
+        """Decoded analysis payload"""
+        if self.analysis_compressed is not None:
+            return json.loads(zlib.decompress(self.analysis_compressed))
+        return self.analysis
+
+    def set_result(self, analysis_result: dict, compress_min_bytes: int = 0):
+        """Store the payload, compressing it when compress_min_bytes > 0 and exceeded"""
+        if compress_min_bytes > 0:
+            raw = json.dumps(analysis_result, default=str).encode()
+            if len(raw) >= compress_min_bytes:
+                self.analysis = None
+                self.analysis_compressed = zlib.compress(raw)
+                return
+        self.analysis = analysis_result
+        self.analysis_compressed = None
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, JSON, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, JSON, Float, DateTime, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import relationship
 
 from app.config.database import Base
@@ -26,13 +26,9 @@ class WorkPermit(Base, TimestampMixin, TenantMixin):
     # Risk Mitigation Actions (new field)
     risk_mitigation_actions = Column(JSON, default=[])
     
-    # AI Analysis Results
-    ai_analysis = Column(JSON, default={})
+    # AI Analysis metadata (results live in permit_analyses)
     ai_version = Column(String(50))
     
-    # Structured AI Results
-    action_items = Column(JSON, default=[])
-    
     # Workflow
     status = Column(String(50), default="draft", index=True)
     is_active = Column(Boolean, default=True)
@@ -52,10 +48,37 @@ class WorkPermit(Base, TimestampMixin, TenantMixin):
     tenant = relationship("Tenant", back_populates="work_permits")
     creator = relationship("User", foreign_keys=[created_by], back_populates="created_permits")
     approver = relationship("User", foreign_keys=[approved_by], back_populates="approved_permits")
+    analyses = relationship("PermitAnalysis", back_populates="permit", passive_deletes=True, lazy="raise")
+    # Only loaded on request (selectinload) by detail/analysis endpoints
+    current_analysis = relationship(
+        "PermitAnalysis",
+        primaryjoin="and_(PermitAnalysis.permit_id == WorkPermit.id, PermitAnalysis.is_current == True)",
+        uselist=False,
+        viewonly=True,
+        lazy="raise"
+    )
+    
+    # Composite indexes for tenant-scoped list and analysis queries
+    __table_args__ = (
+        Index('ix_work_permits_tenant_created_id', 'tenant_id', text('created_at DESC'), text('id DESC')),
+        Index('ix_work_permits_tenant_creator_created', 'tenant_id', 'created_by', 'created_at'),
+        Index('ix_work_permits_tenant_type_status', 'tenant_id', 'work_type', 'status'),
+    )
     
     def __repr__(self):
         return f"<WorkPermit(id={self.id}, title='{self.title}', status='{self.status}')>"
     
+    @property
+    def ai_analysis(self):
+        """Current analysis payload, None unless current_analysis was loaded"""
+        analysis = self.__dict__.get("current_analysis")
+        return analysis.result if analysis else None
+    
+    @property
+    def action_items(self):
+        analysis = self.__dict__.get("current_analysis")
+        return analysis.action_items if analysis else None
+    
     @property
     def duration_hours(self) -> int:
         """Calculate duration in hours from start_date to end_date"""
@@ -0,0 +1,135 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import FileResponse
+from typing import List
+import json
+
+from app.models.user import User
+from app.schemas.profiling import (
+    ProfileResponse, ProfileListResponse, ProfileTargetCreate, ProfileTargetResponse
+)
+from app.services.auth_service import get_current_user
+from app.core.profiling import profiling_service
+
+
+async def require_profiling_admin(current_user: User = Depends(get_current_user)) -> User:
+    """
+    Super admin: tutti i profili; admin: solo quelli del proprio tenant
+    """
+    if current_user.role not in ["super_admin", "admin"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin role required"
+        )
+    return current_user
+
+
+router = APIRouter(
+    prefix="/api/v1/admin/profiling",
+    tags=["admin-profiling"],
+    dependencies=[Depends(require_profiling_admin)]
+)
+
+
+def _load_profile(request_id: str, current_user: User) -> dict:
+    path = profiling_service.get_profile_path(request_id, "json")
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    with open(path, encoding="utf-8") as metadata_file:
+        metadata = json.load(metadata_file)
+    if current_user.role != "super_admin" and metadata.get("tenant_id") != current_user.tenant_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return metadata
+
+
+def _profile_file(request_id: str, kind: str, current_user: User) -> str:
+    _load_profile(request_id, current_user)
+    path = profiling_service.get_profile_path(request_id, kind)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return path
+
+
+@router.get("/profiles", response_model=ProfileListResponse)
+async def list_profiles(
+    limit: int = Query(50, ge=1, le=500, description="Numero massimo di profili"),
+    current_user: User = Depends(require_profiling_admin)
+):
+    """
+    Lista dei profili salvati, dal più recente
+    """
+    tenant_id = None if current_user.role == "super_admin" else current_user.tenant_id
+    return ProfileListResponse(
+        profiles=profiling_service.list_profiles(limit=limit, tenant_id=tenant_id),
+        profiling_available=profiling_service.available
+    )
+
+
+@router.get("/profiles/{request_id}", response_model=ProfileResponse)
+async def get_profile(request_id: str, current_user: User = Depends(require_profiling_admin)):
+    """
+    Metadati del profilo, inclusi i tempi per step dell'orchestratore
+    """
+    return _load_profile(request_id, current_user)
+
+
+@router.get("/profiles/{request_id}/flamegraph")
+async def get_profile_flamegraph(request_id: str, current_user: User = Depends(require_profiling_admin)):
+    """
+    Flamegraph interattivo (HTML pyinstrument)
+    """
+    return FileResponse(_profile_file(request_id, "html", current_user), media_type="text/html")
+
+
+@router.get("/profiles/{request_id}/speedscope")
+async def get_profile_speedscope(request_id: str, current_user: User = Depends(require_profiling_admin)):
+    """
+    Profilo in formato speedscope (https://www.speedscope.app)
+    """
+    return FileResponse(
+        _profile_file(request_id, "speedscope.json", current_user),
+        media_type="application/json",
+        filename=f"{request_id}.speedscope.json"
+    )
+
+
+@router.get("/targets", response_model=List[ProfileTargetResponse])
+async def list_targets(current_user: User = Depends(require_profiling_admin)):
+    """
+    Target di profilazione attivi
+    """
+    targets = await profiling_service.get_targets(refresh=True)
+    if current_user.role != "super_admin":
+        targets = [target for target in targets if target["tenant_id"] == current_user.tenant_id]
+    return targets
+
+
+@router.post("/targets", response_model=ProfileTargetResponse, status_code=status.HTTP_201_CREATED)
+async def create_target(target: ProfileTargetCreate, current_user: User = Depends(require_profiling_admin)):
+    """
+    Profila le prossime N richieste del tenant e/o del percorso indicato
+    """
+    if not profiling_service.available:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Profiling disabled or pyinstrument not installed"
+        )
+
+    tenant_id = target.tenant_id
+    if current_user.role != "super_admin":
+        if tenant_id is not None and tenant_id != current_user.tenant_id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
+        tenant_id = current_user.tenant_id
+
+    return await profiling_service.add_target(tenant_id, target.path_prefix, target.count, target.ttl_minutes)
+
+
+@router.delete("/targets/{target_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_target(target_id: str, current_user: User = Depends(require_profiling_admin)):
+    """
+    Rimuove un target di profilazione
+    """
+    targets = await profiling_service.get_targets(refresh=True)
+    target = next((target for target in targets if target["id"] == target_id), None)
+    if target is None or (current_user.role != "super_admin" and target["tenant_id"] != current_user.tenant_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Target not found")
+    await profiling_service.remove_target(target_id)
@@ -10,16 +10,16 @@ from app.schemas.tenant import (
     TenantCreate, TenantUpdate, TenantResponse, 
     TenantWithStats, DeploymentModeEnum, SubscriptionPlanEnum
 )
-from app.core.permissions import require_super_admin
+from app.services.auth_service import get_current_super_admin
 from app.services.tenant_database_service import tenant_db_service
-from app.core.security import get_current_user
+from app.core.tenant_cache import tenant_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/v1/admin/tenants",
     tags=["admin-tenants"],
-    dependencies=[Depends(require_super_admin)]
+    dependencies=[Depends(get_current_super_admin)]
 )
 
 
@@ -27,7 +27,7 @@ router = APIRouter(
 async def create_tenant(
     tenant_data: TenantCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_super_admin)
 ):
     """
     Create a new tenant (Super Admin only)
@@ -121,6 +121,20 @@ async def list_tenants(
     return tenant_stats
 
 
+@router.get("/database-pools")
+async def get_tenant_database_pools(current_user: User = Depends(get_current_super_admin)):
+    """
+    Connection pool usage of the cached dedicated-database engines (Super Admin only)
+    """
+    pools = tenant_db_service.get_pool_metrics()
+    return {
+        "engines": len(pools),
+        "max_engines": tenant_db_service.max_engines,
+        "open_connections": sum(pool["checked_out"] + pool["checked_in"] for pool in pools),
+        "pools": pools
+    }
+
+
 @router.get("/{tenant_id}", response_model=TenantWithStats)
 async def get_tenant(
     tenant_id: int,
@@ -152,7 +166,7 @@ async def update_tenant(
     tenant_id: int,
     tenant_data: TenantUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_super_admin)
 ):
     """
     Update tenant (Super Admin only)
@@ -172,6 +186,10 @@ async def update_tenant(
     try:
         db.commit()
         db.refresh(tenant)
+        await tenant_cache.invalidate(tenant_id)
+        if "database_url" in update_data or "settings" in update_data:
+            # Recreated with the new URL / pool sizing on next use
+            tenant_db_service.cleanup_tenant_connection(tenant_id)
         
         logger.info(f"Updated tenant {tenant_id} by super admin {current_user.id}")
         return tenant
@@ -189,7 +207,7 @@ async def update_tenant(
 async def delete_tenant(
     tenant_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_super_admin)
 ):
     """
     Delete tenant (Super Admin only) - Use with extreme caution!
@@ -208,6 +226,7 @@ async def delete_tenant(
         # Delete tenant (cascades to users, documents, etc.)
         db.delete(tenant)
         db.commit()
+        await tenant_cache.invalidate(tenant_id)
         
         logger.warning(f"Deleted tenant {tenant_id} by super admin {current_user.id}")
         return {"message": "Tenant deleted successfully"}
@@ -225,7 +244,7 @@ async def delete_tenant(
 async def activate_tenant(
     tenant_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_super_admin)
 ):
     """
     Activate tenant (Super Admin only)
@@ -239,6 +258,7 @@ async def activate_tenant(
     
     tenant.is_active = True
     db.commit()
+    await tenant_cache.invalidate(tenant_id)
     
     logger.info(f"Activated tenant {tenant_id} by super admin {current_user.id}")
     return {"message": "Tenant activated successfully"}
@@ -248,7 +268,7 @@ async def activate_tenant(
 async def deactivate_tenant(
     tenant_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_super_admin)
 ):
     """
     Deactivate tenant (Super Admin only)
@@ -262,6 +282,7 @@ async def deactivate_tenant(
     
     tenant.is_active = False
     db.commit()
+    await tenant_cache.invalidate(tenant_id)
     
     logger.info(f"Deactivated tenant {tenant_id} by super admin {current_user.id}")
     return {"message": "Tenant deactivated successfully"}
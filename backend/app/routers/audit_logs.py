@@ -0,0 +1,55 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.database import get_async_db
+from app.models.audit import AuditLog
+from app.models.user import User
+from app.schemas.audit import AuditLogListResponse, AuditLogResponse
+from app.services.auth_service import get_current_user
+from app.core.permissions import require_permission
+from app.core.pagination import fetch_page, count_rows
+
+
+router = APIRouter(
+    prefix="/api/v1/audit-logs",
+    tags=["Audit Logs"],
+    dependencies=[Depends(get_current_user)]
+)
+
+
+@router.get("/", response_model=AuditLogListResponse)
+@require_permission("tenant.reports.read")
+async def list_audit_logs(
+    page_size: int = Query(50, ge=1, le=200, description="Elementi per pagina"),
+    cursor: Optional[str] = Query(None, description="Cursore della pagina successiva"),
+    action: Optional[str] = Query(None, description="Filtra per azione"),
+    category: Optional[str] = Query(None, description="Filtra per categoria"),
+    user_id: Optional[int] = Query(None, description="Filtra per utente"),
+    count: str = Query("none", pattern="^(exact|cached|estimate|none)$", description="Modalità conteggio totale"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Lista audit log del tenant con paginazione keyset su (created_at, id)
+    """
+    query = select(AuditLog).where(AuditLog.tenant_id == current_user.tenant_id)
+    
+    if action:
+        query = query.where(AuditLog.action == action)
+    if category:
+        query = query.where(AuditLog.category == category)
+    if user_id:
+        query = query.where(AuditLog.user_id == user_id)
+    
+    audit_logs, next_cursor = await fetch_page(db, query, AuditLog, cursor, page_size)
+    total_count = await count_rows(db, query, count)
+    
+    return AuditLogListResponse(
+        audit_logs=[AuditLogResponse.model_validate(log) for log in audit_logs],
+        total_count=total_count,
+        page_size=page_size,
+        has_next=next_cursor is not None,
+        next_cursor=next_cursor
+    )
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from typing import List
 
-from app.config.database import get_db
+from app.config.database import get_async_db
 from app.config.settings import settings
 from app.models.user import User
 from app.models.tenant import Tenant
@@ -13,8 +14,8 @@ from app.schemas.auth import (
     PasswordChangeRequest, UserUpdate
 )
 from app.services.auth_service import AuthService, get_current_user
-from app.core.security import create_access_token
-from app.core.tenant import get_tenant_from_domain
+from app.core.user_cache import user_cache
+from app.core.security import create_access_token, verify_password_async, get_password_hash_async
 from app.core.audit import AuditService, get_client_ip, get_user_agent
 from app.core.permissions import require_permission
 
@@ -30,7 +31,7 @@ security = HTTPBearer()
 async def login(
     login_data: LoginRequest,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Autentica l'utente e restituisce JWT token
@@ -38,7 +39,13 @@ async def login(
     # Determine tenant
     tenant = None
     if login_data.tenant_domain:
-        tenant = get_tenant_from_domain(login_data.tenant_domain, db)
+        result = await db.execute(
+            select(Tenant).where(
+                Tenant.domain == login_data.tenant_domain,
+                Tenant.is_active == True
+            )
+        )
+        tenant = result.scalars().first()
         if not tenant:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -47,16 +54,22 @@ async def login(
     else:
         # If no domain specified, try to find user across tenants
         # This is less secure but more user-friendly
-        user_query = db.query(User).filter(
-            User.username == login_data.username,
-            User.is_active == True
-        ).first()
+        result = await db.execute(
+            select(User.tenant_id).where(
+                User.username == login_data.username,
+                User.is_active == True
+            )
+        )
+        user_tenant_id = result.scalars().first()
         
-        if user_query:
-            tenant = db.query(Tenant).filter(
-                Tenant.id == user_query.tenant_id,
-                Tenant.is_active == True
-            ).first()
+        if user_tenant_id:
+            result = await db.execute(
+                select(Tenant).where(
+                    Tenant.id == user_tenant_id,
+                    Tenant.is_active == True
+                )
+            )
+            tenant = result.scalars().first()
     
     if not tenant:
         # Generic error for security
@@ -67,7 +80,7 @@ async def login(
     
     # Authenticate user
     auth_service = AuthService(db)
-    user = auth_service.authenticate_user(
+    user = await auth_service.authenticate_user(
         username=login_data.username,
         password=login_data.password,
         tenant_id=tenant.id
@@ -139,16 +152,19 @@ async def register_user(
     user_data: UserCreate,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Registra un nuovo utente (richiede permessi admin)
     """
     # Verify tenant exists and user has permission
-    tenant = db.query(Tenant).filter(
-        Tenant.id == user_data.tenant_id,
-        Tenant.is_active == True
-    ).first()
+    result = await db.execute(
+        select(Tenant).where(
+            Tenant.id == user_data.tenant_id,
+            Tenant.is_active == True
+        )
+    )
+    tenant = result.scalars().first()
     
     if not tenant:
         raise HTTPException(
@@ -166,7 +182,7 @@ async def register_user(
     # Create user
     auth_service = AuthService(db)
     try:
-        new_user = auth_service.create_user(
+        new_user = await auth_service.create_user(
             username=user_data.username,
             email=user_data.email,
             password=user_data.password,
@@ -223,7 +239,7 @@ async def update_current_user(
     user_update: UserUpdate,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Aggiorna informazioni dell'utente corrente
@@ -242,8 +258,9 @@ async def update_current_user(
     for field, value in update_data.items():
         setattr(current_user, field, value)
     
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
+    await user_cache.invalidate(current_user.id)
     
     # Audit log
     audit_service = AuditService(db)
@@ -269,23 +286,23 @@ async def change_password(
     password_change: PasswordChangeRequest,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Cambia password dell'utente corrente
     """
-    auth_service = AuthService(db)
-    
     # Verify current password
-    from app.core.security import verify_password
-    if not verify_password(password_change.current_password, current_user.password_hash):
+    if not await verify_password_async(password_change.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Update password
-    auth_service.update_user_password(current_user, password_change.new_password)
+    current_user.password_hash = await get_password_hash_async(password_change.new_password)
+    current_user.failed_login_attempts = 0  # Reset failed attempts
+    await db.commit()
+    await user_cache.invalidate(current_user.id)
     
     # Audit log
     audit_service = AuditService(db)
@@ -309,7 +326,7 @@ async def change_password(
 async def logout(
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Logout dell'utente (principalmente per audit)
@@ -334,19 +351,18 @@ async def logout(
 @require_permission("tenant.users.read")
 async def list_users(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Lista utenti del tenant (richiede permessi admin)
     """
     # Super admin can see all users, others only their tenant
-    if current_user.role == "super_admin":
-        users = db.query(User).filter(User.is_active == True).all()
-    else:
-        users = db.query(User).filter(
-            User.tenant_id == current_user.tenant_id,
-            User.is_active == True
-        ).all()
+    query = select(User).where(User.is_active == True)
+    if current_user.role != "super_admin":
+        query = query.where(User.tenant_id == current_user.tenant_id)
+    
+    result = await db.execute(query)
+    users = result.scalars().all()
     
     return [UserResponse.from_orm(user) for user in users]
 
@@ -358,16 +374,19 @@ async def update_user(
     user_update: UserUpdate,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Aggiorna un utente (richiede permessi admin)
     """
     # Find user to update
-    user_to_update = db.query(User).filter(
-        User.id == user_id,
-        User.is_active == True
-    ).first()
+    result = await db.execute(
+        select(User).where(
+            User.id == user_id,
+            User.is_active == True
+        )
+    )
+    user_to_update = result.scalars().first()
     
     if not user_to_update:
         raise HTTPException(
@@ -397,8 +416,9 @@ async def update_user(
     for field, value in update_data.items():
         setattr(user_to_update, field, value)
     
-    db.commit()
-    db.refresh(user_to_update)
+    await db.commit()
+    await db.refresh(user_to_update)
+    await user_cache.invalidate(user_to_update.id)
     
     # Audit log
     audit_service = AuditService(db)
@@ -1,14 +1,19 @@
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status, Query, BackgroundTasks
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import asyncio
+import time
 from datetime import datetime
 
-from app.config.database import get_db
+from app.config.database import get_db, get_async_db
 from app.services.auth_service import get_current_user
 from app.models.user import User
 from app.models.document import Document
 from app.services.document_service import DocumentService
+from app.core.pagination import fetch_page, count_rows
+from app.core.metrics import DOCUMENTS_INGESTED, INGESTION_BYTES, INGESTION_DURATION, tenant_label
 from app.schemas.document import (
     DocumentResponse,
     DocumentListResponse,
@@ -124,6 +129,8 @@ async def process_document_upload(
     db_session: Session
 ):
     """Background task to process document upload"""
+    ingestion_start = time.time()
+    tenant = tenant_label(tenant_id)
     try:
         print(f"[DEBUG] Starting background task for {task_id}")
         # Update progress
@@ -212,6 +219,10 @@ async def process_document_upload(
             weaviate_status = f"verification_error: {str(e)}"
             print(f"[DEBUG] Weaviate verification error for {document.document_code}: {e}")
         
+        DOCUMENTS_INGESTED.labels(tenant, "success").inc()
+        INGESTION_BYTES.labels(tenant).inc(len(file_content))
+        INGESTION_DURATION.labels(tenant).observe(time.time() - ingestion_start)
+        
         upload_progress[task_id]["status"] = "completed"
         upload_progress[task_id]["progress"] = 100
         upload_progress[task_id]["message"] = "Document uploaded successfully"
@@ -230,6 +241,8 @@ async def process_document_upload(
         print(f"[ERROR] Upload failed for {task_id}: {str(e)}")
         import traceback
         print(f"[ERROR] Full traceback: {traceback.format_exc()}")
+        DOCUMENTS_INGESTED.labels(tenant, "failed").inc()
+        
         # Update error
         upload_progress[task_id]["status"] = "failed"
         upload_progress[task_id]["error"] = str(e)
@@ -355,35 +368,29 @@ async def list_documents(
     verify_weaviate: bool = Query(False, description="Whether to verify each document exists in Weaviate"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor; replaces offset"),
+    count: str = Query("exact", pattern="^(exact|cached|estimate|none)$", description="Total count mode"),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List documents for the current tenant with optional filtering and Weaviate verification.
     Note: Weaviate verification is disabled by default for performance reasons on list endpoints.
     """
-    document_service = DocumentService(db)
-    
-    documents = document_service.get_documents_by_tenant(
-        tenant_id=current_user.tenant_id,
-        document_type=document_type,
-        category=category,
-        limit=limit,
-        offset=offset
-    )
-    
-    # Get total count
-    total_query = db.query(Document).filter(
+    query = select(Document).where(
         Document.tenant_id == current_user.tenant_id,
         Document.is_active == True
     )
     
     if document_type:
-        total_query = total_query.filter(Document.document_type == document_type)
+        query = query.where(Document.document_type == document_type)
     if category:
-        total_query = total_query.filter(Document.category == category)
+        query = query.where(Document.category == category)
     
-    total = total_query.count()
+    documents, next_cursor = await fetch_page(db, query, Document, cursor, limit, 0 if cursor else offset)
+    
+    # Get total count
+    total = await count_rows(db, query, count)
     
     # Convert to responses with optional Weaviate verification
     document_responses = []
@@ -401,7 +408,8 @@ async def list_documents(
         documents=document_responses,
         total=total,
         limit=limit,
-        offset=offset
+        offset=offset,
+        next_cursor=next_cursor
     )
 
 
@@ -409,17 +417,20 @@ async def list_documents(
 async def get_document(
     document_id: int,
     verify_weaviate: bool = Query(True, description="Whether to verify document exists in Weaviate"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get a specific document by ID, with optional Weaviate verification.
     """
-    document = db.query(Document).filter(
-        Document.id == document_id,
-        Document.tenant_id == current_user.tenant_id,
-        Document.is_active == True
-    ).first()
+    result = await db.execute(
+        select(Document).where(
+            Document.id == document_id,
+            Document.tenant_id == current_user.tenant_id,
+            Document.is_active == True
+        )
+    )
+    document = result.scalars().first()
     
     if not document:
         raise HTTPException(
@@ -476,18 +487,19 @@ async def update_document_metadata(
 @router.get("/versions/{document_code}", response_model=List[DocumentVersionResponse])
 async def get_document_versions(
     document_code: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get all versions of a document by document code.
     """
-    document_service = DocumentService(db)
-    
-    versions = document_service.get_document_versions(
-        document_code=document_code,
-        tenant_id=current_user.tenant_id
+    result = await db.execute(
+        select(Document).where(
+            Document.tenant_id == current_user.tenant_id,
+            Document.document_code == document_code
+        ).order_by(Document.version.desc())
     )
+    versions = result.scalars().all()
     
     return [DocumentVersionResponse.from_orm(doc) for doc in versions]
 
@@ -520,17 +532,20 @@ async def delete_document(
 @router.get("/{document_id}/weaviate-status")
 async def get_document_weaviate_status(
     document_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get Weaviate verification status for a specific document.
     """
-    document = db.query(Document).filter(
-        Document.id == document_id,
-        Document.tenant_id == current_user.tenant_id,
-        Document.is_active == True
-    ).first()
+    result = await db.execute(
+        select(Document).where(
+            Document.id == document_id,
+            Document.tenant_id == current_user.tenant_id,
+            Document.is_active == True
+        )
+    )
+    document = result.scalars().first()
     
     if not document:
         raise HTTPException(
@@ -1,11 +1,14 @@
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 import time
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, load_only
 
-from app.config.database import get_db
+from app.config.database import get_db, get_async_db
 from app.models.work_permit import WorkPermit
 from app.models.user import User
 from app.schemas.work_permit import (
@@ -18,12 +21,14 @@ from app.services.auth_service import get_current_user
 from app.models.user import User
 from app.services.fast_ai_orchestrator import FastAIOrchestrator
 from app.services.service_factory import get_vector_service
-from app.agents.advanced_orchestrator import AdvancedHSEOrchestrator
+from app.services.permit_analysis_uow import PermitAnalysisUnitOfWork
 from app.core.permissions import require_permission
+from app.core.pagination import fetch_page, count_rows
 
 from app.core.tenant import enforce_tenant_isolation, tenant_context
 from app.core.tenant_queries import get_tenant_query_manager, tenant_required
 from app.core.audit import AuditService, get_client_ip, get_user_agent
+from app.core.tracing import traced, span, current_trace_id
 from fastapi import Request
 import json
 import uuid
@@ -47,12 +52,13 @@ def convert_enhanced_result_to_response_format(enhanced_result: Dict, permit_id:
     
     # First try to get action_items directly from enhanced result (new format)
     enhanced_action_items = enhanced_result.get("action_items", [])
-    print(f"[DEBUG] Enhanced result keys: {list(enhanced_result.keys())}")
-    print(f"[DEBUG] Enhanced action_items found: {len(enhanced_action_items)} items")
-    print(f"[DEBUG] Enhanced result analysis_metadata: {enhanced_result.get('analysis_metadata', {})}")
-    print(f"[DEBUG] Enhanced result final_output: {enhanced_result.get('final_output', {})}")
-    if enhanced_action_items:
-        print(f"[DEBUG] First action item: {enhanced_action_items[0] if enhanced_action_items else 'None'}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Enhanced result keys: %s", list(enhanced_result.keys()))
+        logger.debug("Enhanced action_items found: %s items", len(enhanced_action_items))
+        logger.debug("Enhanced result analysis_metadata: %s", metadata)
+        logger.debug("Enhanced result final_output: %s", final_output)
+        if enhanced_action_items:
+            logger.debug("First action item: %s", enhanced_action_items[0])
     if enhanced_action_items:
         for i, action in enumerate(enhanced_action_items):
             # Enhanced format already has proper structure
@@ -136,6 +142,17 @@ router = APIRouter(
 )
 logger = logging.getLogger(__name__)
 
+# Columns needed by WorkPermitResponse in list views (analysis payload excluded)
+PERMIT_LIST_COLUMNS = (
+    WorkPermit.id, WorkPermit.tenant_id, WorkPermit.title, WorkPermit.description,
+    WorkPermit.dpi_required, WorkPermit.work_type, WorkPermit.location, WorkPermit.equipment,
+    WorkPermit.risk_level, WorkPermit.start_date, WorkPermit.end_date,
+    WorkPermit.risk_mitigation_actions, WorkPermit.custom_fields, WorkPermit.status,
+    WorkPermit.is_active, WorkPermit.ai_version, WorkPermit.created_by, WorkPermit.approved_by,
+    WorkPermit.created_at, WorkPermit.updated_at, WorkPermit.analyzed_at,
+    WorkPermit.valid_from, WorkPermit.valid_until
+)
+
 
 def serialize_for_audit(data: Dict) -> Dict:
     """
@@ -196,7 +213,7 @@ async def create_work_permit(
     permit_data: WorkPermitCreate,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Crea un nuovo permesso di lavoro
@@ -218,8 +235,8 @@ async def create_work_permit(
         status="completed"  # Permesso definitivo quando salvato
     )
     
-    db.commit()
-    db.refresh(work_permit)
+    await db.commit()
+    await db.refresh(work_permit)
     
     # Audit log
     audit_service = AuditService(db)
@@ -247,44 +264,48 @@ async def list_work_permits(
     page_size: int = Query(20, ge=1, le=100, description="Elementi per pagina"),
     status: Optional[str] = Query(None, description="Filtra per status"),
     work_type: Optional[str] = Query(None, description="Filtra per tipo lavoro"),
+    cursor: Optional[str] = Query(None, description="Cursore della pagina successiva (sostituisce page)"),
+    count: str = Query("exact", pattern="^(exact|cached|estimate|none)$", description="Modalità conteggio totale"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Lista permessi di lavoro con paginazione e filtri
+    Lista permessi di lavoro con paginazione keyset su (created_at, id) e filtri
     """
-    # Base query with tenant isolation
-    query = db.query(WorkPermit).filter(WorkPermit.tenant_id == current_user.tenant_id)
+    # Base query with tenant isolation, projecting only the list columns
+    query = select(WorkPermit).options(load_only(*PERMIT_LIST_COLUMNS)).where(
+        WorkPermit.tenant_id == current_user.tenant_id
+    )
     
     # Apply user-level filtering based on permissions
     if current_user.role not in ["super_admin", "admin"]:
         if current_user.role == "manager":
             # Manager sees own permits only (department filtering removed)
-            query = query.filter(WorkPermit.created_by == current_user.id)
+            query = query.where(WorkPermit.created_by == current_user.id)
         else:
             # Operator/viewer sees only own permits
-            query = query.filter(WorkPermit.created_by == current_user.id)
+            query = query.where(WorkPermit.created_by == current_user.id)
     
     # Apply filters
     if status:
-        query = query.filter(WorkPermit.status == status)
+        query = query.where(WorkPermit.status == status)
     if work_type:
-        query = query.filter(WorkPermit.work_type == work_type)
+        query = query.where(WorkPermit.work_type == work_type)
     
-    # Get total count
-    total_count = query.count()
+    # Apply pagination: cursor seeks directly, page number kept for older clients
+    offset = 0 if cursor else (page - 1) * page_size
+    permits, next_cursor = await fetch_page(db, query, WorkPermit, cursor, page_size, offset)
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    permits = query.order_by(WorkPermit.created_at.desc()).offset(offset).limit(page_size).all()
+    total_count = await count_rows(db, query, count)
     
     return PermitListResponse(
         permits=permits,
         total_count=total_count,
         page=page,
         page_size=page_size,
-        has_next=offset + page_size < total_count,
-        has_previous=page > 1
+        has_next=next_cursor is not None,
+        has_previous=bool(cursor) or page > 1,
+        next_cursor=next_cursor
     )
 
 
@@ -293,15 +314,18 @@ async def list_work_permits(
 async def get_work_permit(
     permit_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Ottieni dettagli permesso di lavoro specifico
     """
-    permit = db.query(WorkPermit).filter(
-        WorkPermit.id == permit_id,
-        WorkPermit.tenant_id == current_user.tenant_id
-    ).first()
+    result = await db.execute(
+        select(WorkPermit).where(
+            WorkPermit.id == permit_id,
+            WorkPermit.tenant_id == current_user.tenant_id
+        ).options(selectinload(WorkPermit.current_analysis))
+    )
+    permit = result.scalars().first()
     
     if not permit:
         raise HTTPException(
@@ -336,15 +360,18 @@ async def update_work_permit(
     permit_update: WorkPermitUpdate,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Aggiorna permesso di lavoro
     """
-    permit = db.query(WorkPermit).filter(
-        WorkPermit.id == permit_id,
-        WorkPermit.tenant_id == current_user.tenant_id
-    ).first()
+    result = await db.execute(
+        select(WorkPermit).where(
+            WorkPermit.id == permit_id,
+            WorkPermit.tenant_id == current_user.tenant_id
+        ).options(selectinload(WorkPermit.current_analysis))
+    )
+    permit = result.scalars().first()
     
     if not permit:
         raise HTTPException(
@@ -375,8 +402,8 @@ async def update_work_permit(
     for field, value in update_data.items():
         setattr(permit, field, value)
     
-    db.commit()
-    db.refresh(permit)
+    await db.commit()
+    await db.refresh(permit, ["updated_at"])
     
     # Audit log
     audit_service = AuditService(db)
@@ -434,6 +461,8 @@ async def analyze_permit_preview(
         
         if orchestrator_type == 'advanced':
             # Use Advanced orchestrator with 3-step process
+            # (imported on first use: the specialists are preloaded by the startup warm-up)
+            from app.agents.advanced_orchestrator import AdvancedHSEOrchestrator
             orchestrator = AdvancedHSEOrchestrator(
                 user_context={
                     "tenant_id": current_user.tenant_id,
@@ -554,23 +583,27 @@ async def analyze_permit_preview(
 @router.post("/{permit_id}/analyze", response_model=PermitAnalysisResponse)
 @require_permission("permits.analyze")
 @tenant_required
+@traced("analyze_permit_comprehensive", attributes=("permit_id",))
 async def analyze_permit_comprehensive(
     permit_id: int,
     analysis_request: PermitAnalysisRequest,
     background_tasks: BackgroundTasks,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     ENDPOINT PRINCIPALE: Analisi completa permesso con tutti gli agenti AI
     """
+    # Plain values: a unit of work rollback expires current_user (same session),
+    # and expired attributes cannot be lazy loaded on an AsyncSession
+    tenant_id = current_user.tenant_id
+    user_id = current_user.id
+    department = getattr(current_user, 'department', 'safety')
+    uow = PermitAnalysisUnitOfWork(db, tenant_id)
     
     # Load permit with tenant validation
-    permit = db.query(WorkPermit).filter(
-        WorkPermit.id == permit_id,
-        WorkPermit.tenant_id == current_user.tenant_id
-    ).first()
+    permit = await uow.load_permit(permit_id)
     
     if not permit:
         raise HTTPException(
@@ -587,11 +620,10 @@ async def analyze_permit_comprehensive(
     
     # Update permit status with transaction handling
     try:
-        permit.status = "analyzing"
-        db.commit()
+        await uow.set_status(permit, "analyzing")
     except Exception as e:
         logger.error(f"Error updating permit status to analyzing: {e}")
-        db.rollback()
+        await uow.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update permit status for analysis"
@@ -601,146 +633,60 @@ async def analyze_permit_comprehensive(
         # Initialize vector service for searches
         vector_service = get_vector_service()
         
-        # Search relevant documents - try PostgreSQL first, fallback to vector search
         search_query = f"{permit.title} {permit.description} {permit.work_type or ''}"
-        relevant_docs = []
         
-        # HYBRID SEARCH STRATEGY: Use both PostgreSQL and Weaviate for comprehensive results
-        print(f"[PermitRouter] *** CITATION DEBUG *** STARTING hybrid document search for permit {permit_id}, work_type='{permit.work_type}'")
+        # HYBRID SEARCH STRATEGY: PostgreSQL context and Weaviate search run concurrently
+        logger.debug("Starting hybrid document search for permit %s, work_type='%s'", permit_id, permit.work_type)
         
-        postgres_docs = []
-        weaviate_docs = []
+        async def search_weaviate():
+            try:
+                return await vector_service.hybrid_search(
+                    query=search_query,
+                    filters={
+                        "tenant_id": tenant_id,
+                        "document_type": ["normativa", "istruzione_operativa", "procedura_sicurezza", 
+                                         "procedura", "standard", "guideline", "manuale"]
+                    },
+                    limit=12,  # Get more from Weaviate for semantic richness
+                    threshold=0.0  # Lower threshold to get more results
+                )
+            except Exception as e:
+                logger.warning("Weaviate search failed: %s", e)
+                logger.debug("Continuing with PostgreSQL results only (tenant isolation maintained)")
+                return []
         
-        # STEP 1: PostgreSQL structured search with separate session
-        try:
-            from app.models.document import Document
-            from app.config.database import SessionLocal
-            print(f"[PermitRouter] Searching PostgreSQL for documents...")
-            
-            # Use separate session for document search to avoid transaction conflicts
-            search_db = SessionLocal()
+        async def load_postgres_context():
             try:
-                # DEBUG: Check total documents and tenant filtering
-                total_docs = search_db.query(Document).count()
-                tenant_docs = search_db.query(Document).filter(Document.tenant_id == current_user.tenant_id).count()
-                print(f"[PermitRouter] DEBUG: Total docs={total_docs}, tenant_docs={tenant_docs}, user_tenant_id={current_user.tenant_id}")
-                
-                # SIMPLIFIED SEARCH: Get all tenant documents for now (to ensure we get documents)
-                # This ensures we have documents to cite while avoiding complex query issues
-                postgres_results = search_db.query(Document).filter(
-                    Document.tenant_id == current_user.tenant_id
-                ).limit(5).all()  # Get first 5 documents from tenant
-                
-                print(f"[PermitRouter] SIMPLIFIED: Found {len(postgres_results)} tenant documents")
-            finally:
-                search_db.close()
-            
-            # Convert to expected format
-            for doc in postgres_results:
-                postgres_docs.append({
-                    "id": doc.id,
-                    "title": doc.title,
-                    "document_type": doc.document_type,
-                    "document_code": doc.document_code,
-                    "keywords": doc.keywords or [],
-                    "content_summary": doc.content_summary or "",
-                    "industry_sectors": doc.industry_sectors or [],
-                    "search_score": 0.9,  # High score for direct matches
-                    "source": "PostgreSQL"
-                })
-            
-            print(f"[PermitRouter] PostgreSQL found {len(postgres_docs)} documents")
-            # DEBUG: Show PostgreSQL documents found
-            for i, doc in enumerate(postgres_docs):
-                title = doc.get("title", "No title")
-                doc_type = doc.get("document_type", "Unknown type")
-                doc_code = doc.get("document_code", "No code")
-                print(f"[PermitRouter] PG Doc {i+1}: {title} ({doc_type}) - Code: {doc_code}")
-            
-            
-        except Exception as e:
-            print(f"[PermitRouter] PostgreSQL document search failed: {e}")
+                with span("db.load_permit_context", permit_id=permit.id):
+                    return await uow.load_context(permit)
+            except Exception as e:
+                logger.warning("PostgreSQL context loading failed: %s", e)
+                await uow.rollback()
+                return {"postgres_docs": [], "historical_permits": [], "previous_permits": []}
         
-        # STEP 2: Weaviate semantic search (ALWAYS executed)
-        try:
-            print(f"[PermitRouter] Searching Weaviate for semantic matches...")
-            print(f"[PermitRouter] DEBUG: Weaviate search query='{search_query}', tenant_id={current_user.tenant_id}")
-            weaviate_results = await vector_service.hybrid_search(
-                query=search_query,
-                filters={
-                    "tenant_id": current_user.tenant_id,
-                    # Remove industry_sectors filter to be less restrictive
-                    "document_type": ["normativa", "istruzione_operativa", "procedura_sicurezza", 
-                                     "procedura", "standard", "guideline", "manuale"]
-                },
-                limit=12,  # Get more from Weaviate for semantic richness
-                threshold=0.0  # Lower threshold to get more results
-            )
-            
-            # Enrich search results with keywords from PostgreSQL
-            from app.services.document_service import DocumentService
-            doc_service = DocumentService(db)
-            weaviate_docs = doc_service.enrich_search_results_with_keywords(
-                weaviate_results, 
-                current_user.tenant_id
-            )
+        weaviate_results, permit_context = await asyncio.gather(search_weaviate(), load_postgres_context())
+        
+        postgres_docs = permit_context["postgres_docs"]
+        historical_permits = permit_context["historical_permits"]
+        
+        # Enrich search results with keywords from PostgreSQL
+        weaviate_docs = []
+        if weaviate_results:
+            try:
+                weaviate_docs = await uow.enrich_with_keywords(weaviate_results)
+            except Exception as e:
+                logger.warning("Keyword enrichment failed: %s", e)
+                await uow.rollback()
+                weaviate_docs = weaviate_results
             
             # Mark as Weaviate source
             for doc in weaviate_docs:
                 doc["source"] = "Weaviate"
-            
-            print(f"[PermitRouter] Weaviate found {len(weaviate_docs)} documents")
-            
-        except Exception as e:
-            print(f"[PermitRouter] Weaviate search failed: {e}")
-            print(f"[PermitRouter] Continuing with PostgreSQL results only (tenant isolation maintained)")
-        
-        # STEP 3: Add historical permits (lowest priority) with separate session
-        historical_permits = []
-        try:
-            # Use separate session for historical permit search
-            historical_db = SessionLocal()
-            try:
-                # Get similar historical permits for context
-                historical_results = historical_db.query(WorkPermit).filter(
-                    WorkPermit.tenant_id == current_user.tenant_id,
-                    WorkPermit.work_type == permit.work_type,
-                    WorkPermit.id != permit_id,
-                    WorkPermit.status.in_(['completed', 'approved'])  # Only successful permits
-                ).limit(5).all()
-            finally:
-                historical_db.close()
-            
-            for hist_permit in historical_results:
-                historical_permits.append({
-                    "id": hist_permit.id,
-                    "title": f"Permesso storico: {hist_permit.title}",
-                    "document_type": "historical_permit", 
-                    "document_code": f"PERMIT-{hist_permit.id}",
-                    "content_summary": f"Permesso {hist_permit.work_type}: {hist_permit.description[:100]}",
-                    "search_score": 0.3,  # Low priority
-                    "source": "Historical",
-                    "permit_status": hist_permit.status,
-                    "analyzed_at": hist_permit.analyzed_at.isoformat() if hist_permit.analyzed_at else None
-                })
-                
-            print(f"[PermitRouter] Found {len(historical_permits)} historical permits")
-            
-        except Exception as e:
-            print(f"[PermitRouter] Error fetching historical permits: {e}")
         
-        # STEP 4: Consolidate all results with priorities  
-        print(f"[PermitRouter] BEFORE consolidation: PostgreSQL={len(postgres_docs)}, Weaviate={len(weaviate_docs)}, Historical={len(historical_permits)}")
+        # Consolidate all results with priorities  
+        logger.debug("BEFORE consolidation: PostgreSQL=%s, Weaviate=%s, Historical=%s", len(postgres_docs), len(weaviate_docs), len(historical_permits))
         relevant_docs = consolidate_search_results(postgres_docs, weaviate_docs, historical_permits)
-        print(f"[PermitRouter] AFTER consolidation: {len(relevant_docs)} unique documents from all sources")
-        
-        # DEBUG: Show what types of documents made it through consolidation
-        for i, doc in enumerate(relevant_docs):
-            doc_title = doc.get("title", "No title")
-            doc_source = doc.get("source", "Unknown source")
-            doc_type = doc.get("document_type", "Unknown type")
-            print(f"[PermitRouter] Doc {i+1}: {doc_title} (source: {doc_source}, type: {doc_type})")
-        
+        logger.debug("AFTER consolidation: %s unique documents from all sources", len(relevant_docs))
         
         # Prepare permit metadata from PostgreSQL
         permit_metadata = {
@@ -751,50 +697,30 @@ async def analyze_permit_comprehensive(
             "equipment_list": [],
             "identified_risks": [],
             "control_measures": [],
-            "required_ppe": permit.dpi_required or []
+            "required_ppe": permit.dpi_required or [],
+            "previous_permits": permit_context["previous_permits"]
         }
         
-        # Get historical data if available with separate session
-        try:
-            # Use separate session for similar permits search
-            similar_db = SessionLocal()
-            try:
-                # Get similar permits
-                similar_permits = similar_db.query(WorkPermit).filter(
-                    WorkPermit.tenant_id == current_user.tenant_id,
-                    WorkPermit.work_type == permit.work_type,
-                    WorkPermit.id != permit.id
-                ).limit(5).all()
-            finally:
-                similar_db.close()
-            
-            permit_metadata["previous_permits"] = [
-                {"id": p.id, "title": p.title, "status": p.status}
-                for p in similar_permits
+        # Get site-specific risks (from custom fields or dedicated table)
+        if permit.location:
+            permit_metadata["site_specific_risks"] = [
+                f"Rischio specifico per {permit.location}"
             ]
-            
-            # Get site-specific risks (from custom fields or dedicated table)
-            if permit.location:
-                permit_metadata["site_specific_risks"] = [
-                    f"Rischio specifico per {permit.location}"
-                ]
-        except Exception as e:
-            print(f"[PermitRouter] Warning: Could not fetch historical data: {e}")
         
         # Choose orchestrator based on request parameter
         user_context = {
-            "tenant_id": current_user.tenant_id,
-            "user_id": current_user.id,
-            "department": getattr(current_user, 'department', 'safety')
+            "tenant_id": tenant_id,
+            "user_id": user_id,
+            "department": department
         }
         
         # Debug: Log which orchestrator is being used
-        logger.info(f"[PermitRouter] Orchestrator requested: {analysis_request.orchestrator}")
-        print(f"[PermitRouter] DEBUG: Orchestrator type = '{analysis_request.orchestrator}'")
+        logger.debug("Orchestrator requested: %s", analysis_request.orchestrator)
         
         if analysis_request.orchestrator == "advanced":
             # Use Advanced Orchestrator with 3-step process
-            print(f"[PermitRouter] Using Advanced Orchestrator for analysis - permit {permit_id}")
+            logger.info("Using Advanced Orchestrator for analysis - permit %s", permit_id)
+            from app.agents.advanced_orchestrator import AdvancedHSEOrchestrator
             orchestrator = AdvancedHSEOrchestrator(
                 user_context=user_context,
                 vector_service=vector_service
@@ -806,7 +732,7 @@ async def analyze_permit_comprehensive(
             )
         elif analysis_request.orchestrator == "fast":
             # Use Fast AI Orchestrator for quick single-call analysis
-            print(f"[PermitRouter] Using Fast AI Orchestrator for quick analysis - permit {permit_id}")
+            logger.info("Using Fast AI Orchestrator for quick analysis - permit %s", permit_id)
             orchestrator = FastAIOrchestrator()
             analysis_result = await orchestrator.run_fast_analysis(
                 permit_data=permit.to_dict(),
@@ -816,7 +742,7 @@ async def analyze_permit_comprehensive(
             )
         else:
             # Default to fast analysis if invalid orchestrator type
-            print(f"[PermitRouter] Invalid orchestrator '{analysis_request.orchestrator}', defaulting to fast analysis")
+            logger.warning("Invalid orchestrator '%s', defaulting to fast analysis", analysis_request.orchestrator)
             orchestrator = FastAIOrchestrator()
             analysis_result = await orchestrator.run_fast_analysis(
                 permit_data=permit.to_dict(),
@@ -826,57 +752,33 @@ async def analyze_permit_comprehensive(
             )
         
         # Debug: Log analysis result keys
-        logger.info(f"[PermitRouter] Analysis result keys: {list(analysis_result.keys())}")
-        print(f"[PermitRouter] DEBUG: Required fields check - citations: {'citations' in analysis_result}, ai_version: {'ai_version' in analysis_result}")
+        logger.debug("Analysis result keys: %s", list(analysis_result.keys()))
+        logger.debug("Required fields check - citations: %s, ai_version: %s", 'citations' in analysis_result, 'ai_version' in analysis_result)
         
         # Convert enhanced result to PermitAnalysisResponse format
         if analysis_request.orchestrator == "advanced":
             analysis_result = convert_enhanced_result_to_response_format(analysis_result, permit_id)
         
-        # Save analysis results with fresh database session to avoid transaction conflicts
-        from app.config.database import SessionLocal
-        fresh_db = SessionLocal()
+        # Link the stored analysis to its trace
+        trace_id = current_trace_id()
+        if trace_id:
+            analysis_result.setdefault("performance_metrics", {})["trace_id"] = trace_id
+        
+        # Save analysis results in the same unit of work
         try:
-            # Get fresh permit instance from new session
-            fresh_permit = fresh_db.query(WorkPermit).filter(
-                WorkPermit.id == permit_id,
-                WorkPermit.tenant_id == current_user.tenant_id
-            ).first()
-            
-            if not fresh_permit:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Work permit not found"
-                )
-            
-            # Update with analysis results
-            fresh_permit.ai_analysis = analysis_result
-            fresh_permit.ai_version = analysis_result.get("ai_version", "1.0")
-            fresh_permit.analyzed_at = datetime.utcnow()
-            fresh_permit.status = "reviewed"
-            
-            # Save structured results in individual fields
-            fresh_permit.action_items = analysis_result.get("action_items", [])
-            
-            fresh_db.commit()
-            
-            # Update the original permit object for consistency
-            permit.ai_analysis = analysis_result
-            permit.status = "reviewed"
-            
+            with span("db.save_analysis", permit_id=permit_id):
+                await uow.save_analysis(permit, analysis_result)
         except Exception as e:
             logger.error(f"Error saving analysis results: {e}")
-            fresh_db.rollback()
+            await uow.rollback()
             raise e
-        finally:
-            fresh_db.close()
         
-        # Audit log for AI analysis with fresh session
-        fresh_audit_db = SessionLocal()
+        # Audit log for AI analysis
         try:
-            audit_service = AuditService(fresh_audit_db)
+            audit_service = AuditService(db)
             await audit_service.log_ai_analysis(
-                user=current_user,
+                user_id=user_id,
+                tenant_id=tenant_id,
                 permit_id=permit_id,
                 analysis_results=analysis_result,
                 processing_time=analysis_result.get("processing_time", 0.0)
@@ -884,8 +786,8 @@ async def analyze_permit_comprehensive(
             
             # Log regular action
             await audit_service.log_action(
-                user_id=current_user.id,
-                tenant_id=current_user.tenant_id,
+                user_id=user_id,
+                tenant_id=tenant_id,
                 action="permit.analyzed",
                 resource_type="work_permit",
                 resource_id=permit_id,
@@ -899,12 +801,9 @@ async def analyze_permit_comprehensive(
                 api_endpoint=request.url.path,
                 category="ai_analysis"
             )
-            fresh_audit_db.commit()
         except Exception as audit_error:
             logger.error(f"Error logging audit information: {audit_error}")
-            fresh_audit_db.rollback()
-        finally:
-            fresh_audit_db.close()
+            await uow.rollback()
         
         # Convert dict data back to Pydantic objects for the response if it was processed by advanced orchestrator
         if analysis_request.orchestrator == "advanced":
@@ -925,18 +824,17 @@ async def analyze_permit_comprehensive(
     except Exception as e:
         # Update permit status on error with proper transaction handling
         try:
-            permit.status = "draft"
-            db.commit()
+            await uow.set_status(permit, "draft")
         except Exception as commit_error:
             logger.error(f"Error updating permit status after failure: {commit_error}")
-            db.rollback()
+            await uow.rollback()
         
         # Log error
         try:
             audit_service = AuditService(db)
             await audit_service.log_action(
-                user_id=current_user.id,
-                tenant_id=current_user.tenant_id,
+                user_id=user_id,
+                tenant_id=tenant_id,
                 action="permit.analysis_failed",
                 resource_type="work_permit",
                 resource_id=permit_id,
@@ -960,15 +858,18 @@ async def analyze_permit_comprehensive(
 async def get_permit_analysis_status(
     permit_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Ottieni lo status dell'analisi di un permesso
     """
-    permit = db.query(WorkPermit).filter(
-        WorkPermit.id == permit_id,
-        WorkPermit.tenant_id == current_user.tenant_id
-    ).first()
+    result = await db.execute(
+        select(WorkPermit).where(
+            WorkPermit.id == permit_id,
+            WorkPermit.tenant_id == current_user.tenant_id
+        ).options(selectinload(WorkPermit.current_analysis))
+    )
+    permit = result.scalars().first()
     
     if not permit:
         raise HTTPException(
@@ -1001,15 +902,18 @@ async def delete_work_permit(
     permit_id: int,
     request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Elimina permesso di lavoro
     """
-    permit = db.query(WorkPermit).filter(
-        WorkPermit.id == permit_id,
-        WorkPermit.tenant_id == current_user.tenant_id
-    ).first()
+    result = await db.execute(
+        select(WorkPermit).where(
+            WorkPermit.id == permit_id,
+            WorkPermit.tenant_id == current_user.tenant_id
+        )
+    )
+    permit = result.scalars().first()
     
     if not permit:
         raise HTTPException(
@@ -1033,8 +937,8 @@ async def delete_work_permit(
     }
     
     # Delete permit
-    db.delete(permit)
-    db.commit()
+    await db.delete(permit)
+    await db.commit()
     
     # Audit log
     audit_service = AuditService(db)
@@ -0,0 +1,37 @@
+from typing import List, Optional, Dict, Any
+from datetime import datetime
+from pydantic import BaseModel, field_validator
+
+
+class AuditLogResponse(BaseModel):
+    id: int
+    tenant_id: int
+    user_id: Optional[int] = None
+    username: Optional[str] = None
+    action: str
+    resource_type: str
+    resource_id: Optional[int] = None
+    resource_name: Optional[str] = None
+    extra_data: Optional[Dict[str, Any]] = None
+    ip_address: Optional[str] = None
+    api_endpoint: Optional[str] = None
+    severity: Optional[str] = None
+    category: Optional[str] = None
+    created_at: datetime
+    
+    @field_validator('ip_address', mode='before')
+    @classmethod
+    def ip_to_string(cls, v):
+        # asyncpg returns INET values as ipaddress objects
+        return str(v) if v is not None else None
+    
+    class Config:
+        from_attributes = True
+
+
+class AuditLogListResponse(BaseModel):
+    audit_logs: List[AuditLogResponse]
+    total_count: Optional[int] = None  # None when count=none
+    page_size: int
+    has_next: bool
+    next_cursor: Optional[str] = None
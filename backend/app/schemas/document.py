@@ -51,9 +51,10 @@ class DocumentUpdateRequest(BaseModel):
 
 class DocumentListResponse(BaseModel):
     documents: List[DocumentResponse]
-    total: int
+    total: Optional[int] = None  # None when count=none
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class DocumentVersionResponse(BaseModel):
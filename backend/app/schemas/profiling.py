@@ -0,0 +1,37 @@
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field
+
+
+class ProfileResponse(BaseModel):
+    request_id: str  # profile id, generated server-side
+    client_request_id: Optional[str] = None  # X-Request-ID sent by the client
+    method: str
+    path: str
+    status_code: int
+    duration_ms: float
+    started_at: float
+    tenant_id: Optional[int] = None
+    user_id: Optional[int] = None
+    trigger: str
+    trace_id: Optional[str] = None
+    step_timings: Optional[Dict[str, Any]] = None  # orchestrator steps, analysis requests only
+
+
+class ProfileListResponse(BaseModel):
+    profiles: List[ProfileResponse]
+    profiling_available: bool
+
+
+class ProfileTargetCreate(BaseModel):
+    tenant_id: Optional[int] = None  # None: any tenant (super admin only)
+    path_prefix: Optional[str] = None  # e.g. "/api/v1/permits/"
+    count: int = Field(10, ge=1, le=1000)
+    ttl_minutes: int = Field(60, ge=1, le=1440)
+
+
+class ProfileTargetResponse(BaseModel):
+    id: str
+    tenant_id: Optional[int] = None
+    path_prefix: Optional[str] = None
+    count: int
+    expires_at: float
@@ -209,11 +209,12 @@ class PermitPreviewAnalysisRequest(BaseModel):
 
 class PermitListResponse(BaseModel):
     permits: List[WorkPermitResponse]
-    total_count: int
+    total_count: Optional[int] = None  # None when count=none
     page: int
     page_size: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
 
 class PermitAnalysisStatusResponse(BaseModel):
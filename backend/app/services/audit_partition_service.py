@@ -0,0 +1,142 @@
+from typing import List, Optional
+from datetime import date, datetime, timedelta
+import asyncio
+import logging
+import re
+
+from sqlalchemy import select, text
+
+from app.config.settings import settings
+from app.core.tenant import get_tenant_settings
+from app.models.tenant import Tenant
+
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME = re.compile(r"^audit_logs_p(\d{4})(\d{2})$")
+
+# Only one worker runs the maintenance at a time
+MAINTENANCE_LOCK_ID = 7301
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class AuditPartitionService:
+    """
+    Maintains the monthly partitions of audit_logs: creates the upcoming months
+    ahead of time and enforces audit_retention_days by dropping whole partitions.
+
+    Partitions are shared by all tenants, so a month is dropped only once it is
+    older than the longest retention configured across active tenants.
+    """
+
+    def __init__(self, months_ahead: int, interval_hours: float):
+        self.months_ahead = months_ahead
+        self.interval_hours = interval_hours
+        self._task: Optional[asyncio.Task] = None
+
+    async def list_partitions(self, db) -> List[str]:
+        result = await db.execute(text("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = 'audit_logs'
+            ORDER BY child.relname
+        """))
+        return [row[0] for row in result]
+
+    async def ensure_partitions(self, db, today: Optional[date] = None) -> List[str]:
+        """
+        Create the partitions for the current month and the next months_ahead
+        """
+        current_month = (today or datetime.utcnow().date()).replace(day=1)
+        existing = set(await self.list_partitions(db))
+        created = []
+        for offset in range(self.months_ahead + 1):
+            month = _add_months(current_month, offset)
+            name = f"audit_logs_p{month:%Y%m}"
+            if name in existing:
+                continue
+            await db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_logs "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+        return created
+
+    async def get_retention_days(self, db) -> int:
+        """
+        Longest audit_retention_days among active tenants
+        """
+        result = await db.execute(select(Tenant).where(Tenant.is_active == True))
+        retention_days = [
+            int(get_tenant_settings(tenant)["audit_retention_days"])
+            for tenant in result.scalars()
+        ]
+        return max(retention_days, default=365)
+
+    async def drop_expired_partitions(self, db, retention_days: int, today: Optional[date] = None) -> List[str]:
+        """
+        Detach and drop the partitions whose whole month is past retention
+        """
+        cutoff = (today or datetime.utcnow().date()) - timedelta(days=retention_days)
+        dropped = []
+        for name in await self.list_partitions(db):
+            match = PARTITION_NAME.match(name)
+            if not match:
+                continue
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            if _add_months(month, 1) > cutoff:
+                continue
+            await db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+            await db.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+        return dropped
+
+    async def run_maintenance(self) -> dict:
+        from app.config.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            locked = (await db.execute(text("SELECT pg_try_advisory_xact_lock(:lock_id)"), {"lock_id": MAINTENANCE_LOCK_ID})).scalar()
+            if not locked:
+                return {"created": [], "dropped": [], "retention_days": None}
+            created = await self.ensure_partitions(db)
+            retention_days = await self.get_retention_days(db)
+            dropped = await self.drop_expired_partitions(db, retention_days)
+            await db.commit()
+
+        if created or dropped:
+            logger.info(f"Audit partitions: created {created}, dropped {dropped} (retention {retention_days} days)")
+        return {"created": created, "dropped": dropped, "retention_days": retention_days}
+
+    async def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="audit-partitions")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_maintenance()
+            except Exception as e:
+                logger.error(f"Audit partition maintenance failed: {e}")
+            await asyncio.sleep(self.interval_hours * 3600)
+
+
+# Global audit partition maintenance
+audit_partition_service = AuditPartitionService(
+    months_ahead=settings.audit_partition_months_ahead,
+    interval_hours=settings.audit_partition_maintenance_interval_hours
+)
@@ -1,13 +1,19 @@
 from typing import Optional
 from datetime import datetime, timedelta
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import verify_password, get_password_hash, create_access_token, decode_token
+from app.core.security import (
+    get_password_hash_async, verify_and_update_password,
+    create_access_token, decode_token, get_request_token_payload
+)
+from app.core.user_cache import user_cache
 from app.models.user import User
 from app.models.tenant import Tenant
-from app.config.database import get_db
+from app.config.database import get_async_db
+from app.core.tenant import tenant_context
 
 
 security = HTTPBearer()
@@ -18,38 +24,48 @@ class AuthService:
     Authentication service for user management
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def authenticate_user(self, username: str, password: str, tenant_id: int) -> Optional[User]:
+    async def authenticate_user(self, username: str, password: str, tenant_id: int) -> Optional[User]:
         """
         Authenticate user with username/password
         """
-        user = self.db.query(User).filter(
-            User.username == username,
-            User.tenant_id == tenant_id,
-            User.is_active == True
-        ).first()
+        result = await self.db.execute(
+            select(User).where(
+                User.username == username,
+                User.tenant_id == tenant_id,
+                User.is_active == True
+            )
+        )
+        user = result.scalars().first()
         
         if not user:
             return None
         
-        if not verify_password(password, user.password_hash):
+        valid, new_hash = await verify_and_update_password(password, user.password_hash)
+        if not valid:
             # Increment failed login attempts
             user.failed_login_attempts += 1
             if user.failed_login_attempts >= 5:
                 user.is_active = False  # Lock account after 5 failed attempts
-            self.db.commit()
+            await self.db.commit()
+            if not user.is_active:
+                await user_cache.invalidate(user.id)
             return None
         
+        # Upgrade hashes made with a different work factor
+        if new_hash:
+            user.password_hash = new_hash
+        
         # Reset failed attempts on successful login
         user.failed_login_attempts = 0
         user.last_login = datetime.utcnow()
-        self.db.commit()
+        await self.db.commit()
         
         return user
     
-    def create_user(
+    async def create_user(
         self,
         username: str,
         email: str,
@@ -64,10 +80,13 @@ class AuthService:
         Create new user
         """
         # Check if username already exists in tenant
-        existing_user = self.db.query(User).filter(
-            User.username == username,
-            User.tenant_id == tenant_id
-        ).first()
+        result = await self.db.execute(
+            select(User.id).where(
+                User.username == username,
+                User.tenant_id == tenant_id
+            )
+        )
+        existing_user = result.scalar()
         
         if existing_user:
             raise HTTPException(
@@ -76,10 +95,13 @@ class AuthService:
             )
         
         # Check email uniqueness in tenant
-        existing_email = self.db.query(User).filter(
-            User.email == email,
-            User.tenant_id == tenant_id
-        ).first()
+        result = await self.db.execute(
+            select(User.id).where(
+                User.email == email,
+                User.tenant_id == tenant_id
+            )
+        )
+        existing_email = result.scalar()
         
         if existing_email:
             raise HTTPException(
@@ -91,7 +113,7 @@ class AuthService:
         user = User(
             username=username,
             email=email,
-            password_hash=get_password_hash(password),
+            password_hash=await get_password_hash_async(password),
             tenant_id=tenant_id,
             first_name=first_name,
             last_name=last_name,
@@ -100,52 +122,60 @@ class AuthService:
         )
         
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         
         return user
     
-    def get_user_by_id(self, user_id: int, tenant_id: int) -> Optional[User]:
+    async def get_user_by_id(self, user_id: int, tenant_id: int) -> Optional[User]:
         """
         Get user by ID with tenant validation
         """
-        return self.db.query(User).filter(
-            User.id == user_id,
-            User.tenant_id == tenant_id,
-            User.is_active == True
-        ).first()
+        result = await self.db.execute(
+            select(User).where(
+                User.id == user_id,
+                User.tenant_id == tenant_id,
+                User.is_active == True
+            )
+        )
+        return result.scalars().first()
     
-    def update_user_password(self, user: User, new_password: str) -> User:
+    async def update_user_password(self, user: User, new_password: str) -> User:
         """
         Update user password
         """
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await get_password_hash_async(new_password)
         user.failed_login_attempts = 0  # Reset failed attempts
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        await user_cache.invalidate(user.id)
         return user
     
-    def deactivate_user(self, user: User) -> User:
+    async def deactivate_user(self, user: User) -> User:
         """
         Deactivate user account
         """
         user.is_active = False
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        await user_cache.invalidate(user.id)
         return user
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """
     Dependency to get current authenticated user
     """
     try:
-        payload = decode_token(credentials.credentials)
+        # Token already decoded by the middlewares for this request
+        payload = get_request_token_payload(request) or decode_token(credentials.credentials)
         user_id = int(payload.get("sub"))
         tenant_id = int(payload.get("tenant_id"))
+        issued_at = payload.get("iat")
         
         if not user_id or not tenant_id:
             raise HTTPException(
@@ -153,20 +183,38 @@ async def get_current_user(
                 detail="Invalid token payload"
             )
         
-        auth_service = AuthService(db)
-        user = auth_service.get_user_by_id(user_id, tenant_id)
-        
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found or inactive"
+        cached_user = user_cache.get_user(user_id, issued_at)
+        if cached_user is not None and cached_user.tenant_id == tenant_id:
+            # Attach the snapshot to this session without a SELECT
+            user = await db.merge(cached_user, load=False)
+        else:
+            result = await db.execute(
+                select(User).where(
+                    User.id == user_id,
+                    User.tenant_id == tenant_id,
+                    User.is_active == True
+                )
             )
+            user = result.scalars().first()
+            
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found or inactive"
+                )
+            
+            user_cache.put_user(user, issued_at)
         
-        # Verify tenant is active
-        tenant = db.query(Tenant).filter(
-            Tenant.id == tenant_id,
-            Tenant.is_active == True
-        ).first()
+        # Verify tenant is active (already done by TenantMiddleware when the context is set)
+        tenant = tenant_id if tenant_context.current_tenant_id == tenant_id else None
+        if not tenant:
+            result = await db.execute(
+                select(Tenant.id).where(
+                    Tenant.id == tenant_id,
+                    Tenant.is_active == True
+                )
+            )
+            tenant = result.scalar()
         
         if not tenant:
             raise HTTPException(
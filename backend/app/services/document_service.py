@@ -6,11 +6,6 @@ import asyncio
 from datetime import datetime
 from fastapi import UploadFile, HTTPException, status
 from sqlalchemy.orm import Session
-try:
-    import pypdf
-except ImportError:
-    import PyPDF2 as pypdf
-import docx
 import re
 from contextlib import asynccontextmanager
 
@@ -19,16 +14,13 @@ from app.services.vector_service import VectorService
 from app.services.storage_service import StorageService
 from app.core.tenant import validate_tenant_limits
 from app.config.settings import settings
+from app.core.lazy import lazy_import
 
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
-
-try:
-    import openai
-except ImportError:
-    openai = None
+# Heavy SDKs, imported on first upload or AI summary
+pypdf = lazy_import("pypdf", "PyPDF2")
+docx = lazy_import("docx")
+genai = lazy_import("google.generativeai")
+openai = lazy_import("openai")
 
 
 class DocumentService:
@@ -3,12 +3,7 @@ import time
 import json
 from datetime import datetime
 
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
-
-from app.config.settings import settings
+from app.services.llm_provider import get_llm_provider
 
 
 class FastAIOrchestrator:
@@ -17,11 +12,9 @@ class FastAIOrchestrator:
     """
     
     def __init__(self):
-        # Configure Gemini
-        if genai and settings.gemini_api_key:
-            genai.configure(api_key=settings.gemini_api_key)
-            self.model = genai.GenerativeModel(settings.gemini_model)
-        else:
+        # Gemini, or the stand-in when ai_provider = "standin"
+        self.provider = get_llm_provider()
+        if not self.provider.available:
             raise ValueError("Gemini API key required for FastAIOrchestrator")
     
     async def run_fast_analysis(
@@ -99,7 +92,7 @@ IMPORTANTE: Sii specifico e pratico nelle raccomandazioni. Non fare riferimenti
 """
             
             # Call Gemini directly
-            response = self.model.generate_content(prompt)
+            response = await self.provider.generate_content(prompt, caller="FastAIOrchestrator")
             
             # Parse response
             try:
@@ -0,0 +1,127 @@
+"""
+LLM provider interface: Gemini in production, a deterministic stand-in for
+load testing (in-process or scripts/run_llm_standin.py over HTTP).
+Selected with settings.ai_provider.
+"""
+from typing import Any, Optional
+from abc import ABC, abstractmethod
+import asyncio
+
+from app.config.settings import settings
+from app.services.standin_llm import StandInLLM, StandInLLMError, StandInRateLimitError, StandInResponse
+
+
+class LLMProvider(ABC):
+    """generate_content returns an object with .text and .usage_metadata"""
+
+    model_name: str = ""
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    async def generate_content(self, prompt: str, caller: str = "") -> Any:
+        pass
+
+    async def close(self):
+        pass
+
+
+class GeminiProvider(LLMProvider):
+
+    def __init__(self, api_key: str, model_name: str):
+        self.api_key = api_key
+        self.model_name = model_name
+        self._model = None
+
+    @property
+    def available(self) -> bool:
+        return bool(self.api_key)
+
+    async def generate_content(self, prompt: str, caller: str = "") -> Any:
+        if self._model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel(self.model_name)
+        # The SDK call is blocking: keep it off the event loop
+        return await asyncio.to_thread(self._model.generate_content, prompt)
+
+
+class StandInLLMProvider(LLMProvider):
+    """In-process stand-in: sleeps the drawn latency, then answers or fails"""
+
+    model_name = "standin"
+
+    def __init__(self, engine: StandInLLM):
+        self.engine = engine
+
+    async def generate_content(self, prompt: str, caller: str = "") -> Any:
+        delay, error, response = self.engine.plan(prompt, caller)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return response
+
+
+class HTTPStandInLLMProvider(LLMProvider):
+    """Stand-in served by scripts/run_llm_standin.py, to include HTTP overhead"""
+
+    model_name = "standin-http"
+
+    def __init__(self, url: str, timeout: float = 120.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self._client = None
+
+    async def generate_content(self, prompt: str, caller: str = "") -> Any:
+        import httpx
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=self.url, timeout=self.timeout)
+        response = await self._client.post("/generate", json={"prompt": prompt, "caller": caller})
+        if response.status_code == 429:
+            raise StandInRateLimitError(retry_after=float(response.headers.get("Retry-After", 1)))
+        if response.status_code >= 400:
+            raise StandInLLMError(f"{response.status_code} {response.text[:200]}")
+        body = response.json()
+        return StandInResponse(body["text"], body["usage"]["prompt_tokens"], body["usage"]["completion_tokens"])
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_standin_engine() -> StandInLLM:
+    return StandInLLM(
+        latency=settings.llm_standin_latency,
+        latency_ms=settings.llm_standin_latency_ms,
+        sigma=settings.llm_standin_latency_sigma,
+        error_rate=settings.llm_standin_error_rate,
+        rate_limit_rate=settings.llm_standin_rate_limit_rate,
+        seed=settings.llm_standin_seed
+    )
+
+
+# Global provider, created on first use
+_provider: Optional[LLMProvider] = None
+
+
+def get_llm_provider() -> LLMProvider:
+    global _provider
+    if _provider is None:
+        if settings.ai_provider == "standin":
+            if settings.llm_standin_url:
+                _provider = HTTPStandInLLMProvider(settings.llm_standin_url)
+            else:
+                _provider = StandInLLMProvider(create_standin_engine())
+        else:
+            _provider = GeminiProvider(settings.gemini_api_key, settings.gemini_model)
+    return _provider
+
+
+def set_llm_provider(provider: Optional[LLMProvider]):
+    """Swap the global provider (benchmarks and tests); None re-reads settings"""
+    global _provider
+    _provider = provider
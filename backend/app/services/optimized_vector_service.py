@@ -3,14 +3,17 @@ Optimized Vector Service with Weaviate Native Multi-Tenancy
 Enhanced performance with enterprise-grade tenant isolation
 """
 from typing import List, Dict, Any, Optional
-import weaviate
 import json
 import asyncio
 from contextlib import asynccontextmanager
 
 from app.config.settings import settings
+from app.core.lazy import lazy_import
+from app.core.metrics import observe_vector_search
 from app.core.tenant import tenant_context
 
+weaviate = lazy_import("weaviate")
+
 
 class OptimizedVectorService:
     """
@@ -239,6 +242,7 @@ class OptimizedVectorService:
             print(f"[OptimizedVectorService] Falling back to filter-based isolation for tenant {tenant_id}")
             return None
 
+    @observe_vector_search("fast_semantic_search")
     async def fast_semantic_search(
         self,
         query: str,
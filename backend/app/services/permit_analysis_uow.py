@@ -0,0 +1,192 @@
+"""
+Unit of work for permit analysis: a single AsyncSession per request
+"""
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+from sqlalchemy import select, literal, union_all, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.config.settings import settings
+from app.models.document import Document
+from app.models.permit_analysis import PermitAnalysis
+from app.models.work_permit import WorkPermit
+
+
+SUCCESSFUL_PERMIT_STATUSES = ("completed", "approved")
+
+
+class PermitAnalysisUnitOfWork:
+    """
+    Groups every database operation of an analysis request on one session.
+    The session commits after the status change, so no connection is held
+    while the orchestrator is running.
+    """
+
+    def __init__(self, db: AsyncSession, tenant_id: int):
+        self.db = db
+        self.tenant_id = tenant_id
+        self.permit: Optional[WorkPermit] = None
+
+    async def load_permit(self, permit_id: int) -> Optional[WorkPermit]:
+        result = await self.db.execute(
+            select(WorkPermit).where(
+                WorkPermit.id == permit_id,
+                WorkPermit.tenant_id == self.tenant_id
+            ).options(selectinload(WorkPermit.current_analysis))
+        )
+        self.permit = result.scalars().first()
+        return self.permit
+
+    async def set_status(self, permit: WorkPermit, status: str):
+        permit.status = status
+        await self.db.commit()
+
+    async def load_context(self, permit: WorkPermit, limit: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Load tenant documents plus historical and similar permits.
+        Both permit lists come from one UNION ALL statement.
+        """
+        doc_result = await self.db.execute(
+            select(
+                Document.id,
+                Document.title,
+                Document.document_type,
+                Document.document_code,
+                Document.keywords,
+                Document.content_summary,
+                Document.industry_sectors
+            ).where(Document.tenant_id == self.tenant_id).limit(limit)
+        )
+        postgres_docs = [
+            {
+                "id": row.id,
+                "title": row.title,
+                "document_type": row.document_type,
+                "document_code": row.document_code,
+                "keywords": row.keywords or [],
+                "content_summary": row.content_summary or "",
+                "industry_sectors": row.industry_sectors or [],
+                "search_score": 0.9,  # High score for direct matches
+                "source": "PostgreSQL"
+            }
+            for row in doc_result
+        ]
+
+        columns = (
+            WorkPermit.id,
+            WorkPermit.title,
+            WorkPermit.status,
+            WorkPermit.work_type,
+            WorkPermit.description,
+            WorkPermit.analyzed_at
+        )
+        same_type = (
+            WorkPermit.tenant_id == self.tenant_id,
+            WorkPermit.work_type == permit.work_type,
+            WorkPermit.id != permit.id
+        )
+        similar = select(*columns, literal(False).label("historical")).where(*same_type).limit(limit).subquery()
+        historical = select(*columns, literal(True).label("historical")).where(
+            *same_type,
+            WorkPermit.status.in_(SUCCESSFUL_PERMIT_STATUSES)  # Only successful permits
+        ).limit(limit).subquery()
+        permit_result = await self.db.execute(union_all(select(similar), select(historical)))
+
+        historical_permits = []
+        previous_permits = []
+        for row in permit_result:
+            if row.historical:
+                historical_permits.append({
+                    "id": row.id,
+                    "title": f"Permesso storico: {row.title}",
+                    "document_type": "historical_permit",
+                    "document_code": f"PERMIT-{row.id}",
+                    "content_summary": f"Permesso {row.work_type}: {(row.description or '')[:100]}",
+                    "search_score": 0.3,  # Low priority
+                    "source": "Historical",
+                    "permit_status": row.status,
+                    "analyzed_at": row.analyzed_at.isoformat() if row.analyzed_at else None
+                })
+            else:
+                previous_permits.append({"id": row.id, "title": row.title, "status": row.status})
+
+        return {
+            "postgres_docs": postgres_docs,
+            "historical_permits": historical_permits,
+            "previous_permits": previous_permits
+        }
+
+    async def enrich_with_keywords(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of DocumentService.enrich_search_results_with_keywords
+        """
+        document_codes = list(set(r.get("document_code") for r in search_results if r.get("document_code")))
+        keyword_map = {}
+        if document_codes:
+            result = await self.db.execute(
+                select(Document.document_code, Document.keywords).where(
+                    Document.tenant_id == self.tenant_id,
+                    Document.document_code.in_(document_codes),
+                    Document.is_active == True
+                )
+            )
+            keyword_map = {row.document_code: row.keywords for row in result}
+
+        for item in search_results:
+            item["keywords"] = keyword_map.get(item.get("document_code")) or []
+        return search_results
+
+    async def save_analysis(self, permit: WorkPermit, analysis_result: Dict[str, Any]):
+        """
+        Store the result as a new analysis version and mark it current
+        """
+        analyzed_at = datetime.utcnow()
+        ai_version = analysis_result.get("ai_version", "1.0")
+
+        # Serialize concurrent analyses of the same permit: without the row lock
+        # both would insert max(version) + 1 and fail on commit
+        await self.db.execute(
+            select(WorkPermit.id).where(WorkPermit.id == permit.id).with_for_update()
+        )
+        last_version = await self.db.scalar(
+            select(func.max(PermitAnalysis.version)).where(PermitAnalysis.permit_id == permit.id)
+        )
+        await self.db.execute(
+            update(PermitAnalysis)
+            .where(PermitAnalysis.permit_id == permit.id, PermitAnalysis.is_current == True)
+            .values(is_current=False)
+        )
+
+        analysis = PermitAnalysis(
+            tenant_id=permit.tenant_id,
+            permit_id=permit.id,
+            version=(last_version or 0) + 1,
+            is_current=True,
+            ai_version=ai_version,
+            analyzed_at=analyzed_at,
+            action_items=analysis_result.get("action_items", [])
+        )
+        analysis.set_result(analysis_result, settings.analysis_compression_min_bytes)
+        self.db.add(analysis)
+
+        permit.ai_version = ai_version
+        permit.analyzed_at = analyzed_at
+        permit.status = "reviewed"
+
+        await self.db.commit()
+        set_committed_value(permit, "current_analysis", analysis)
+
+    async def rollback(self):
+        """
+        Roll back and reload every instance still in the session (the permit,
+        the user merged by get_current_user, ...), since rollback expires them
+        and lazy loads are not allowed on an AsyncSession
+        """
+        instances = list(self.db.identity_map.values())
+        await self.db.rollback()
+        for instance in instances:
+            if instance in self.db:
+                await self.db.refresh(instance)
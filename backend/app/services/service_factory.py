@@ -3,8 +3,11 @@ Service Factory for Vector Services
 Provides automatic selection between optimized and standard vector services
 """
 from typing import Optional
+import threading
+
 from app.services.vector_service import VectorService
 from app.services.optimized_vector_service import OptimizedVectorService
+from app.config.settings import settings
 
 
 class VectorServiceFactory:
@@ -15,6 +18,8 @@ class VectorServiceFactory:
 
     _instance: Optional[object] = None
     _service_type: str = "unknown"
+    # The startup warm-up and the first requests may race to create the instance
+    _lock = threading.Lock()
 
     @classmethod
     def get_vector_service(cls):
@@ -24,7 +29,9 @@ class VectorServiceFactory:
         otherwise falls back to standard filtered service
         """
         if cls._instance is None:
-            cls._instance = cls._create_best_service()
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls._create_best_service()
 
         return cls._instance
 
@@ -32,6 +39,13 @@ class VectorServiceFactory:
     def _create_best_service(cls):
         """Create the best available vector service"""
 
+        # In-memory stand-in for load testing without Weaviate
+        if settings.vector_provider == "standin":
+            from app.services.standin_vector_service import create_standin_vector_service
+            cls._service_type = "standin"
+            print("[VectorServiceFactory] Using in-memory StandInVectorService")
+            return create_standin_vector_service()
+
         # Try optimized service first (native multi-tenancy)
         try:
             optimized_service = OptimizedVectorService()
@@ -74,11 +88,13 @@ class VectorServiceFactory:
             "performance_profile": {
                 "optimized_native_mt": "3-5x faster, stronger isolation",
                 "standard_filtered": "Standard performance, filter-based isolation",
+                "standin": "In-memory stand-in, configurable latency",
                 "none": "No vector search available"
             }.get(cls._service_type, "Unknown"),
             "security_level": {
                 "optimized_native_mt": "Enterprise (shard-based isolation)",
                 "standard_filtered": "Standard (filter-based isolation)",
+                "standin": "N/A (synthetic documents)",
                 "none": "N/A"
             }.get(cls._service_type, "Unknown")
         }
@@ -0,0 +1,276 @@
+"""
+Deterministic stand-in for the LLM provider (load testing without Gemini).
+
+Responses are canned JSON documents shaped like the ones each specialist
+prompt asks for, selected from the agent name ("Tu sei <name>, ...") or the
+caller. Latency, token counts and injected failures are drawn from a random
+generator seeded with (seed, prompt, occurrence of that prompt), so a run is
+reproducible regardless of how concurrent calls interleave. Occurrences are
+tracked for the max_prompts most recent distinct prompts; call reset() to
+restart the sequence between runs.
+"""
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+
+
+AGENT_NAME = re.compile(r"Tu sei (\S+), specialista")
+
+# Keywords the classifier stand-in looks for in the permit section of the prompt
+RISK_KEYWORDS = {
+    "hot_work": ["saldatura", "welding", "taglio", "molatura", "fiamma", "scintille"],
+    "confined_space": ["serbatoio", "tank", "silo", "cisterna", "pozzo", "spazio confinato"],
+    "electrical": ["elettric", "quadro", "cavo", "tensione", "cabina"],
+    "height": ["altezza", "tetto", "scala", "ponteggio", "piattaforma", "quota"],
+    "chemical": ["chimic", "solvente", "acido", "gas", "vapore", "atex"],
+    "mechanical": ["meccanic", "macchinario", "impianto", "pompa", "compressore", "motore"],
+}
+
+
+class StandInLLMError(Exception):
+    """Injected provider failure (HTTP 500 equivalent)"""
+
+
+class StandInRateLimitError(StandInLLMError):
+    """Injected quota failure (HTTP 429 equivalent)"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"429 Resource has been exhausted (stand-in), retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class UsageMetadata:
+    __slots__ = ("prompt_token_count", "candidates_token_count")
+
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+
+
+class StandInResponse:
+    """Same attributes the code reads from a Gemini response"""
+
+    def __init__(self, text: str, prompt_tokens: int, completion_tokens: int):
+        self.text = text
+        self.usage_metadata = UsageMetadata(prompt_tokens, completion_tokens)
+
+
+def _recommendations(rng: random.Random, topic: str, count: int) -> list:
+    criticality = ["alta", "media", "bassa"]
+    return [
+        {"action": f"Verificare {topic}: misura di controllo {i + 1}", "criticality": criticality[rng.randrange(3)]}
+        for i in range(count)
+    ]
+
+
+def _classifier_response(prompt: str, rng: random.Random) -> Dict[str, Any]:
+    permit_section = prompt.split("TIPO LAVORO DICHIARATO", 1)[0].lower()
+    risk_detection = {}
+    for risk_type, keywords in RISK_KEYWORDS.items():
+        evidence = [f"Parola chiave: {keyword}" for keyword in keywords if keyword in permit_section]
+        detected = bool(evidence)
+        risk_detection[risk_type] = {
+            "detected": detected,
+            "confidence": round(min(0.95, 0.75 + 0.05 * len(evidence)), 2) if detected else 0.1,
+            "evidence": evidence,
+            "reasoning": "Rilevato dal contenuto del permesso" if detected else "Nessuna evidenza",
+            "activation_recommended": detected,
+        }
+    detected_types = [risk_type for risk_type, data in risk_detection.items() if data["detected"]]
+    return {
+        "comprehensive_analysis": {
+            "main_activities_identified": ["Attività di manutenzione"],
+            "work_environment": "Stabilimento industriale",
+            "activity_complexity": "medium",
+            "work_type_consistency": "consistent",
+        },
+        "risk_detection": risk_detection,
+        "specialist_activation": {
+            "recommended_specialists": detected_types,
+            "activation_reasoning": "Stand-in: attivazione per parole chiave",
+            "total_specialists": len(detected_types),
+        },
+        "risk_combinations": (
+            [{"combination": detected_types[:2], "severity": "high", "description": "Combinazione di rischi"}]
+            if len(detected_types) > 1 else []
+        ),
+        "overall_assessment": {
+            "risk_level": ["LOW", "MEDIUM", "HIGH"][min(2, len(detected_types))],
+            "confidence_score": 0.8,
+            "analysis_complete": True,
+            "missing_information": [],
+        },
+    }
+
+
+def _specialist_response(agent: str, rng: random.Random) -> Dict[str, Any]:
+    count = rng.randint(3, 8)
+    risks = [
+        {"type": f"{agent.lower()}_risk", "description": f"Rischio {i + 1} ({agent})", "severity": "alto"}
+        for i in range(rng.randint(1, 4))
+    ]
+    if agent == "HotWork_Specialist":
+        return {
+            "hot_work_detected": True, "work_type": "saldatura", "risk_level": "alto",
+            "specific_risks": risks, "missing_controls": ["Fire Watch"],
+            "fire_prevention_measures": ["Estintore a portata di mano"],
+            "existing_actions_adequacy": "parziali",
+            "recommendations": _recommendations(rng, "lavori a caldo", count),
+        }
+    if agent == "HeightWork_Specialist":
+        return {
+            "height_work_detected": True, "risk_level": "alto", "specific_risks": risks,
+            "required_technical_systems": ["Linea vita"], "existing_actions_adequacy": "parziali",
+            "recommendations": _recommendations(rng, "lavori in quota", count),
+        }
+    if agent == "ConfinedSpace_Specialist":
+        return {
+            "confined_space_classification": "spazio confinato", "atmospheric_hazards": ["Carenza di ossigeno"],
+            "physical_hazards": ["Accesso limitato"], "safety_equipment": ["Rilevatore multigas"],
+            "recommendations": _recommendations(rng, "spazio confinato", count),
+        }
+    if agent == "Electrical_Specialist":
+        return {
+            "electrical_risks_detected": risks, "voltage_level": "BT",
+            "required_qualifications": ["PES/PAV"], "safety_procedures": ["Sezionamento e messa a terra"],
+            "gap_analysis": [], "intelligent_recommendations": _recommendations(rng, "rischio elettrico", count),
+            "electrical_context_for_dpi": {"voltage_level": "BT"},
+        }
+    if agent == "Chemical_Specialist":
+        return {
+            "chemical_substances_identified": ["Solvente"], "identified_risks": risks,
+            "atex_risk_assessment": {"atex_zone": "nessuna"}, "health_hazards": ["Inalazione"],
+            "risk_classification": "medio", "required_permits": [], "monitoring_requirements": [],
+            "emergency_procedures": [], "training_requirements": [], "existing_measures_evaluation": {},
+            "recommendations": _recommendations(rng, "rischio chimico", count),
+        }
+    if agent == "Mechanical_Specialist":
+        return {
+            "mechanical_risks": risks, "loto_required": True, "risk_level": "medio",
+            "existing_measures_adequacy": "parziali",
+            "intelligent_recommendations": _recommendations(rng, "rischio meccanico", count),
+        }
+    if agent == "DPI_Evaluator":
+        return {
+            "existing_dpi_adequacy": "parziali",
+            "missing_dpi": rng.sample(
+                ["Elmetto EN 397", "Guanti resistenti EN 388", "Occhiali protezione EN 166",
+                 "Scarpe antinfortunistiche S3", "Imbracatura EN 361", "Otoprotettori EN 352"],
+                rng.randint(1, 5)
+            ),
+            "required_training": ["Formazione DPI III categoria"],
+            "normative_compliance": ["D.Lgs 81/08 Titolo III"],
+        }
+    return {"recommendations": _recommendations(rng, "sicurezza", count)}
+
+
+def _fast_response(rng: random.Random) -> Dict[str, Any]:
+    actions = [
+        {
+            "id": f"ACT_{i + 1:03d}", "type": "risk_mitigation", "priority": ["alta", "media", "bassa"][rng.randrange(3)],
+            "suggested_action": f"Azione di sicurezza {i + 1}", "references": [],
+            "frontend_display": {"color": "orange", "icon": "alert-triangle", "category": "Sicurezza"},
+        }
+        for i in range(rng.randint(3, 8))
+    ]
+    return {
+        "executive_summary": {
+            "overall_score": 0.6, "critical_issues": 1, "recommendations": len(actions),
+            "compliance_level": "requires_action", "estimated_completion_time": "2 giorni",
+            "key_findings": ["Analisi stand-in"], "next_steps": ["Verificare le azioni"],
+        },
+        "action_items": actions,
+        "citations": {"normative_framework": [], "company_procedures": []},
+        "performance_metrics": {"analysis_depth": "fast", "agents_used": 0, "documents_analyzed": 0},
+        "analysis_complete": True,
+    }
+
+
+def canned_response(prompt: str, caller: str, rng: random.Random) -> str:
+    """
+    JSON body for the prompt type; the agent name in the prompt wins over caller
+    """
+    match = AGENT_NAME.search(prompt)
+    agent = match.group(1) if match else caller
+    if agent == "Unified_Risk_Classifier":
+        body = _classifier_response(prompt, rng)
+    elif agent == "FastAIOrchestrator" or '"executive_summary"' in prompt:
+        body = _fast_response(rng)
+    else:
+        body = _specialist_response(agent, rng)
+    return "```json\n" + json.dumps(body, ensure_ascii=False, indent=2) + "\n```"
+
+
+class StandInLLM:
+    """
+    Latency model:
+        fixed      every call takes latency_ms
+        uniform    between 0.5x and 1.5x latency_ms
+        lognormal  median latency_ms, spread sigma (long right tail, like real LLM APIs)
+    """
+
+    def __init__(
+        self,
+        latency: str = "lognormal",
+        latency_ms: float = 1500.0,
+        sigma: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 42,
+        max_prompts: int = 10000
+    ):
+        if latency not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {latency}")
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.seed = seed
+        self.max_prompts = max_prompts
+        # LRU of prompt digest -> occurrences, so long runs do not grow without bound
+        self._seen: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _rng(self, prompt: str) -> random.Random:
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+        with self._lock:
+            occurrence = self._seen.pop(digest, 0)
+            self._seen[digest] = occurrence + 1
+            if len(self._seen) > self.max_prompts:
+                self._seen.popitem(last=False)
+        return random.Random(f"{self.seed}:{digest}:{occurrence}")
+
+    def _draw_latency(self, rng: random.Random) -> float:
+        if self.latency == "fixed":
+            milliseconds = self.latency_ms
+        elif self.latency == "uniform":
+            milliseconds = rng.uniform(0.5 * self.latency_ms, 1.5 * self.latency_ms)
+        else:
+            milliseconds = self.latency_ms * math.exp(self.sigma * rng.gauss(0.0, 1.0))
+        return milliseconds / 1000
+
+    def plan(self, prompt: str, caller: str = "") -> Tuple[float, Optional[StandInLLMError], Optional[StandInResponse]]:
+        """
+        (delay seconds, injected error or None, response or None) for one call.
+        The caller sleeps the delay, then raises the error or returns the response.
+        """
+        rng = self._rng(prompt)
+        delay = self._draw_latency(rng)
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            # Quota errors come back fast
+            return delay * 0.05, StandInRateLimitError(retry_after=round(rng.uniform(1, 10), 1)), None
+        if roll < self.rate_limit_rate + self.error_rate:
+            return delay, StandInLLMError("500 Internal error (stand-in)"), None
+        text = canned_response(prompt, caller, rng)
+        return delay, None, StandInResponse(text, len(prompt) // 4, len(text) // 4)
+
+    def reset(self):
+        with self._lock:
+            self._seen.clear()
@@ -0,0 +1,149 @@
+"""
+In-memory stand-in for the Weaviate vector service (load testing without Weaviate).
+
+Each tenant gets a synthetic, seeded corpus of HSE document chunks; uploads
+are added to it. Searches score chunks by query term overlap and sleep a
+configurable latency, returning the same fields as VectorService.
+"""
+from typing import Any, Dict, List, Optional
+import asyncio
+import random
+import re
+import uuid
+
+from app.config.settings import settings
+from app.core.metrics import observe_vector_search
+
+
+TOPICS = [
+    ("procedura_sicurezza", "Procedura lavori a caldo", "saldatura taglio fiamma scintille estintore fire watch"),
+    ("procedura_sicurezza", "Procedura accesso spazi confinati", "serbatoio cisterna ossigeno rilevatore multigas recupero"),
+    ("istruzione_operativa", "Istruzione lavori elettrici", "quadro cavo tensione sezionamento messa a terra PES PAV"),
+    ("istruzione_operativa", "Istruzione lavori in quota", "ponteggio scala piattaforma imbracatura linea vita"),
+    ("manuale", "Manuale sostanze chimiche", "solvente acido vapore atex scheda sicurezza ventilazione"),
+    ("procedura", "Procedura LOTO macchinari", "macchinario pompa compressore motore blocco energia"),
+    ("normativa", "D.Lgs 81/08 estratto", "dpi valutazione rischi formazione sorveglianza"),
+]
+
+TOKEN = re.compile(r"\w+")
+
+
+class StandInVectorService:
+    """Drop-in replacement for VectorService / OptimizedVectorService"""
+
+    def __init__(self, documents_per_tenant: int, latency_ms: float, seed: int = 42):
+        self.documents_per_tenant = documents_per_tenant
+        self.latency_ms = latency_ms
+        self.seed = seed
+        self.client = True  # truthy like a connected client, for code checking it
+        self._corpora: Dict[int, List[Dict[str, Any]]] = {}
+
+    def _corpus(self, tenant_id: Optional[int]) -> List[Dict[str, Any]]:
+        tenant_id = tenant_id or 0
+        corpus = self._corpora.get(tenant_id)
+        if corpus is None:
+            rng = random.Random(f"{self.seed}:{tenant_id}")
+            corpus = []
+            for i in range(self.documents_per_tenant):
+                document_type, title, terms = TOPICS[i % len(TOPICS)]
+                words = terms.split()
+                content = " ".join(rng.choice(words) for _ in range(60))
+                corpus.append(self._chunk(
+                    f"SI-{tenant_id}-{i // 5:04d}", f"{title} {i // 5 + 1}", content,
+                    document_type, "sicurezza", "Stand-in", i % 5
+                ))
+            self._corpora[tenant_id] = corpus
+        return corpus
+
+    @staticmethod
+    def _chunk(document_code, title, content, document_type, category, authority, chunk_index) -> Dict[str, Any]:
+        return {
+            "document_code": document_code,
+            "title": title,
+            "content": content,
+            "document_type": document_type,
+            "category": category,
+            "authority": authority,
+            "section_title": f"Sezione {chunk_index + 1}",
+            "chunk_index": chunk_index,
+            "relevance_score": 0.5,
+            "terms": set(TOKEN.findall(f"{title} {content}".lower())),
+        }
+
+    async def _search(self, query: str, tenant_id: Optional[int], document_types: Optional[List[str]], limit: int) -> List[tuple]:
+        await asyncio.sleep(self.latency_ms / 1000)
+        query_terms = set(TOKEN.findall(query.lower()))
+        scored = []
+        for chunk in self._corpus(tenant_id):
+            if document_types and chunk["document_type"] not in document_types:
+                continue
+            overlap = len(query_terms & chunk["terms"])
+            if overlap:
+                scored.append((overlap / (len(query_terms) or 1), chunk))
+        scored.sort(key=lambda item: (-item[0], item[1]["document_code"], item[1]["chunk_index"]))
+        return scored[:limit]
+
+    @staticmethod
+    def _public(chunk: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in chunk.items() if key != "terms"}
+
+    @observe_vector_search("hybrid_search")
+    async def hybrid_search(self, query: str, filters: Dict[str, Any] = None, limit: int = 20, threshold: float = 0.0) -> List[Dict[str, Any]]:
+        filters = filters or {}
+        document_types = filters.get("document_type")
+        if isinstance(document_types, str):
+            document_types = [document_types]
+        results = await self._search(query, filters.get("tenant_id"), document_types, limit)
+        return [{**self._public(chunk), "search_score": score} for score, chunk in results if score >= threshold]
+
+    @observe_vector_search("semantic_search")
+    async def semantic_search(self, query: str, tenant_id: int, document_types: List[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        results = await self._search(query, tenant_id, document_types, limit)
+        return [{**self._public(chunk), "certainty": score, "distance": 1 - score} for score, chunk in results]
+
+    @observe_vector_search("semantic_search_by_document_code")
+    async def semantic_search_by_document_code(self, document_codes: List[str], query: str, tenant_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        results = await self._search(query, tenant_id, None, len(self._corpus(tenant_id)))
+        return [
+            {**self._public(chunk), "semantic_score": score, "semantic_distance": 1 - score, "source": "Weaviate_Semantic"}
+            for score, chunk in results if chunk["document_code"] in document_codes
+        ][:limit]
+
+    async def add_document_chunks(
+        self, document_id: int, document_code: str, title: str, chunks: List[Dict[str, Any]],
+        document_type: str, category: str, tenant_id: int, industry_sectors: List[str] = None,
+        authority: str = None, max_retries: int = 3
+    ) -> List[str]:
+        corpus = self._corpus(tenant_id)
+        for i, chunk in enumerate(chunks):
+            corpus.append(self._chunk(
+                document_code, title, chunk.get("content", ""), document_type, category,
+                authority, chunk.get("chunk_index", i)
+            ))
+        return [str(uuid.uuid4()) for _ in chunks]
+
+    async def add_single_document_chunk_fallback(
+        self, document_code: str, title: str, content: str, document_type: str, category: str,
+        tenant_id: int, industry_sectors: List[str] = None, authority: str = None
+    ) -> Optional[str]:
+        self._corpus(tenant_id).append(self._chunk(document_code, title, content, document_type, category, authority, 0))
+        return str(uuid.uuid4())
+
+    async def delete_document_chunks(self, document_code: str, tenant_id: int) -> bool:
+        corpus = self._corpus(tenant_id)
+        corpus[:] = [chunk for chunk in corpus if chunk["document_code"] != document_code]
+        return True
+
+    async def update_document_metadata(self, document_code: str, tenant_id: int, metadata: Dict[str, Any]) -> bool:
+        for chunk in self._corpus(tenant_id):
+            if chunk["document_code"] == document_code:
+                chunk.update({key: value for key, value in metadata.items() if key in chunk and key != "terms"})
+        return True
+
+
+def create_standin_vector_service() -> StandInVectorService:
+    return StandInVectorService(
+        documents_per_tenant=settings.vector_standin_documents,
+        latency_ms=settings.vector_standin_latency_ms,
+        seed=settings.llm_standin_seed
+    )
@@ -1,11 +1,14 @@
 from typing import Optional
 import os
-from minio import Minio
-from minio.error import S3Error
 from fastapi import UploadFile, HTTPException, status
 import uuid
 
 from app.config.settings import settings
+from app.core.lazy import lazy_import
+from app.core.tracing import traced
+
+minio = lazy_import("minio")
+minio_error = lazy_import("minio.error")
 
 
 class StorageService:
@@ -14,7 +17,7 @@ class StorageService:
     """
     
     def __init__(self):
-        self.client = Minio(
+        self.client = minio.Minio(
             settings.minio_endpoint,
             access_key=settings.minio_access_key,
             secret_key=settings.minio_secret_key,
@@ -31,9 +34,10 @@ class StorageService:
         try:
             if not self.client.bucket_exists(settings.minio_bucket_name):
                 self.client.make_bucket(settings.minio_bucket_name)
-        except S3Error as e:
+        except minio_error.S3Error as e:
             print(f"Error creating bucket: {e}")
     
+    @traced("minio.upload_file", attributes=("object_name",))
     async def upload_file(self, file: UploadFile, object_name: str = None) -> str:
         """
         Upload file to MinIO storage
@@ -60,7 +64,7 @@ class StorageService:
             
             return object_name
             
-        except S3Error as e:
+        except minio_error.S3Error as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to upload file: {str(e)}"
@@ -71,6 +75,7 @@ class StorageService:
                 detail=f"Unexpected error during upload: {str(e)}"
             )
     
+    @traced("minio.download_file", attributes=("object_name",))
     async def download_file(self, object_name: str) -> bytes:
         """
         Download file from MinIO storage
@@ -87,7 +92,7 @@ class StorageService:
             
             return data
             
-        except S3Error as e:
+        except minio_error.S3Error as e:
             if e.code == "NoSuchKey":
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -98,6 +103,7 @@ class StorageService:
                 detail=f"Failed to download file: {str(e)}"
             )
     
+    @traced("minio.delete_file", attributes=("object_name",))
     async def delete_file(self, object_name: str) -> bool:
         """
         Delete file from MinIO storage
@@ -109,7 +115,7 @@ class StorageService:
             )
             return True
             
-        except S3Error as e:
+        except minio_error.S3Error as e:
             print(f"Error deleting file {object_name}: {e}")
             return False
     
@@ -128,7 +134,7 @@ class StorageService:
             
             return url
             
-        except S3Error as e:
+        except minio_error.S3Error as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to generate file URL: {str(e)}"
@@ -156,7 +162,7 @@ class StorageService:
             
             return files
             
-        except S3Error as e:
+        except minio_error.S3Error as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to list files: {str(e)}"
@@ -1,8 +1,12 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+from collections import OrderedDict
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
+import asyncio
 import logging
+import threading
+import time
 
 from app.models.tenant import Tenant, DeploymentMode
 from app.config.database import SessionLocal
@@ -13,12 +17,24 @@ logger = logging.getLogger(__name__)
 
 class TenantDatabaseService:
     """
-    Service to manage database connections for different tenant deployment modes
+    Service to manage database connections for different tenant deployment modes.
+    
+    Dedicated-database engines are kept in an LRU cache of at most
+    tenant_engine_cache_size entries; engines evicted or idle for longer than
+    tenant_engine_idle_seconds are disposed, closing their pooled connections.
+    Idle engines are swept by a background task as well, so they are closed
+    even when dedicated-database traffic stops.
     """
     
-    def __init__(self):
-        self._tenant_engines: Dict[int, object] = {}
+    def __init__(self, max_engines: int, idle_seconds: int):
+        self.max_engines = max_engines
+        self.idle_seconds = idle_seconds
+        self._tenant_engines: "OrderedDict[int, object]" = OrderedDict()
         self._tenant_sessions: Dict[int, sessionmaker] = {}
+        self._last_used: Dict[int, float] = {}
+        self._last_idle_sweep = time.monotonic()
+        self._lock = threading.RLock()
+        self._sweep_task: Optional[asyncio.Task] = None
     
     def get_tenant_session(self, tenant: Tenant) -> sessionmaker:
         """
@@ -45,16 +61,24 @@ class TenantDatabaseService:
         """
         Get or create tenant-specific database session
         """
-        if tenant.id in self._tenant_sessions:
-            return self._tenant_sessions[tenant.id]
+        self._evict_idle_engines()
+        
+        with self._lock:
+            if tenant.id in self._tenant_sessions:
+                self._tenant_engines.move_to_end(tenant.id)
+                self._last_used[tenant.id] = time.monotonic()
+                return self._tenant_sessions[tenant.id]
         
         if not tenant.database_url:
             raise ValueError(f"Database URL not configured for tenant {tenant.id}")
         
         try:
-            # Create tenant-specific engine
+            # Pool sized per tenant (settings "db_pool_size" / "db_max_overflow")
+            tenant_settings = tenant.settings or {}
             engine = create_engine(
                 tenant.database_url,
+                pool_size=int(tenant_settings.get("db_pool_size", settings.tenant_db_pool_size)),
+                max_overflow=int(tenant_settings.get("db_max_overflow", settings.tenant_db_max_overflow)),
                 pool_pre_ping=True,
                 pool_recycle=300,
                 echo=settings.debug
@@ -67,9 +91,21 @@ class TenantDatabaseService:
                 bind=engine
             )
             
-            # Cache the session factory
-            self._tenant_engines[tenant.id] = engine
-            self._tenant_sessions[tenant.id] = session_factory
+            with self._lock:
+                if tenant.id in self._tenant_sessions:
+                    # Created concurrently by another thread: keep theirs
+                    engine.dispose()
+                    return self._tenant_sessions[tenant.id]
+                
+                # Cache the session factory
+                self._tenant_engines[tenant.id] = engine
+                self._tenant_sessions[tenant.id] = session_factory
+                self._last_used[tenant.id] = time.monotonic()
+                
+                # Evict the least recently used engines beyond the limit
+                while len(self._tenant_engines) > self.max_engines:
+                    evicted_id = next(iter(self._tenant_engines))
+                    self._dispose_engine(evicted_id, reason="LRU eviction")
             
             logger.info(f"Created database connection for tenant {tenant.id}")
             return session_factory
@@ -78,6 +114,68 @@ class TenantDatabaseService:
             logger.error(f"Failed to create database connection for tenant {tenant.id}: {e}")
             raise
     
+    def _evict_idle_engines(self):
+        """
+        Dispose engines not used for idle_seconds (checked at most once a minute)
+        """
+        now = time.monotonic()
+        if now - self._last_idle_sweep < 60:
+            return
+        with self._lock:
+            self._last_idle_sweep = now
+            for tenant_id in [tid for tid, last_used in self._last_used.items() if now - last_used > self.idle_seconds]:
+                self._dispose_engine(tenant_id, reason="idle")
+    
+    async def start(self):
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._run_idle_sweep(), name="tenant-engine-sweep")
+
+    async def stop(self):
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+    async def _run_idle_sweep(self):
+        while True:
+            await asyncio.sleep(60)
+            try:
+                # engine.dispose() closes sockets: keep it off the event loop
+                await asyncio.to_thread(self._evict_idle_engines)
+            except Exception as e:
+                logger.error(f"Tenant engine idle sweep failed: {e}")
+    
+    def _dispose_engine(self, tenant_id: int, reason: str):
+        # Checked-out connections are closed when their sessions return them
+        engine = self._tenant_engines.pop(tenant_id, None)
+        self._tenant_sessions.pop(tenant_id, None)
+        self._last_used.pop(tenant_id, None)
+        if engine is not None:
+            engine.dispose()
+            logger.info(f"Disposed database engine for tenant {tenant_id} ({reason})")
+    
+    def get_pool_metrics(self) -> List[dict]:
+        """
+        Connection pool usage per cached tenant engine
+        """
+        now = time.monotonic()
+        with self._lock:
+            metrics = []
+            for tenant_id, engine in self._tenant_engines.items():
+                pool = engine.pool
+                metrics.append({
+                    "tenant_id": tenant_id,
+                    "pool_size": pool.size(),
+                    "checked_out": pool.checkedout(),
+                    "checked_in": pool.checkedin(),
+                    "overflow": pool.overflow(),
+                    "idle_seconds": round(now - self._last_used.get(tenant_id, now), 1)
+                })
+            return metrics
+    
     @contextmanager
     def get_db_session(self, tenant: Tenant):
         """
@@ -119,7 +217,7 @@ class TenantDatabaseService:
             
             # Get tenant-specific engine
             session_factory = self._get_tenant_specific_session(tenant)
-            engine = self._tenant_engines[tenant.id]
+            engine = session_factory.kw["bind"]
             
             # Create all tables
             Base.metadata.create_all(bind=engine)
@@ -135,15 +233,17 @@ class TenantDatabaseService:
         """
         Clean up tenant-specific database connections
         """
-        if tenant_id in self._tenant_engines:
-            try:
-                self._tenant_engines[tenant_id].dispose()
-                del self._tenant_engines[tenant_id]
-                del self._tenant_sessions[tenant_id]
-                logger.info(f"Cleaned up database connection for tenant {tenant_id}")
-            except Exception as e:
-                logger.error(f"Error cleaning up tenant connection {tenant_id}: {e}")
+        with self._lock:
+            if tenant_id in self._tenant_engines:
+                try:
+                    self._dispose_engine(tenant_id, reason="cleanup")
+                    logger.info(f"Cleaned up database connection for tenant {tenant_id}")
+                except Exception as e:
+                    logger.error(f"Error cleaning up tenant connection {tenant_id}: {e}")
 
 
 # Global instance
-tenant_db_service = TenantDatabaseService()
\ No newline at end of file
+tenant_db_service = TenantDatabaseService(
+    max_engines=settings.tenant_engine_cache_size,
+    idle_seconds=settings.tenant_engine_idle_seconds
+)
\ No newline at end of file
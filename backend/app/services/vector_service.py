@@ -1,8 +1,11 @@
 from typing import List, Dict, Any, Optional
-import weaviate
 import json
 
 from app.config.settings import settings
+from app.core.lazy import lazy_import
+from app.core.metrics import observe_vector_search
+
+weaviate = lazy_import("weaviate")
 
 
 class VectorService:
@@ -394,6 +397,7 @@ class VectorService:
             print(f"[VectorService] Fallback sync error for {document_code}: {e}")
             return None
     
+    @observe_vector_search("hybrid_search")
     async def hybrid_search(
         self,
         query: str,
@@ -525,6 +529,7 @@ class VectorService:
             print(f"Error in hybrid search: {e}")
             return []
     
+    @observe_vector_search("semantic_search")
     async def semantic_search(
         self,
         query: str,
@@ -609,6 +614,7 @@ class VectorService:
             print(f"Error in semantic search: {e}")
             return []
 
+    @observe_vector_search("semantic_search_by_document_code")
     async def semantic_search_by_document_code(
         self,
         document_codes: List[str],
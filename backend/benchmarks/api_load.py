@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+"""
+End-to-end load test of the permit API with stubbed LLM and vector services.
+
+Closed-loop asyncio harness: for each scenario and each concurrency level,
+that many virtual users send requests back to back for --duration seconds.
+Reports throughput, p50/p95/p99 latency and error rate per level, marks the
+level where throughput stops growing (saturation), and writes the results as
+JSON under benchmarks/results/ for comparison between commits.
+
+Scenarios: login, list_permits, create_permit, analyze_fast, analyze_advanced,
+upload_document (needs MinIO).
+
+Against a running server (one uvicorn worker to measure a single worker):
+    AI_PROVIDER=standin VECTOR_PROVIDER=standin LLM_STANDIN_LATENCY_MS=1500 \\
+    RATE_LIMIT_PER_MINUTE=1000000 RATE_LIMIT_USER_PER_MINUTE=1000000 \\
+    RATE_LIMIT_TENANT_PER_MINUTE=1000000 uvicorn app.main:app --port 8000
+
+    python benchmarks/api_load.py --base-url http://localhost:8000 \\
+        --scenarios list_permits,analyze_advanced --concurrency 1,4,16,64 --duration 30
+
+In process (same stand-in defaults, no HTTP server; PostgreSQL and Redis still needed):
+    python benchmarks/api_load.py --in-process --scenarios analyze_advanced
+
+Regression check against a stored run (exit code 1 on regression):
+    python benchmarks/api_load.py ... --compare benchmarks/results/<baseline>.json --max-regression 0.15
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from itertools import count
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import httpx
+
+
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+
+PERMIT_TEMPLATES = [
+    ("Saldatura tubazione vapore", "Saldatura TIG su tubazione vapore in prossimità del serbatoio S-12", "manutenzione"),
+    ("Sostituzione interruttore quadro", "Sostituzione interruttore nel quadro elettrico MT, verifica tensione e cavi", "elettrico"),
+    ("Pulizia cisterna solventi", "Pulizia interna cisterna contenente residui di solvente, rischio vapori", "pulizia"),
+    ("Riparazione copertura capannone", "Riparazione lamiere della copertura a 8 metri di altezza con piattaforma", "edile"),
+    ("Manutenzione pompa centrifuga", "Sostituzione girante pompa P-001 e verifica tenute del compressore", "meccanico"),
+]
+
+UPLOAD_TEXT = (
+    "Art. 1 - Campo di applicazione\n"
+    "La presente istruzione operativa si applica ai lavori di manutenzione in aree con rischio di "
+    "esplosione, spazi confinati e lavori elettrici fuori tensione.\n"
+) * 200
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LoadContext:
+    """Credentials and fixtures shared by the virtual users"""
+
+    def __init__(self, username: str, password: str, tenant_domain: str):
+        self.login_body = {"username": username, "password": password, "tenant_domain": tenant_domain}
+        self.headers = {}
+        self.permit_ids = []
+        self._sequence = count()
+
+    def permit_id(self, user: int) -> int:
+        """The permit owned by virtual user number user"""
+        return self.permit_ids[user]
+
+    def permit_body(self) -> dict:
+        n = next(self._sequence)
+        title, description, work_type = PERMIT_TEMPLATES[n % len(PERMIT_TEMPLATES)]
+        return {
+            "title": f"{title} #{n}",
+            "description": description,
+            "work_type": work_type,
+            "location": "Stabilimento A",
+            "equipment": ["Attrezzatura standard"],
+            "risk_level": "medium",
+            "risk_mitigation_actions": ["Briefing di sicurezza"],
+        }
+
+
+async def scenario_login(client: httpx.AsyncClient, ctx: LoadContext, user: int):
+    return await client.post("/api/v1/auth/login", json=ctx.login_body)
+
+
+async def scenario_list_permits(client: httpx.AsyncClient, ctx: LoadContext, user: int):
+    return await client.get("/api/v1/permits/", params={"page_size": 20}, headers=ctx.headers)
+
+
+async def scenario_create_permit(client: httpx.AsyncClient, ctx: LoadContext, user: int):
+    return await client.post("/api/v1/permits/", json=ctx.permit_body(), headers=ctx.headers)
+
+
+async def scenario_analyze_fast(client: httpx.AsyncClient, ctx: LoadContext, user: int):
+    return await client.post(
+        f"/api/v1/permits/{ctx.permit_id(user)}/analyze",
+        json={"orchestrator": "fast", "force_reanalysis": True},
+        headers=ctx.headers
+    )
+
+
+async def scenario_analyze_advanced(client: httpx.AsyncClient, ctx: LoadContext, user: int):
+    return await client.post(
+        f"/api/v1/permits/{ctx.permit_id(user)}/analyze",
+        json={"orchestrator": "advanced", "force_reanalysis": True},
+        headers=ctx.headers
+    )
+
+
+async def scenario_upload_document(client: httpx.AsyncClient, ctx: LoadContext, user: int):
+    n = next(ctx._sequence)
+    return await client.post(
+        "/api/v1/documents/upload",
+        data={"title": f"Istruzione operativa carico {n}", "document_type": "istruzione_operativa", "force_reload": "true"},
+        files={"file": (f"istruzione_{n}.txt", f"{n}\n{UPLOAD_TEXT}".encode("utf-8"), "text/plain")},
+        headers=ctx.headers
+    )
+
+
+SCENARIOS = {
+    "login": scenario_login,
+    "list_permits": scenario_list_permits,
+    "create_permit": scenario_create_permit,
+    "analyze_fast": scenario_analyze_fast,
+    "analyze_advanced": scenario_analyze_advanced,
+    "upload_document": scenario_upload_document,
+}
+
+
+async def prepare(client: httpx.AsyncClient, ctx: LoadContext, scenarios, max_concurrency: int):
+    response = await client.post("/api/v1/auth/login", json=ctx.login_body)
+    response.raise_for_status()
+    ctx.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    # One permit per virtual user, so concurrent analyses never share a permit
+    if any(name.startswith("analyze") for name in scenarios):
+        for _ in range(max_concurrency):
+            created = await client.post("/api/v1/permits/", json=ctx.permit_body(), headers=ctx.headers)
+            created.raise_for_status()
+            ctx.permit_ids.append(created.json()["id"])
+
+
+async def run_level(client: httpx.AsyncClient, ctx: LoadContext, scenario, concurrency: int, duration: float) -> dict:
+    latencies = []
+    statuses = {}
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def virtual_user(user: int):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await scenario(client, ctx, user)
+                status = str(response.status_code)
+                failed = response.status_code >= 400
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+                failed = True
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+            errors += failed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(virtual_user(user) for user in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    total = len(latencies)
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50), 1) if total else None,
+        "p95_ms": round(percentile(latencies, 95), 1) if total else None,
+        "p99_ms": round(percentile(latencies, 99), 1) if total else None,
+        "max_ms": round(max(latencies), 1) if total else None,
+        "error_rate": round(errors / total, 4) if total else None,
+        "statuses": statuses,
+    }
+
+
+def saturation_level(levels) -> int:
+    """
+    Lowest concurrency after which adding users raises throughput by less than 10%
+    """
+    for previous, current in zip(levels, levels[1:]):
+        if current["throughput_rps"] < previous["throughput_rps"] * 1.1:
+            return previous["concurrency"]
+    return levels[-1]["concurrency"]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline_path: str, max_regression: float) -> bool:
+    """
+    Print p95 / throughput deltas per scenario and level; False on regression
+    """
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+
+    ok = True
+    print(f"\nComparison with {baseline.get('commit')} ({os.path.basename(baseline_path)}):")
+    for name, scenario in results["scenarios"].items():
+        previous_levels = {level["concurrency"]: level for level in baseline["scenarios"].get(name, {}).get("levels", [])}
+        for level in scenario["levels"]:
+            previous = previous_levels.get(level["concurrency"])
+            if not previous or not previous["p95_ms"] or not level["p95_ms"]:
+                continue
+            p95_change = level["p95_ms"] / previous["p95_ms"] - 1
+            rps_change = level["throughput_rps"] / previous["throughput_rps"] - 1 if previous["throughput_rps"] else 0.0
+            regressed = p95_change > max_regression or rps_change < -max_regression
+            ok = ok and not regressed
+            print(
+                f"  {name:18s} c={level['concurrency']:<4d} p95 {p95_change:+7.1%}  "
+                f"throughput {rps_change:+7.1%}{'  REGRESSION' if regressed else ''}"
+            )
+    return ok
+
+
+def reset_standin(args):
+    """
+    Restart the in-process LLM stand-in's seeded sequence, so each level draws
+    the same latencies as a fresh server (a remote server keeps its own)
+    """
+    if not args.in_process:
+        return
+    from app.services.llm_provider import StandInLLMProvider, get_llm_provider
+    provider = get_llm_provider()
+    if isinstance(provider, StandInLLMProvider):
+        provider.engine.reset()
+
+
+@asynccontextmanager
+async def open_client(args):
+    if not args.in_process:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            yield client
+        return
+
+    # Stand-ins unless the environment says otherwise
+    os.environ.setdefault("AI_PROVIDER", "standin")
+    os.environ.setdefault("VECTOR_PROVIDER", "standin")
+    for limit in ("RATE_LIMIT_PER_MINUTE", "RATE_LIMIT_USER_PER_MINUTE", "RATE_LIMIT_TENANT_PER_MINUTE"):
+        os.environ.setdefault(limit, "1000000")
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=args.timeout) as client:
+            yield client
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--in-process", action="store_true", help="Drive app.main:app through ASGITransport")
+    parser.add_argument("--scenarios", default="login,list_permits,create_permit,analyze_fast,analyze_advanced")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated virtual user counts")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per scenario and level")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="Admin123!")
+    parser.add_argument("--tenant-domain", default="demo.hse-system.com")
+    parser.add_argument("--output", help="Results file (default benchmarks/results/api_load-<commit>-<time>.json)")
+    parser.add_argument("--compare", help="Baseline results file")
+    parser.add_argument("--max-regression", type=float, default=0.15, help="Allowed p95 increase / throughput drop")
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {unknown} (available: {', '.join(SCENARIOS)})")
+    levels = [int(value) for value in args.concurrency.split(",")]
+
+    ctx = LoadContext(args.username, args.password, args.tenant_domain)
+    results = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "target": "in-process" if args.in_process else args.base_url,
+        "duration_per_level": args.duration,
+        "scenarios": {},
+    }
+
+    async with open_client(args) as client:
+        await prepare(client, ctx, scenarios, max(levels))
+        for name in scenarios:
+            print(f"\n{name}")
+            scenario_levels = []
+            for concurrency in levels:
+                reset_standin(args)
+                level = await run_level(client, ctx, SCENARIOS[name], concurrency, args.duration)
+                scenario_levels.append(level)
+                print(
+                    f"  c={concurrency:<4d} {level['throughput_rps']:8.2f} req/s  p50 {level['p50_ms']} ms  "
+                    f"p95 {level['p95_ms']} ms  p99 {level['p99_ms']} ms  errors {level['error_rate']:.2%}  {level['statuses']}"
+                )
+            saturation = saturation_level(scenario_levels)
+            print(f"  saturates at ~{saturation} concurrent users")
+            results["scenarios"][name] = {"levels": scenario_levels, "saturation_concurrency": saturation}
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"api_load-{results['commit']}-{datetime.utcnow():%Y%m%dT%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
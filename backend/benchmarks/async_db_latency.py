@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Benchmark: latency of cheap endpoints while slow queries are in flight.
+
+Compares the sync SessionLocal path (threadpool-bound) with the async
+AsyncSessionLocal path. Requires a reachable PostgreSQL (DATABASE_URL).
+
+Usage:
+    python benchmarks/async_db_latency.py --slow 40 --cheap 400 --sleep 0.5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from app.config.database import SessionLocal, AsyncSessionLocal
+
+
+def build_app(sleep_seconds: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync/slow")
+    def sync_slow():
+        db = SessionLocal()
+        try:
+            db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep_seconds})
+        finally:
+            db.close()
+        return {"ok": True}
+
+    @app.get("/sync/cheap")
+    def sync_cheap():
+        db = SessionLocal()
+        try:
+            db.execute(text("SELECT 1"))
+        finally:
+            db.close()
+        return {"ok": True}
+
+    @app.get("/async/slow")
+    async def async_slow():
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT pg_sleep(:s)"), {"s": sleep_seconds})
+        return {"ok": True}
+
+    @app.get("/async/cheap")
+    async def async_cheap():
+        async with AsyncSessionLocal() as db:
+            await db.execute(text("SELECT 1"))
+        return {"ok": True}
+
+    return app
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, mode: str, slow: int, cheap: int):
+    latencies = []
+
+    async def timed_cheap():
+        start = time.perf_counter()
+        response = await client.get(f"/{mode}/cheap")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    slow_tasks = [asyncio.create_task(client.get(f"/{mode}/slow")) for _ in range(slow)]
+    await asyncio.sleep(0.05)  # Let slow queries occupy connections first
+    await asyncio.gather(*(timed_cheap() for _ in range(cheap)))
+    await asyncio.gather(*slow_tasks)
+
+    print(
+        f"{mode:>5}: n={len(latencies)} "
+        f"p50={percentile(latencies, 50):.1f}ms "
+        f"p95={percentile(latencies, 95):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms "
+        f"mean={statistics.mean(latencies):.1f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slow", type=int, default=40, help="Concurrent slow queries")
+    parser.add_argument("--cheap", type=int, default=400, help="Cheap requests measured")
+    parser.add_argument("--sleep", type=float, default=0.5, help="pg_sleep seconds per slow query")
+    args = parser.parse_args()
+
+    app = build_app(args.sleep)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        for mode in ("sync", "async"):
+            await run_scenario(client, mode, args.slow, args.cheap)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
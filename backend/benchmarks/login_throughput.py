@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Load scenario: a burst of logins at shift start while other traffic keeps flowing.
+
+Fires --logins concurrent login requests against a minimal app that verifies
+a bcrypt hash (the configured work factor) either inline on the event loop
+(previous behaviour) or through app.core.security.verify_password_async,
+while a probe requests /health every 10ms. Reports login throughput and the
+p50/p99/max latency of the probe during the burst. No database needed.
+
+Usage:
+    python benchmarks/login_throughput.py --logins 100 --rounds 12
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from passlib.hash import bcrypt
+
+from app.core.security import pwd_context, verify_password_async
+
+
+def build_app(password_hash: str, off_loop: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/auth/login")
+    async def login():
+        if off_loop:
+            valid = await verify_password_async("Password123!", password_hash)
+        else:
+            valid = pwd_context.verify("Password123!", password_hash)
+        return {"valid": valid}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+async def measure(app: FastAPI, logins: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        probe_latencies = []
+        done = asyncio.Event()
+
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                probe_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        async def login():
+            response = await client.post("/api/v1/auth/login")
+            assert response.json()["valid"]
+
+        probe_task = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe_task
+
+    probe_latencies.sort()
+    return {
+        "logins_per_second": logins / elapsed,
+        "probe_p50_ms": statistics.median(probe_latencies) * 1000,
+        "probe_p99_ms": probe_latencies[min(len(probe_latencies) - 1, int(len(probe_latencies) * 0.99))] * 1000,
+        "probe_max_ms": probe_latencies[-1] * 1000,
+        "probes": len(probe_latencies),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt work factor of the stored hash")
+    args = parser.parse_args()
+
+    password_hash = bcrypt.using(rounds=args.rounds).hash("Password123!")
+
+    for label, off_loop in (("inline bcrypt", False), ("bcrypt executor", True)):
+        result = await measure(build_app(password_hash, off_loop), args.logins)
+        print(
+            f"{label:16s} {result['logins_per_second']:7.1f} logins/s | "
+            f"/health p50 {result['probe_p50_ms']:7.1f} ms  p99 {result['probe_p99_ms']:7.1f} ms  "
+            f"max {result['probe_max_ms']:7.1f} ms  ({result['probes']} probes)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
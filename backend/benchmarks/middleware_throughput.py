@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Benchmark: req/s on /api/v1/permits/ through three middleware layers.
+
+Compares three pass-through BaseHTTPMiddleware layers (the previous stack
+layout) with three pass-through pure ASGI layers (app.middleware.base), so
+the number reflects the per-layer overhead only. No external services needed.
+
+Usage:
+    python benchmarks/middleware_throughput.py --requests 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.base import ASGIMiddleware
+
+
+class PassThroughHTTPMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+class PassThroughASGIMiddleware(ASGIMiddleware):
+    async def handle(self, request, scope, receive, send):
+        await self.app(scope, receive, send)
+
+
+def build_app(middleware_class) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/permits/")
+    async def list_permits():
+        return {"permits": [], "total_count": 0}
+
+    for _ in range(3):
+        app.add_middleware(middleware_class)
+    return app
+
+
+async def measure(app: FastAPI, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one():
+            async with semaphore:
+                response = await client.get("/api/v1/permits/")
+                response.raise_for_status()
+
+        # Warm-up
+        await asyncio.gather(*(one() for _ in range(min(200, total))))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return total / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    before = await measure(build_app(PassThroughHTTPMiddleware), args.requests, args.concurrency)
+    after = await measure(build_app(PassThroughASGIMiddleware), args.requests, args.concurrency)
+
+    print(f"BaseHTTPMiddleware x3: {before:8.0f} req/s")
+    print(f"Pure ASGI x3:          {after:8.0f} req/s  ({after / before:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
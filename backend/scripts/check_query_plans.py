@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+"""
+Query plan regression checks for the tenant-scoped hot queries.
+
+Runs EXPLAIN (FORMAT JSON) for the queries the routers issue and fails if the
+planner cannot use the expected index. Sequential scans are disabled for the
+check so the result does not depend on table size.
+
+Usage:
+    python scripts/check_query_plans.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.config.database import SessionLocal
+
+
+PLAN_CHECKS = [
+    (
+        "document list",
+        "ix_documents_tenant_active_created",
+        """
+        SELECT id FROM documents
+        WHERE tenant_id = 1 AND is_active = true
+        ORDER BY created_at DESC, id DESC
+        LIMIT 50
+        """,
+    ),
+    (
+        "audit log list",
+        "ix_audit_logs_tenant_created_id",
+        """
+        SELECT id FROM audit_logs
+        WHERE tenant_id = 1 AND (created_at, id) < ('2025-01-01', 1000)
+        ORDER BY created_at DESC, id DESC
+        LIMIT 50
+        """,
+    ),
+    (
+        "document dedup by hash",
+        "ix_documents_tenant_file_hash_active",
+        """
+        SELECT id FROM documents
+        WHERE tenant_id = 1 AND file_hash = 'deadbeef' AND is_active = true
+        LIMIT 1
+        """,
+    ),
+    (
+        "document keyword enrichment",
+        "_tenant_document_version_uc",
+        """
+        SELECT document_code, keywords FROM documents
+        WHERE tenant_id = 1 AND document_code IN ('A', 'B') AND is_active = true
+        """,
+    ),
+    (
+        "tenant permit list (admin)",
+        "ix_work_permits_tenant_created_id",
+        """
+        SELECT id FROM work_permits
+        WHERE tenant_id = 1 AND (created_at, id) < ('2025-01-01', 1000)
+        ORDER BY created_at DESC, id DESC
+        LIMIT 20
+        """,
+    ),
+    (
+        "own permit list",
+        "ix_work_permits_tenant_creator_created",
+        """
+        SELECT id FROM work_permits
+        WHERE tenant_id = 1 AND created_by = 1
+        ORDER BY created_at DESC
+        LIMIT 20
+        """,
+    ),
+    (
+        "historical permits",
+        "ix_work_permits_tenant_type_status",
+        """
+        SELECT id FROM work_permits
+        WHERE tenant_id = 1 AND work_type = 'scavo' AND id != 1
+          AND status IN ('completed', 'approved')
+        LIMIT 5
+        """,
+    ),
+    (
+        "audit log month range by action",
+        "ix_audit_logs_tenant_action_created",
+        """
+        SELECT id FROM audit_logs
+        WHERE tenant_id = 1 AND action = 'LOGIN'
+          AND created_at >= date_trunc('month', NOW()) AND created_at < NOW()
+        ORDER BY created_at DESC
+        LIMIT 50
+        """,
+    ),
+]
+
+
+def collect_index_names(node, names):
+    if "Index Name" in node:
+        names.add(node["Index Name"])
+    for child in node.get("Plans", []):
+        collect_index_names(child, names)
+    return names
+
+
+def partition_index_names(db, index_name):
+    """Indexes of a partitioned table show up in plans under per-partition names"""
+    result = db.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :index_name
+    """), {"index_name": index_name})
+    return {index_name} | {row[0] for row in result}
+
+
+def main() -> int:
+    db = SessionLocal()
+    failures = 0
+    try:
+        db.execute(text("SET enable_seqscan = off"))
+        for label, expected_index, sql in PLAN_CHECKS:
+            plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+            used = collect_index_names(plan[0]["Plan"], set())
+            if partition_index_names(db, expected_index) & used:
+                print(f"OK   {label}: {expected_index}")
+            else:
+                failures += 1
+                print(f"FAIL {label}: expected {expected_index}, plan used {sorted(used) or 'no index'}")
+    finally:
+        db.rollback()
+        db.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
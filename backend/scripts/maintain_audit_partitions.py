@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Create the upcoming audit_logs partitions and drop the ones past retention.
+
+The API runs the same maintenance in the background every
+audit_partition_maintenance_interval_hours; this script is for cron or for
+running it by hand after changing a tenant's audit_retention_days.
+
+Usage:
+    python scripts/maintain_audit_partitions.py [--dry-run]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config.database import AsyncSessionLocal
+from app.services.audit_partition_service import audit_partition_service, PARTITION_NAME
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Only list partitions and the retention in force")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        async with AsyncSessionLocal() as db:
+            partitions = await audit_partition_service.list_partitions(db)
+            retention_days = await audit_partition_service.get_retention_days(db)
+        print(f"Retention: {retention_days} days")
+        for name in partitions:
+            print(f"  {name}" + ("" if PARTITION_NAME.match(name) else "  (not managed)"))
+        return
+
+    result = await audit_partition_service.run_maintenance()
+    print(f"Retention: {result['retention_days']} days")
+    print(f"Created: {', '.join(result['created']) or '-'}")
+    print(f"Dropped: {', '.join(result['dropped']) or '-'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
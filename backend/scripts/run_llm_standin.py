@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Local stand-in LLM server for load tests: canned JSON per specialist prompt,
+seeded latency distribution, optional 500/429 injection.
+
+Point the backend at it with:
+    AI_PROVIDER=standin LLM_STANDIN_URL=http://127.0.0.1:8099
+
+Usage:
+    python scripts/run_llm_standin.py --latency lognormal --latency-ms 1500 \\
+        --sigma 0.6 --error-rate 0.01 --rate-limit-rate 0.02 --port 8099
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.services.standin_llm import StandInLLM, StandInRateLimitError
+
+
+class GenerateRequest(BaseModel):
+    prompt: str
+    caller: str = ""
+
+
+def build_app(engine: StandInLLM) -> FastAPI:
+    app = FastAPI(title="LLM stand-in")
+
+    @app.post("/generate")
+    async def generate(request: GenerateRequest):
+        delay, error, response = engine.plan(request.prompt, request.caller)
+        await asyncio.sleep(delay)
+        if isinstance(error, StandInRateLimitError):
+            return JSONResponse(
+                status_code=429,
+                content={"detail": str(error)},
+                headers={"Retry-After": str(error.retry_after)}
+            )
+        if error is not None:
+            return JSONResponse(status_code=500, content={"detail": str(error)})
+        return {
+            "text": response.text,
+            "usage": {
+                "prompt_tokens": response.usage_metadata.prompt_token_count,
+                "completion_tokens": response.usage_metadata.candidates_token_count
+            }
+        }
+
+    @app.post("/reset")
+    async def reset():
+        """Restart the seeded sequence (same results as a fresh server)"""
+        engine.reset()
+        return {"status": "reset"}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=1500.0)
+    parser.add_argument("--sigma", type=float, default=0.5, help="lognormal spread")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    args = parser.parse_args()
+
+    engine = StandInLLM(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        sigma=args.sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed
+    )
+    uvicorn.run(build_app(engine), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,13 @@
 import pytest
 import asyncio
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.config.database import Base, get_db
+from app.config.database import Base, get_db, get_async_db
 from app.models import *  # Import all models
 from app.core.security import get_password_hash
 
@@ -22,6 +23,16 @@ engine = create_engine(
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    "sqlite+aiosqlite:///./test.db",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 
 def override_get_db():
     """Override database dependency for testing"""
@@ -32,8 +43,15 @@ def override_get_db():
         db.close()
 
 
-# Override the dependency
+async def override_get_async_db():
+    """Override async database dependency for testing"""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
+# Override the dependencies
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 
 @pytest.fixture(scope="session")
@@ -215,6 +233,26 @@ def mock_vector_service():
     return MockVectorService()
 
 
+@pytest.fixture
+def standin_llm():
+    """Deterministic in-process LLM provider (zero latency) installed as the global provider"""
+    from app.services.llm_provider import StandInLLMProvider, set_llm_provider
+    from app.services.standin_llm import StandInLLM
+
+    provider = StandInLLMProvider(StandInLLM(latency="fixed", latency_ms=0))
+    set_llm_provider(provider)
+    yield provider
+    set_llm_provider(None)
+
+
+@pytest.fixture
+def standin_vector_service():
+    """In-memory vector service with a small synthetic corpus"""
+    from app.services.standin_vector_service import StandInVectorService
+
+    return StandInVectorService(documents_per_tenant=20, latency_ms=0)
+
+
 @pytest.fixture
 def mock_storage_service():
     """Mock storage service for testing"""
@@ -0,0 +1,27 @@
+import pytest
+
+from app.services.permit_analysis_uow import PermitAnalysisUnitOfWork
+
+
+@pytest.mark.integration
+def test_analysis_completes_when_context_loading_fails(
+    client, auth_headers, sample_work_permit, standin_llm, standin_vector_service, monkeypatch
+):
+    """
+    A failed PostgreSQL context load rolls the session back and the analysis
+    continues with an empty context (current_user is expired by the rollback)
+    """
+    async def failing_load_context(self, permit, limit=5):
+        raise RuntimeError("context query failed")
+
+    monkeypatch.setattr(PermitAnalysisUnitOfWork, "load_context", failing_load_context)
+    monkeypatch.setattr("app.routers.permits.get_vector_service", lambda: standin_vector_service)
+
+    response = client.post(
+        f"/api/v1/permits/{sample_work_permit.id}/analyze",
+        json={"orchestrator": "fast", "force_reanalysis": True},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["permit_id"] == sample_work_permit.id